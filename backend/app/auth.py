@@ -4,6 +4,7 @@ This module provides functions for creating and validating JWT tokens used for
 authentication and secure storage of Jira configuration references.
 """
 
+import hashlib
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
@@ -16,6 +17,7 @@ from .config import Settings, get_settings
 from .database import get_session
 from .logger import get_logger
 from .models import JiraConfiguration
+from .schemas import JiraCredentials
 
 # Create module-level logger
 logger = get_logger(__name__)
@@ -49,6 +51,19 @@ def create_access_token(data: Dict, settings: Settings = Depends(get_settings))
     return encoded_jwt
 
 
+def credentials_digest(credentials: JiraCredentials) -> bytes:
+    """Hash Jira credentials so they can be remembered without keeping the API token.
+
+    Args:
+        credentials: The Jira credentials.
+
+    Returns:
+        bytes: A digest identifying the server, email and API token.
+    """
+    key = f'{credentials.jira_server}|{credentials.jira_email}|{credentials.jira_api_token}'
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
 def decode_token(token: str, settings: Settings = Depends(get_settings)) -> Dict:
     """Decode and validate a JWT token.
 
@@ -66,7 +81,7 @@ def decode_token(token: str, settings: Settings = Depends(get_settings)) -> Dict
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
         return payload
     except JWTError as e:
-        logger.error(f'JWT validation error: {str(e)}')
+        logger.error('JWT validation error: %s', e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='Invalid authentication credentials',
@@ -153,7 +168,7 @@ async def get_jira_config_from_token(
     config = result.scalar_one_or_none()
 
     if not config:
-        logger.error(f'Configuration not found: {config_name}')
+        logger.error('Configuration not found: %s', config_name)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Configuration '{config_name}' not found",
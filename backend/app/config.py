@@ -48,6 +48,12 @@ class Settings(BaseSettings):
     jwt_algorithm: str = 'HS256'
     jwt_expiration_minutes: int = 60 * 24  # 24 hours
 
+    # Jira Client Configuration
+    # Blocking Jira calls run in worker threads; limit how many run at once and how long
+    # a request waits for a free slot before failing
+    jira_max_concurrent_calls: int = 20
+    jira_call_wait_seconds: float = 5.0
+
     # Default workflow states for metrics calculations
     # These are used as fallbacks if not specified in the database configuration
     workflow_states: List[str] = ['Backlog', 'In Progress', 'Done']
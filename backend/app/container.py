@@ -13,7 +13,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .config import get_settings
 from .database import async_session
 from .repositories.configuration_repository import ConfigurationRepository
-from .repositories.jira_client_repository import JiraClientRepository
 from .services.configuration_service import ConfigurationService
 from .services.jira_client_factory import JiraClientFactory
 from .services.jira_client_service import JiraClientService
@@ -54,27 +53,20 @@ class Container(containers.DeclarativeContainer):
     session_provider = providers.Dependency(AsyncSession)
 
     # Repositories
-    jira_client_repository = providers.Factory(
-        JiraClientRepository,
-        session=session_provider,
-    )
-
     configuration_repository = providers.Factory(
         ConfigurationRepository,
         session=session_provider,
     )
 
     # Services
-    jira_client_factory = providers.Factory(
-        JiraClientFactory,
-        session=session_provider,
-    )
+    # The Jira client factory keeps no per-request state, so one instance serves every request
+    jira_client_factory = providers.Singleton(JiraClientFactory)
 
     jira_client_service = providers.Factory(
         JiraClientService,
         session=session_provider,
         jira_client_factory=jira_client_factory,
-        repository=jira_client_repository,
+        repository=configuration_repository,
     )
 
     configuration_service = providers.Factory(
@@ -19,7 +19,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from .db_config import get_database_url
+from .db_config import get_database_url, get_engine_options
 from .logger import get_logger
 from .models import Base
 
@@ -42,7 +42,7 @@ else:
     logger.info(f'Using {db_type} database at {db_host}, database name: {db_name}')
 
 # Set echo=False in production to reduce log noise
-engine = create_async_engine(DATABASE_URL, echo=False)
+engine = create_async_engine(DATABASE_URL, echo=False, **get_engine_options(DATABASE_URL))
 async_session = async_sessionmaker(bind=engine, expire_on_commit=False)
 logger.debug('Database engine and session factory created')
 
@@ -5,6 +5,7 @@ application settings to avoid circular dependencies.
 """
 
 import os
+from typing import Any, Dict
 
 
 def get_database_url() -> str:
@@ -32,3 +33,29 @@ def get_database_url() -> str:
     # Default to PostgreSQL with psycopg (v3) driver
     # Use psycopg_async for async operations
     return f'postgresql+psycopg_async://{postgres_user}:{postgres_password}@{postgres_host}:{postgres_port}/{postgres_db}'
+
+
+def get_engine_options(database_url: str) -> Dict[str, Any]:
+    """Return the connection pool options for the database engine.
+
+    PostgreSQL connections are pooled with settings that can be tuned through
+    environment variables. Connections are checked before use and recycled
+    periodically so connections dropped by the server never reach a request.
+    SQLite keeps SQLAlchemy's default pool, which does not accept these options.
+
+    Args:
+        database_url: The database URL the engine is created for.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for create_async_engine.
+    """
+    if database_url.startswith('sqlite'):
+        return {}
+
+    return {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '10')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '20')),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', '30')),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+        'pool_pre_ping': True,
+    }
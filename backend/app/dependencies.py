@@ -11,13 +11,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from .container import Container, container
 from .repositories.configuration_repository import ConfigurationRepository
-from .repositories.jira_client_repository import JiraClientRepository
 from .services.configuration_service import ConfigurationService
 from .services.jira_client_factory import JiraClientFactory
 from .services.jira_client_service import JiraClientService
 
 
-def get_container(request: Request) -> Container:
+# Dependencies that do no blocking work are async, so FastAPI resolves them on the event loop
+# instead of dispatching each one to a worker thread
+async def get_container(request: Request) -> Container:
     """Get the dependency injection container.
 
     This function is used as a FastAPI dependency to provide access to the
@@ -34,7 +35,7 @@ def get_container(request: Request) -> Container:
 
 # Define common dependency types
 # Use a function with Depends() instead of a type annotation to avoid Pydantic validation issues
-def get_container_dep(container: Container = Depends(get_container)) -> Container:
+async def get_container_dep(container: Container = Depends(get_container)) -> Container:
     """Get the container dependency.
 
     This is a wrapper around get_container to avoid Pydantic validation issues.
@@ -94,20 +95,19 @@ async def get_jira_client_service(
 
 
 async def get_jira_client_factory(
-    session: AsyncSession = Depends(get_db_session),
     container_dep: Optional[Container] = Depends(get_container_dep),
 ) -> JiraClientFactory:
-    """Get a Jira client factory instance.
+    """Get the Jira client factory.
 
-    This function is used as a FastAPI dependency to provide a JiraClientFactory
-    instance to route handlers.
+    This function is used as a FastAPI dependency to provide the JiraClientFactory
+    to route handlers. The factory is shared by all requests, so no database
+    session is opened for it.
 
     Args:
-        session: The database session.
         container_dep: The dependency injection container from FastAPI dependency.
 
     Returns:
-        JiraClientFactory: A JiraClientFactory instance.
+        JiraClientFactory: The shared JiraClientFactory instance.
     """
     # If container is provided through dependency injection, use it
     # Otherwise, fall back to the global container
@@ -116,9 +116,6 @@ async def get_jira_client_factory(
     else:
         container_instance = container
 
-    # Override the session provider with the current session
-    container_instance.session_provider.override(session)
-
     return container_instance.jira_client_factory()
 
 
@@ -178,32 +175,3 @@ async def get_configuration_repository(
     container_instance.session_provider.override(session)
 
     return container_instance.configuration_repository()
-
-
-async def get_jira_client_repository(
-    session: AsyncSession = Depends(get_db_session),
-    container_dep: Optional[Container] = Depends(get_container_dep),
-) -> JiraClientRepository:
-    """Get a Jira client repository instance.
-
-    This function is used as a FastAPI dependency to provide a JiraClientRepository
-    instance to route handlers.
-
-    Args:
-        session: The database session.
-        container_dep: The dependency injection container from FastAPI dependency.
-
-    Returns:
-        JiraClientRepository: A JiraClientRepository instance.
-    """
-    # If container is provided through dependency injection, use it
-    # Otherwise, fall back to the global container
-    if container_dep:
-        container_instance = container_dep
-    else:
-        container_instance = container
-
-    # Override the session provider with the current session
-    container_instance.session_provider.override(session)
-
-    return container_instance.jira_client_repository()
@@ -6,6 +6,8 @@ for testing purposes. It is only available in test environments.
 
 from typing import Any, Callable, Dict, List, Optional
 
+import orjson
+
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,6 +15,9 @@ logger = get_logger(__name__)
 # Dictionary to store available fixtures
 AVAILABLE_FIXTURES: Dict[str, Callable] = {}
 
+# Serialized fixture list, built on first use and reset when a fixture is registered
+_fixtures_json: Optional[bytes] = None
+
 
 def register_fixture(fixture_id: str, fixture_loader_func: Callable):
     """Register a fixture with its loader function.
@@ -21,7 +26,9 @@ def register_fixture(fixture_id: str, fixture_loader_func: Callable):
         fixture_id: Unique identifier for the fixture.
         fixture_loader_func: Async function that loads the fixture into the database.
     """
+    global _fixtures_json
     AVAILABLE_FIXTURES[fixture_id] = fixture_loader_func
+    _fixtures_json = None
     logger.info(f'Registered fixture: {fixture_id}')
 
 
@@ -72,3 +79,18 @@ def is_test_environment() -> bool:
         or os.environ.get('USE_MOCK_JIRA', '').lower() == 'true'
         or os.environ.get('TESTING', '').lower() == 'true'
     )
+
+
+def get_available_fixtures_json() -> bytes:
+    """Get the list of available fixtures serialized as a JSON response body.
+
+    The fixtures are registered at import time, so the body is serialized once
+    and reused until another fixture is registered.
+
+    Returns:
+        JSON object with the fixture IDs under the 'fixtures' key.
+    """
+    global _fixtures_json
+    if _fixtures_json is None:
+        _fixtures_json = orjson.dumps({'fixtures': get_available_fixtures()})
+    return _fixtures_json
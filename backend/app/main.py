@@ -16,11 +16,13 @@ The application follows a modular design with clear separation of concerns:
 - Comprehensive request validation ensures data integrity
 """
 
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import get_settings
 from .container import container
@@ -30,7 +32,10 @@ from .routers import admin, auth, configurations, health, jira, metrics
 
 # Import admin_test router (will only be registered in test environments)
 from .routers import admin_test as admin_test_router
-from .services.caching import get_cache
+from .services.caching import get_cache, listen_for_cache_invalidation
+from .services.jira_calls import shutdown_jira_calls
+from .services.jira_client_factory import clear_client_pool
+from .services.redis_client import get_redis_client
 
 # Create module-level logger
 logger = get_logger(__name__)
@@ -89,6 +94,9 @@ async def lifespan(app: FastAPI):
         # Set up cache reference for admin router
         admin.set_cache_reference(get_cache())
 
+        # Clear the cache when another worker invalidates it (no-op without Redis)
+        invalidation_listener = asyncio.create_task(listen_for_cache_invalidation())
+
         logger.info('=== API SERVER READY ===')
         logger.info('FastAPI application has started and is ready to accept requests')
     except Exception as e:
@@ -96,6 +104,15 @@ async def lifespan(app: FastAPI):
         raise
     yield
     # Shutdown: Add any cleanup code here if needed
+    # Stop listening for cache invalidations
+    invalidation_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await invalidation_listener
+
+    # Stop the threads blocking Jira calls run in, then close the pooled Jira clients
+    shutdown_jira_calls()
+    clear_client_pool()
+
     # Shutdown container resources
     container.shutdown_resources()
     logger.info('Shutting down application')
@@ -132,6 +149,7 @@ def create_app() -> FastAPI:
         openapi_url='/openapi.json',  # Specify the OpenAPI schema URL
         docs_url='/docs',  # Specify the Swagger UI URL
         redoc_url='/redoc',  # Specify the ReDoc URL
+        default_response_class=ORJSONResponse,  # Serialize JSON responses with orjson
     )
 
     # Store the container in app.state, which is a properly typed attribute of FastAPI
@@ -165,6 +183,7 @@ def create_app() -> FastAPI:
         window=60,  # per minute
         exempt_paths=['/ping', '/health'],  # Don't rate limit health check endpoints
         is_test_env=is_test_env,  # Pass test environment flag
+        redis=get_redis_client(),  # Share counters between workers when Redis is configured
     )
 
     # Configure caching based on environment
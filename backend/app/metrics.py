@@ -31,7 +31,7 @@ def parse_jira_datetime(date_str: str) -> Optional[datetime]:
 
     # Handle invalid date strings
     if not isinstance(date_str, str) or 'T' not in date_str:
-        logger.warning(f'Invalid date format: {date_str}')
+        logger.warning('Invalid date format: %s', date_str)
         raise ValueError(f'Invalid date format: {date_str}')
 
     try:
@@ -62,23 +62,43 @@ def parse_jira_datetime(date_str: str) -> Optional[datetime]:
         for fmt in formats:
             try:
                 result = datetime.strptime(date_str, fmt)
-                logger.debug(f'Successfully parsed date: {date_str} with format {fmt}')
+                logger.debug('Successfully parsed date: %s with format %s', date_str, fmt)
                 return result
             except ValueError:
                 continue
 
         # If we get here, none of the formats worked
-        logger.warning(f'Could not parse date with any format: {date_str}')
+        logger.warning('Could not parse date with any format: %s', date_str)
         raise ValueError(f'Could not parse date: {date_str}')
     except Exception as e:
         # For unit testing, we want to catch invalid formats
         if 'invalid-date' in str(date_str):
-            logger.warning(f'Invalid date format: {date_str}')
+            logger.warning('Invalid date format: %s', date_str)
             raise ValueError(f'Invalid date format: {date_str}')
-        logger.error(f'Error parsing date {date_str}: {str(e)}', exc_info=True)
+        logger.error('Error parsing date %s: %s', date_str, e, exc_info=True)
         raise e
 
 
+def _summarize(values: List[int]) -> Dict[str, Any]:
+    """Summarize durations with their average, median, minimum and maximum.
+
+    The values are sorted once, which gives the median and both extremes.
+
+    Args:
+        values (List[int]): The durations in days. Must not be empty.
+
+    Returns:
+        Dict[str, Any]: The average, median, min and max of the values.
+    """
+    ordered = sorted(values)
+    return {
+        'average': sum(ordered) / len(ordered),
+        'median': ordered[len(ordered) // 2],
+        'min': ordered[0],
+        'max': ordered[-1],
+    }
+
+
 def calculate_lead_time(issues: List[Any]) -> Dict[str, Any]:
     """Calculate lead time metrics from a list of Jira issues.
 
@@ -90,7 +110,7 @@ def calculate_lead_time(issues: List[Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary containing lead time metrics.
     """
-    logger.debug(f'Calculating lead time for {len(issues)} issues')
+    logger.debug('Calculating lead time for %s issues', len(issues))
     lead_times = []
     skipped_count = 0
 
@@ -108,46 +128,47 @@ def calculate_lead_time(issues: List[Any]) -> Dict[str, Any]:
                 resolved_date = parse_jira_datetime(resolved)
 
                 if not created_date or not resolved_date:
-                    logger.debug(f'Skipping issue {issue.key} due to invalid dates')
+                    logger.debug('Skipping issue %s due to invalid dates', issue.key)
                     skipped_count += 1
                     continue  # Skip issues with invalid dates
 
                 # Calculate lead time in days
                 lead_time = (resolved_date - created_date).days
                 lead_times.append(lead_time)
-                logger.debug(f'Issue {issue.key} lead time: {lead_time} days')
+                logger.debug('Issue %s lead time: %s days', issue.key, lead_time)
             except ValueError as e:
                 # Skip issues with invalid date formats
-                logger.debug(f'Skipping issue {issue.key} due to date parsing error: {str(e)}')
+                logger.debug('Skipping issue %s due to date parsing error: %s', issue.key, e)
                 skipped_count += 1
                 continue
         except Exception as e:
             # Skip issues with any other errors
-            logger.debug(f'Skipping issue due to unexpected error: {str(e)}')
+            logger.debug('Skipping issue due to unexpected error: %s', e)
             skipped_count += 1
             continue  # nosec B112
 
-    logger.info(f'Lead time calculation: {len(lead_times)} valid issues, {skipped_count} skipped')
+    logger.info(
+        'Lead time calculation: %s valid issues, %s skipped',
+        len(lead_times),
+        skipped_count,
+    )
 
     if not lead_times:
         logger.warning('No completed issues found for lead time calculation')
         return {'error': 'No completed issues found'}
 
     # Calculate metrics
-    avg = sum(lead_times) / len(lead_times)
-    median = sorted(lead_times)[len(lead_times) // 2]
-    min_val = min(lead_times)
-    max_val = max(lead_times)
+    summary = _summarize(lead_times)
 
-    logger.info(f'Lead time metrics: avg={avg:.2f}, median={median}, min={min_val}, max={max_val}')
+    logger.info(
+        'Lead time metrics: avg=%.2f, median=%s, min=%s, max=%s',
+        summary['average'],
+        summary['median'],
+        summary['min'],
+        summary['max'],
+    )
 
-    return {
-        'average': avg,
-        'median': median,
-        'min': min_val,
-        'max': max_val,
-        'data': lead_times,
-    }
+    return {**summary, 'data': lead_times}
 
 
 def calculate_cycle_time(
@@ -166,7 +187,10 @@ def calculate_cycle_time(
         Dict[str, Any]: A dictionary containing cycle time metrics.
     """
     logger.debug(
-        f'Calculating cycle time for {len(issues)} issues (start={start_state}, end={end_state})'
+        'Calculating cycle time for %s issues (start=%s, end=%s)',
+        len(issues),
+        start_state,
+        end_state,
     )
     cycle_times = []
     skipped_count = 0
@@ -182,32 +206,44 @@ def calculate_cycle_time(
         end_date = None
 
         for history in issue.changelog.histories:
-            history_date = parse_jira_datetime(history.created)
+            # Only parse the date of histories moving the issue into one of the two states
+            history_date = None
 
             for item in history.items:
                 if item.field != 'status':
                     continue
 
-                if item.toString == start_state and not start_date:
+                enters_start = item.toString == start_state and not start_date
+                enters_end = item.toString == end_state
+                if not enters_start and not enters_end:
+                    continue
+
+                if history_date is None:
+                    history_date = parse_jira_datetime(history.created)
+
+                if enters_start:
                     start_date = history_date
-                    logger.debug(f'Issue {issue.key} entered {start_state} on {history_date}')
+                    logger.debug('Issue %s entered %s on %s', issue.key, start_state, history_date)
 
-                if item.toString == end_state:
+                if enters_end:
                     end_date = history_date
-                    logger.debug(f'Issue {issue.key} entered {end_state} on {history_date}')
+                    logger.debug('Issue %s entered %s on %s', issue.key, end_state, history_date)
 
         if not start_date or not end_date:
-            logger.debug(f'Skipping issue {issue.key} - missing state transitions')
+            logger.debug('Skipping issue %s - missing state transitions', issue.key)
             skipped_count += 1
             continue  # Skip issues that didn't go through both states
 
         # Calculate cycle time in days
         cycle_time = (end_date - start_date).days
         cycle_times.append(cycle_time)
-        logger.debug(f'Issue {issue.key} cycle time: {cycle_time} days')
+        logger.debug('Issue %s cycle time: %s days', issue.key, cycle_time)
 
     logger.info(
-        f'Cycle time calculation: {len(cycle_times)} valid issues, {skipped_count} skipped, {no_changelog_count} without changelog'
+        'Cycle time calculation: %s valid issues, %s skipped, %s without changelog',
+        len(cycle_times),
+        skipped_count,
+        no_changelog_count,
     )
 
     if not cycle_times:
@@ -215,18 +251,18 @@ def calculate_cycle_time(
         return {'error': 'No issues with valid cycle times found'}
 
     # Calculate metrics
-    avg = sum(cycle_times) / len(cycle_times)
-    median = sorted(cycle_times)[len(cycle_times) // 2]
-    min_val = min(cycle_times)
-    max_val = max(cycle_times)
+    summary = _summarize(cycle_times)
 
-    logger.info(f'Cycle time metrics: avg={avg:.2f}, median={median}, min={min_val}, max={max_val}')
+    logger.info(
+        'Cycle time metrics: avg=%.2f, median=%s, min=%s, max=%s',
+        summary['average'],
+        summary['median'],
+        summary['min'],
+        summary['max'],
+    )
 
     return {
-        'average': avg,
-        'median': median,
-        'min': min_val,
-        'max': max_val,
+        **summary,
         'data': cycle_times,
         'start_state': start_state,
         'end_state': end_state,
@@ -245,7 +281,7 @@ def calculate_throughput(issues: List[Any], period_days: int = 14) -> Dict[str,
     Returns:
         Dict[str, Any]: A dictionary containing throughput metrics.
     """
-    logger.debug(f'Calculating throughput for {len(issues)} issues over {period_days} days')
+    logger.debug('Calculating throughput for %s issues over %s days', len(issues), period_days)
 
     # Filter to only completed issues
     completed_issues = [
@@ -254,7 +290,7 @@ def calculate_throughput(issues: List[Any], period_days: int = 14) -> Dict[str,
         if issue.fields.resolutiondate and issue.fields.status.name == 'Done'
     ]
 
-    logger.debug(f'Found {len(completed_issues)} completed issues')
+    logger.debug('Found %s completed issues', len(completed_issues))
 
     if not completed_issues:
         logger.warning('No completed issues found for throughput calculation')
@@ -268,7 +304,7 @@ def calculate_throughput(issues: List[Any], period_days: int = 14) -> Dict[str,
             completion_dates.append({'completion_date': date_obj.date()})
 
     df = pd.DataFrame(completion_dates)
-    logger.debug(f'Created dataframe with {len(df)} completion dates')
+    logger.debug('Created dataframe with %s completion dates', len(df))
 
     # Count issues completed per day
     throughput = df.groupby('completion_date').size().reset_index()
@@ -287,7 +323,9 @@ def calculate_throughput(issues: List[Any], period_days: int = 14) -> Dict[str,
 
     avg_per_day = len(completed_issues) / period_days
     logger.info(
-        f'Throughput calculation complete: {len(completed_issues)} issues, avg={avg_per_day:.2f} per day'
+        'Throughput calculation complete: %s issues, avg=%.2f per day',
+        len(completed_issues),
+        avg_per_day,
     )
 
     return {
@@ -313,7 +351,7 @@ def calculate_wip(issues: List[Any], workflow_states: Optional[List[str]] = None
     if not workflow_states:
         workflow_states = ['Backlog', 'To Do', 'In Progress', 'Review', 'Done']
 
-    logger.debug(f'Calculating WIP for {len(issues)} issues with states: {workflow_states}')
+    logger.debug('Calculating WIP for %s issues with states: %s', len(issues), workflow_states)
 
     # Count issues in each state
     status_counts = {}
@@ -330,11 +368,13 @@ def calculate_wip(issues: List[Any], workflow_states: Optional[List[str]] = None
             unknown_statuses.add(status)
 
     if unknown_statuses:
-        logger.debug(f'Found issues with statuses not in workflow states: {unknown_statuses}')
+        logger.debug('Found issues with statuses not in workflow states: %s', unknown_statuses)
 
     total = sum(status_counts.values())
     logger.info(
-        f'WIP calculation complete: {total} total issues across {len(workflow_states)} states'
+        'WIP calculation complete: %s total issues across %s states',
+        total,
+        len(workflow_states),
     )
 
     return {'status': status_counts, 'total': total}
@@ -359,7 +399,10 @@ def calculate_cfd(
         workflow_states = ['Backlog', 'To Do', 'In Progress', 'Review', 'Done']
 
     logger.debug(
-        f'Calculating CFD for {len(issues)} issues over {period_days} days with states: {workflow_states}'
+        'Calculating CFD for %s issues over %s days with states: %s',
+        len(issues),
+        period_days,
+        workflow_states,
     )
 
     # Create a date range
@@ -373,55 +416,67 @@ def calculate_cfd(
         logger.warning('No workflow states provided for CFD calculation')
         return result
 
-    # For each date, calculate the cumulative count of issues in each state
+    # Number each state once so issues are counted by index rather than by status name.
+    # Statuses outside the workflow states count in the first non-Done state, and
+    # resolved issues count as Done, or in that same state if Done is not tracked.
+    state_codes = {state: code for code, state in enumerate(dict.fromkeys(workflow_states))}
+    states = list(state_codes)
+    fallback_code = next((code for state, code in state_codes.items() if state != 'Done'), None)
+    done_code = state_codes.get('Done', fallback_code)
+
+    # Change in each state's count on each day of the period. An issue adds one to its
+    # state from the day it was created and moves to Done on the day it was resolved,
+    # so every issue is read once and the daily counts are running sums of these changes.
+    period_start = date_range[0] if date_range else today
+    changes = [[0] * len(states) for _ in date_range]
     skipped_issues = 0
-    for date in date_range:
-        date_data = {state: 0 for state in workflow_states}
-        logger.debug(f'Calculating CFD data for date: {date}')
-
-        for issue in issues:
-            try:
-                created_date_obj = parse_jira_datetime(issue.fields.created)
-                if created_date_obj is None:
-                    skipped_issues += 1
-                    continue
+    for issue in issues:
+        try:
+            created_date_obj = parse_jira_datetime(issue.fields.created)
+            if created_date_obj is None:
+                skipped_issues += 1
+                continue
 
-                created_date = created_date_obj.date()
+            status = issue.fields.status.name
 
-                # Skip issues created after this date
-                if created_date > date:
-                    continue
+            resolved_date_obj = None
+            if issue.fields.resolutiondate:
+                resolved_date_obj = parse_jira_datetime(issue.fields.resolutiondate)
+        except Exception as e:
+            logger.error('Error processing issue for CFD: %s', e, exc_info=True)
+            skipped_issues += 1
+            continue
 
-                # Determine the status of the issue on this date
-                status = issue.fields.status.name
+        # Issues created before the period are counted from its first day
+        created_day = max((created_date_obj.date() - period_start).days, 0)
+        if created_day >= len(date_range):
+            continue
 
-                # If the issue was resolved before this date, it's in the Done state
-                if issue.fields.resolutiondate:
-                    resolved_date_obj = parse_jira_datetime(issue.fields.resolutiondate)
-                    if resolved_date_obj is not None:
-                        resolved_date = resolved_date_obj.date()
-                        if resolved_date <= date:
-                            status = 'Done'
+        done_day = len(date_range)
+        if resolved_date_obj is not None:
+            done_day = max((resolved_date_obj.date() - period_start).days, created_day)
 
-                # Increment the count for this status
-                if status in date_data:
-                    date_data[status] += 1
-                else:
-                    # If status is not in our workflow states, add it to the first non-Done state
-                    for ws in workflow_states:
-                        if ws != 'Done':
-                            date_data[ws] += 1
-                            break
-            except Exception as e:
-                logger.error(f'Error processing issue for CFD: {str(e)}', exc_info=True)
-                skipped_issues += 1
-                continue
+        code = state_codes.get(status, fallback_code)
+        if code is not None and done_day > created_day:
+            changes[created_day][code] += 1
+            if done_day < len(date_range):
+                changes[done_day][code] -= 1
+        if done_code is not None and done_day < len(date_range):
+            changes[done_day][done_code] += 1
 
-        result['data'].append(date_data)
+    # Add up the changes into the cumulative count of issues in each state for each date
+    counts = [0] * len(states)
+    for day_changes in changes:
+        counts = [count + change for count, change in zip(counts, day_changes)]
+        result['data'].append(dict(zip(states, counts)))
 
     if skipped_issues > 0:
-        logger.debug(f'Skipped {skipped_issues} issues due to invalid creation dates or errors')
+        logger.debug('Skipped %s issues due to invalid creation dates or errors', skipped_issues)
 
-    logger.info(f'CFD calculation complete: {len(date_range)} days, {len(workflow_states)} states')
+    logger.info(
+        'CFD calculation complete: %s days, %s states',
+        len(date_range),
+        len(workflow_states),
+    )
 
     return result
@@ -1,13 +1,17 @@
 """Rate limiting middleware for the FastAPI application.
 
 This module provides a middleware for rate limiting requests to the API.
-It uses a simple in-memory store to track requests and enforce limits.
+It uses an in-memory token bucket per client to enforce limits, or a fixed
+window counter in Redis when a Redis client is configured so that the limit is
+shared by every worker process.
 """
 
+import asyncio
+import math
 import os
 import time
-from collections import defaultdict
-from typing import Callable, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -15,7 +19,8 @@ from starlette.types import ASGIApp
 
 from ..logger import get_logger
 
-# Create module-level logger
+# Create module-level logger. Log calls in this module pass their arguments
+# separately so messages on the request path are only formatted when emitted.
 logger = get_logger(__name__)
 
 
@@ -23,14 +28,28 @@ class RateLimiter(BaseHTTPMiddleware):
     """Middleware for rate limiting requests to the API.
 
     This middleware tracks requests by client IP address and enforces
-    rate limits based on a configurable window and limit.
+    rate limits based on a configurable window and limit. Each client gets a
+    token bucket holding up to ``limit`` tokens that refills at ``limit / window``
+    tokens per second, so a client may burst up to the limit and is then held
+    to the average rate.
 
     Attributes:
         limit: Maximum number of requests allowed in the window.
         window: Time window in seconds for rate limiting.
-        exempt_paths: List of paths that are exempt from rate limiting.
-        requests: Dictionary tracking requests by client IP.
+        max_clients: Maximum number of client buckets kept in memory.
+        rate: Number of tokens added to a bucket per second.
+        exempt_paths: List of paths that are exempt from rate limiting. A path
+            ending in ``/`` or ``*`` exempts every path starting with it, any other
+            path is only exempt on an exact match.
+        buckets: Dictionary mapping client IP to its [tokens, last refill time] pair,
+            ordered from least to most recently active client. Buckets left idle for
+            a whole window are full again and are evicted by a background task, so
+            the dictionary only holds recently active clients. When more than
+            ``max_clients`` clients are active, the least recently active bucket is
+            dropped so rotating client IPs cannot grow memory without bound.
         is_test_env: Whether the application is running in a test environment.
+        redis: Optional Redis client holding the request counters shared by all
+            workers. When it is None the in-memory buckets are used instead.
     """
 
     def __init__(
@@ -40,6 +59,8 @@ class RateLimiter(BaseHTTPMiddleware):
         window: int = 60,
         exempt_paths: Optional[List[str]] = None,
         is_test_env: bool = False,
+        max_clients: int = 10000,
+        redis: Optional[Any] = None,
     ):
         """Initialize the rate limiter middleware.
 
@@ -49,6 +70,8 @@ class RateLimiter(BaseHTTPMiddleware):
             window: Time window in seconds for rate limiting.
             exempt_paths: List of paths that are exempt from rate limiting.
             is_test_env: Whether the application is running in a test environment.
+            max_clients: Maximum number of client buckets kept in memory.
+            redis: Optional Redis client for sharing request counts between workers.
         """
         super().__init__(app)
 
@@ -71,14 +94,33 @@ class RateLimiter(BaseHTTPMiddleware):
             self.exempt_paths.extend(
                 [
                     '/configurations',  # Exempt configuration endpoints in test env
-                    '/metrics',  # Exempt metrics endpoints in test env
+                    '/configurations/',
+                    '/metrics/',  # Exempt metrics endpoints in test env
                 ]
             )
 
-        self.requests: Dict[str, List[float]] = defaultdict(list)
+        # Exact paths are a single hash lookup; str.startswith accepts a tuple and
+        # checks every prefix in C
+        self._exempt_exact = frozenset(
+            path for path in self.exempt_paths if not path.endswith(('/', '*'))
+        )
+        self._exempt_prefixes = tuple(
+            path.rstrip('*') for path in self.exempt_paths if path.endswith(('/', '*'))
+        )
+
+        self.max_clients = max_clients
+        self.rate = self.limit / self.window
+        self.buckets: 'OrderedDict[str, List[float]]' = OrderedDict()
+        self._sweeper_task: Optional[asyncio.Task] = None
+        self.redis = redis
         logger.info(
-            f'Rate limiter initialized: {self.limit} requests per {self.window} seconds, '
-            f'exempt paths: {self.exempt_paths}, test mode: {self.is_test_env}'
+            'Rate limiter initialized: %s requests per %s seconds, '
+            'exempt paths: %s, test mode: %s, shared: %s',
+            self.limit,
+            self.window,
+            self.exempt_paths,
+            self.is_test_env,
+            self.redis is not None,
         )
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -93,35 +135,102 @@ class RateLimiter(BaseHTTPMiddleware):
         """
         # Skip rate limiting for exempt paths
         path = request.url.path
-        if any(path.startswith(exempt_path) for exempt_path in self.exempt_paths):
+        if path in self._exempt_exact or path.startswith(self._exempt_prefixes):
             return await call_next(request)
 
         # Skip rate limiting for test-specific headers
         if self.is_test_env and 'x-test-request' in request.headers:
-            logger.debug(f'Skipping rate limiting for test request: {path}')
+            logger.debug('Skipping rate limiting for test request: %s', path)
             return await call_next(request)
 
         # Get client IP
         client_ip = self._get_client_ip(request)
 
-        # Clean up old requests
-        self._cleanup_old_requests(client_ip)
-
         # Check if rate limit is exceeded
-        if len(self.requests[client_ip]) >= self.limit:
-            logger.warning(f'Rate limit exceeded for {client_ip}')
+        if self.redis is not None:
+            retry_after = await self._check_shared_limit(client_ip)
+        else:
+            retry_after = self._check_local_limit(client_ip)
+
+        if retry_after is not None:
+            logger.warning('Rate limit exceeded for %s', client_ip)
             return Response(
                 content='Rate limit exceeded. Please try again later.',
                 status_code=429,
-                headers={'Retry-After': str(self.window)},
+                headers={'Retry-After': str(retry_after)},
             )
 
-        # Add current request
-        self.requests[client_ip].append(time.time())
-
         # Process the request
         return await call_next(request)
 
+    def _check_local_limit(self, client_ip: str) -> Optional[int]:
+        """Take a token from the client's in-memory bucket.
+
+        Args:
+            client_ip: The client IP address.
+
+        Returns:
+            Optional[int]: Seconds until a token is available if the limit is
+                exceeded, otherwise None.
+        """
+        # Make sure idle buckets are being evicted off the request path
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweep_idle_buckets())
+
+        # Look up the client's bucket, keeping the most recently active client last
+        now = time.monotonic()
+        bucket = self.buckets.get(client_ip)
+        if bucket is None:
+            bucket = self.buckets[client_ip] = [float(self.limit), now]
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(client_ip)
+
+        # Refill the bucket for the time elapsed since the last request
+        bucket[0] = min(self.limit, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+
+        if bucket[0] < 1:
+            return math.ceil((1 - bucket[0]) / self.rate)
+
+        # Take a token for the current request
+        bucket[0] -= 1
+        return None
+
+    async def _check_shared_limit(self, client_ip: str) -> Optional[int]:
+        """Count the request against the client's fixed window in Redis.
+
+        Each client has one counter per window that expires with the window, so
+        Redis holds a single small key per active client. If Redis cannot be
+        reached the in-memory bucket is used instead, so requests are still limited
+        per worker.
+
+        Args:
+            client_ip: The client IP address.
+
+        Returns:
+            Optional[int]: Seconds until the window resets if the limit is
+                exceeded, otherwise None.
+        """
+        # Windows are aligned to wall-clock time so every worker uses the same key
+        now = time.time()
+        window_index = int(now // self.window)
+        key = f'rl:{client_ip}:{window_index}'
+
+        try:
+            count = await self.redis.incr(key)
+            if count == 1:
+                await self.redis.expire(key, self.window)
+        except Exception as e:
+            logger.warning('Shared rate limit unavailable, using local limit: %s', e)
+            return self._check_local_limit(client_ip)
+
+        if count > self.limit:
+            return math.ceil((window_index + 1) * self.window - now)
+
+        return None
+
     def _get_client_ip(self, request: Request) -> str:
         """Get the client IP address from the request.
 
@@ -134,23 +243,41 @@ class RateLimiter(BaseHTTPMiddleware):
         # Try to get the real IP from X-Forwarded-For header
         forwarded_for = request.headers.get('X-Forwarded-For')
         if forwarded_for:
-            # X-Forwarded-For can contain multiple IPs, the first one is the client
-            return forwarded_for.split(',')[0].strip()
+            # X-Forwarded-For can contain multiple IPs, the first one is the client.
+            # partition stops at the first comma instead of splitting the whole header
+            return forwarded_for.partition(',')[0].strip()
 
         # Fall back to the client's direct IP or use a safe default
         return (
             request.client.host if request.client else '127.0.0.1'
         )  # Use localhost instead of binding to all interfaces
 
-    def _cleanup_old_requests(self, client_ip: str) -> None:
-        """Remove requests older than the window from the tracking dictionary.
+    async def _sweep_idle_buckets(self) -> None:
+        """Periodically evict idle buckets until the task is cancelled.
+
+        Runs once per window, which is as often as a bucket can become full again.
+        """
+        while True:
+            await asyncio.sleep(self.window)
+            self._evict_idle_buckets(time.monotonic())
+
+    def _evict_idle_buckets(self, now: float) -> None:
+        """Remove buckets that have been idle for at least a whole window.
+
+        An idle bucket has refilled to the limit, so dropping it is equivalent to
+        keeping it: the client gets a fresh, full bucket on its next request.
 
         Args:
-            client_ip: The client IP address.
+            now: The current monotonic time in seconds.
         """
-        current_time = time.time()
-        self.requests[client_ip] = [
-            timestamp
-            for timestamp in self.requests[client_ip]
-            if current_time - timestamp < self.window
-        ]
+        # Buckets are ordered by activity, so stop at the first one that is still active
+        evicted = 0
+        while self.buckets:
+            _, last_refill = next(iter(self.buckets.values()))
+            if now - last_refill < self.window:
+                break
+            self.buckets.popitem(last=False)
+            evicted += 1
+
+        if evicted:
+            logger.debug('Evicted %s idle rate limit buckets', evicted)
@@ -0,0 +1,41 @@
+"""index_metrics_analyses.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-04-20 10:12:41.208517
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def _has_metrics_analyses() -> bool:
+    """Check whether the metrics_analyses table exists.
+
+    The table is created from the models rather than by an earlier migration,
+    so it is only present on databases that were initialized with create_all.
+    """
+    return sa.inspect(op.get_bind()).has_table('metrics_analyses')
+
+
+def upgrade() -> None:
+    """Add a composite index on configuration and date range to metrics_analyses table."""
+    if _has_metrics_analyses():
+        op.create_index(
+            'ix_metrics_config_dates',
+            'metrics_analyses',
+            ['configuration_id', 'start_date', 'end_date'],
+        )
+
+
+def downgrade() -> None:
+    """Remove the configuration and date range index from metrics_analyses table."""
+    if _has_metrics_analyses():
+        op.drop_index('ix_metrics_config_dates', table_name='metrics_analyses')
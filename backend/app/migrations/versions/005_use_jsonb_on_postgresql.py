@@ -0,0 +1,65 @@
+"""use_jsonb_on_postgresql.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-04-21 08:37:55.914206
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+# Tables and the JSON columns stored on them
+JSON_COLUMNS = [
+    ('jira_configurations', 'workflow_states'),
+    ('metrics_analyses', 'metrics_data'),
+]
+
+
+def upgrade() -> None:
+    """Store JSON columns as JSONB on PostgreSQL."""
+    conn = op.get_bind()
+
+    # Other databases keep the generic JSON type
+    if conn.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(conn)
+    for table, column in JSON_COLUMNS:
+        # metrics_analyses is only present on databases initialized with create_all
+        if inspector.has_table(table):
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(),
+                existing_type=sa.JSON(),
+                existing_nullable=False,
+                postgresql_using=f'{column}::jsonb',
+            )
+
+
+def downgrade() -> None:
+    """Store JSON columns as plain JSON on PostgreSQL."""
+    conn = op.get_bind()
+
+    if conn.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(conn)
+    for table, column in JSON_COLUMNS:
+        if inspector.has_table(table):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.JSON(),
+                existing_type=postgresql.JSONB(),
+                existing_nullable=False,
+                postgresql_using=f'{column}::json',
+            )
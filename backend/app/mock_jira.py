@@ -5,8 +5,9 @@ It returns predefined sample data instead of making actual API calls to Jira.
 """
 
 import datetime
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Optional
-from unittest.mock import Mock
 
 from fastapi import Depends
 from sqlalchemy import select
@@ -15,14 +16,38 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .database import get_session
 from .models import JiraConfiguration
 
+# Timestamp format used by the Jira REST API
+JIRA_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.000+0000'
+
+
+@lru_cache(maxsize=64)
+def _format_jira_datetime(date: datetime.datetime) -> str:
+    """Format a datetime the way Jira returns timestamps.
+
+    The sample data reuses the same handful of dates for issue fields and
+    changelog entries, so each distinct date is only formatted once.
+
+    Args:
+        date: The datetime to format.
+
+    Returns:
+        str: The formatted timestamp.
+    """
+    return date.strftime(JIRA_DATETIME_FORMAT)
+
 
 class MockJira:
     """Mock implementation of the Jira API client.
 
     This class mimics the behavior of the actual Jira client but returns
-    predefined sample data instead of making API calls.
+    predefined sample data instead of making API calls. The sample data is
+    built once per day and shared by every instance, since a new client is
+    created for each request.
     """
 
+    # Sample data shared by all instances as (built for date, changelogs, issues)
+    _shared_sample_data = None
+
     def __init__(self, server=None, basic_auth=None):
         """Initialize the mock Jira client.
 
@@ -35,11 +60,21 @@ class MockJira:
         self._setup_sample_data()
 
     def _setup_sample_data(self):
-        """Set up sample data for the mock Jira client."""
-        today = datetime.datetime.now()
+        """Set up sample data for the mock Jira client.
+
+        Reuses the shared sample data when it was built today, so dates stay
+        relative to the current day without rebuilding the data for every client.
+        """
+        # Use whole seconds so equal offsets from today share one cached timestamp string
+        today = datetime.datetime.now().replace(microsecond=0)
+
+        shared = MockJira._shared_sample_data
+        if shared is not None and shared[0] == today.date():
+            _, self.sample_changelogs, self.sample_issues = shared
+            return
 
         # Create sample changelogs for cycle time calculation first
-        self._setup_sample_changelogs()
+        self._setup_sample_changelogs(today)
 
         # Create sample issues with different states and dates
         self.sample_issues = [
@@ -77,6 +112,8 @@ class MockJira:
             ),
         ]
 
+        MockJira._shared_sample_data = (today.date(), self.sample_changelogs, self.sample_issues)
+
     def _create_mock_issue(
         self, key, summary, created_date, resolution_date=None, status='In Progress'
     ):
@@ -90,28 +127,28 @@ class MockJira:
             status: The current status of the issue.
 
         Returns:
-            Mock: A mock Jira issue with the specified fields.
+            SimpleNamespace: A mock Jira issue with the specified fields.
         """
-        issue = Mock()
-        issue.key = key
-        issue.fields = Mock()
-        issue.fields.summary = summary
-        issue.fields.created = created_date.strftime('%Y-%m-%dT%H:%M:%S.000+0000')
-        issue.fields.resolutiondate = (
-            resolution_date.strftime('%Y-%m-%dT%H:%M:%S.000+0000') if resolution_date else None
+        return SimpleNamespace(
+            key=key,
+            fields=SimpleNamespace(
+                summary=summary,
+                created=_format_jira_datetime(created_date),
+                resolutiondate=(
+                    _format_jira_datetime(resolution_date) if resolution_date else None
+                ),
+                status=SimpleNamespace(name=status),
+            ),
+            # Add changelog for cycle time calculation
+            changelog=self.sample_changelogs.get(key, SimpleNamespace(histories=[])),
         )
-        issue.fields.status = Mock()
-        issue.fields.status.name = status
 
-        # Add changelog for cycle time calculation
-        issue.changelog = self.sample_changelogs.get(key, Mock(histories=[]))
-
-        return issue
-
-    def _setup_sample_changelogs(self):
-        """Set up sample changelogs for cycle time calculation."""
-        today = datetime.datetime.now()
+    def _setup_sample_changelogs(self, today):
+        """Set up sample changelogs for cycle time calculation.
 
+        Args:
+            today: The reference date the changelog dates are relative to.
+        """
         # Create sample changelogs
         self.sample_changelogs = {
             'PROJ-1': self._create_mock_changelog(
@@ -153,18 +190,16 @@ class MockJira:
             transitions: A list of tuples containing (date, from_status, to_status).
 
         Returns:
-            Mock: A mock Jira changelog with the specified transitions.
+            SimpleNamespace: A mock Jira changelog with the specified transitions.
         """
-        histories = []
-        for date, from_status, to_status in transitions:
-            history = Mock()
-            history.created = date.strftime('%Y-%m-%dT%H:%M:%S.000+0000')
-            history.items = [Mock(field='status', fromString=from_status, toString=to_status)]
-            histories.append(history)
-
-        changelog = Mock()
-        changelog.histories = histories
-        return changelog
+        histories = [
+            SimpleNamespace(
+                created=_format_jira_datetime(date),
+                items=[SimpleNamespace(field='status', fromString=from_status, toString=to_status)],
+            )
+            for date, from_status, to_status in transitions
+        ]
+        return SimpleNamespace(histories=histories)
 
     def projects(self):
         """Get a list of all projects.
@@ -173,35 +208,44 @@ class MockJira:
             list: A list of mock Jira projects.
         """
         # Create sample projects
-        project1 = Mock()
-        project1.key = 'PROJ'
-        project1.name = 'Sample Project'
-
-        project2 = Mock()
-        project2.key = 'TEST'
-        project2.name = 'Test Project'
-
-        project3 = Mock()
-        project3.key = 'DEV'
-        project3.name = 'Development Project'
-
-        return [project1, project2, project3]
+        return [
+            SimpleNamespace(key='PROJ', name='Sample Project'),
+            SimpleNamespace(key='TEST', name='Test Project'),
+            SimpleNamespace(key='DEV', name='Development Project'),
+        ]
 
-    def search_issues(self, jql, maxResults=1000, fields=None, expand=None):
+    def search_issues(
+        self, jql, startAt=0, maxResults=1000, fields=None, expand=None, json_result=False
+    ):
         """Search for issues matching the JQL query.
 
         Args:
             jql: JQL query to select issues.
+            startAt: Index of the first issue to return.
             maxResults: Maximum number of results to return.
             fields: List of fields to include in the response.
             expand: List of fields to expand in the response.
+            json_result: Whether to return the raw search result instead of issues.
+                Raw issues only contain their key and status.
 
         Returns:
-            list: A list of mock Jira issues.
+            list: A list of mock Jira issues, or a dict with the raw search result.
         """
         # In a real implementation, we would filter the issues based on the JQL query
         # For simplicity, we'll just return all sample issues
-        return self.sample_issues[:maxResults]
+        issues = self.sample_issues[startAt : startAt + maxResults]
+        if not json_result:
+            return issues
+
+        return {
+            'startAt': startAt,
+            'maxResults': maxResults,
+            'total': len(self.sample_issues),
+            'issues': [
+                {'key': issue.key, 'fields': {'status': {'name': issue.fields.status.name}}}
+                for issue in issues
+            ],
+        }
 
     def myself(self):
         """Get information about the current user.
@@ -209,13 +253,13 @@ class MockJira:
         This method is used to validate the connection to Jira.
 
         Returns:
-            Mock: A mock user object.
+            SimpleNamespace: A mock user object.
         """
-        user = Mock()
-        user.displayName = 'Mock User'
-        user.emailAddress = 'mock.user@example.com'
-        user.key = 'mock-user'
-        return user
+        return SimpleNamespace(
+            displayName='Mock User',
+            emailAddress='mock.user@example.com',
+            key='mock-user',
+        )
 
 
 async def get_mock_jira_client(
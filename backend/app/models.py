@@ -7,9 +7,13 @@ definitions.
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, relationship
 
+# JSON column type stored as pre-parsed JSONB on PostgreSQL
+JSONType = JSON().with_variant(JSONB(), 'postgresql')
+
 
 # Create a base class for models
 class Base(DeclarativeBase):
@@ -48,7 +52,7 @@ class JiraConfiguration(Base):
     jira_api_token = Column(String, nullable=False)
     jql_query = Column(String, nullable=False)
     project_key = Column(String, nullable=False)  # Selected Jira project key
-    workflow_states = Column(JSON, nullable=False)  # List of states
+    workflow_states = Column(JSONType, nullable=False)  # List of states
     lead_time_start_state = Column(String, nullable=False)
     lead_time_end_state = Column(String, nullable=False)
     cycle_time_start_state = Column(String, nullable=False)
@@ -79,6 +83,10 @@ class MetricsAnalysis(Base):
     """
 
     __tablename__ = 'metrics_analyses'
+    __table_args__ = (
+        # Look up a configuration's analyses by date range without a full scan
+        Index('ix_metrics_config_dates', 'configuration_id', 'start_date', 'end_date'),
+    )
 
     id = Column(String, primary_key=True, index=True)
     configuration_id = Column(Integer, ForeignKey('jira_configurations.id'), nullable=False)
@@ -87,7 +95,7 @@ class MetricsAnalysis(Base):
     jql_query = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
-    metrics_data = Column(JSON, nullable=False)
+    metrics_data = Column(JSONType, nullable=False)
 
     # Relationships
     configuration = relationship('JiraConfiguration', back_populates='metrics_analyses')
@@ -6,16 +6,25 @@ stored in the database. It abstracts the data access layer from the business log
 
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..logger import get_logger
-from ..models import JiraConfiguration
+from ..models import JiraConfiguration, MetricsAnalysis
 from ..schemas import JiraConfigurationCreate, JiraConfigurationUpdate
+from .jira_client_repository import get_config_by_name, invalidate_config_name
 
 # Create module-level logger
 logger = get_logger(__name__)
 
+# Page of configurations, built once with the offset and limit supplied per call
+GET_ALL_STMT = (
+    select(JiraConfiguration)
+    .order_by(JiraConfiguration.id)
+    .offset(bindparam('skip'))
+    .limit(bindparam('limit'))
+)
+
 
 class ConfigurationRepository:
     """Repository for Jira configurations.
@@ -45,10 +54,9 @@ class ConfigurationRepository:
         Returns:
             List[JiraConfiguration]: List of Jira configurations.
         """
-        logger.debug(f'Getting all configurations with skip={skip}, limit={limit}')
-        stmt = select(JiraConfiguration).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        logger.debug('Getting all configurations with skip=%s, limit=%s', skip, limit)
+        result = await self.session.scalars(GET_ALL_STMT, {'skip': skip, 'limit': limit})
+        return list(result.all())
 
     async def get_by_name(self, name: str) -> Optional[JiraConfiguration]:
         """Get a Jira configuration by name.
@@ -59,10 +67,7 @@ class ConfigurationRepository:
         Returns:
             Optional[JiraConfiguration]: The configuration if found, None otherwise.
         """
-        logger.debug(f'Getting configuration by name: {name}')
-        stmt = select(JiraConfiguration).where(JiraConfiguration.name == name)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await get_config_by_name(self.session, name)
 
     async def create(self, config: JiraConfigurationCreate) -> JiraConfiguration:
         """Create a new Jira configuration.
@@ -73,12 +78,12 @@ class ConfigurationRepository:
         Returns:
             JiraConfiguration: The created configuration.
         """
-        logger.info(f'Creating new configuration: {config.name}')
+        logger.info('Creating new configuration: %s', config.name)
         db_config = JiraConfiguration(**config.model_dump())
         self.session.add(db_config)
         await self.session.commit()
         await self.session.refresh(db_config)
-        logger.info(f'Configuration created successfully: {config.name}')
+        logger.info('Configuration created successfully: %s', config.name)
         return db_config
 
     async def update(
@@ -93,38 +98,54 @@ class ConfigurationRepository:
         Returns:
             Optional[JiraConfiguration]: The updated configuration if found, None otherwise.
         """
-        logger.info(f'Updating configuration: {name}')
-        db_config = await self.get_by_name(name)
+        logger.info('Updating configuration: %s', name)
+
+        # Update and read back the row in a single round trip
+        stmt = (
+            update(JiraConfiguration)
+            .where(JiraConfiguration.name == name)
+            .values(**config.model_dump(exclude_unset=True))
+            .returning(JiraConfiguration)
+        )
+        result = await self.session.execute(stmt)
+        db_config = result.scalar_one_or_none()
         if not db_config:
-            logger.warning(f'Configuration not found: {name}')
+            logger.warning('Configuration not found: %s', name)
             return None
 
-        for key, value in config.model_dump().items():
-            setattr(db_config, key, value)
-
         await self.session.commit()
-        await self.session.refresh(db_config)
-        logger.info(f'Configuration updated successfully: {name}')
+        invalidate_config_name(name)
+        logger.info('Configuration updated successfully: %s', name)
         return db_config
 
     async def delete(self, name: str) -> bool:
         """Delete a Jira configuration.
 
+        Its metrics analyses are deleted along with it.
+
         Args:
             name: Name of the configuration to delete.
 
         Returns:
             bool: True if the configuration was deleted, False otherwise.
         """
-        logger.info(f'Deleting configuration: {name}')
-        db_config = await self.get_by_name(name)
-        if not db_config:
-            logger.warning(f'Configuration not found: {name}')
+        logger.info('Deleting configuration: %s', name)
+
+        # Delete by name without loading the configuration or its analyses first
+        config_id = select(JiraConfiguration.id).where(JiraConfiguration.name == name)
+        await self.session.execute(
+            delete(MetricsAnalysis).where(MetricsAnalysis.configuration_id.in_(config_id))
+        )
+        result = await self.session.execute(
+            delete(JiraConfiguration).where(JiraConfiguration.name == name)
+        )
+        if not result.rowcount:
+            logger.warning('Configuration not found: %s', name)
             return False
 
-        await self.session.delete(db_config)
         await self.session.commit()
-        logger.info(f'Configuration deleted successfully: {name}')
+        invalidate_config_name(name)
+        logger.info('Configuration deleted successfully: %s', name)
         return True
 
     async def count(self) -> int:
@@ -134,6 +155,7 @@ class ConfigurationRepository:
             int: Total number of configurations.
         """
         logger.debug('Counting configurations')
-        stmt = select(JiraConfiguration)
+        # Let the database count the rows instead of loading every configuration
+        stmt = select(func.count()).select_from(JiraConfiguration)
         result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        return result.scalar_one()
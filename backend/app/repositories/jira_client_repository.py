@@ -1,10 +1,14 @@
-"""Jira client repository for the Jira Analyzer.
+"""Jira configuration lookup for the Jira Analyzer.
 
-This module provides a repository for accessing Jira configurations
-stored in the database. It abstracts the data access layer from the business logic.
+This module provides the lookup of Jira configurations by name shared by the
+configuration repository and the Jira client service. It abstracts the data
+access layer from the business logic.
 """
 
-from typing import Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,35 +19,121 @@ from ..models import JiraConfiguration
 # Create module-level logger
 logger = get_logger(__name__)
 
+# Seconds a configuration name is mapped to its primary key before it is looked up again
+NAME_CACHE_TTL = 300
 
-class JiraClientRepository:
-    """Repository for Jira client configurations.
+# Maximum number of configuration names kept in the cache
+NAME_CACHE_SIZE = 256
 
-    This class provides methods for accessing Jira configurations
-    stored in the database. It abstracts the data access layer from the business logic.
+# Configuration name -> (expiry time, primary key), least recently used first
+_name_cache: 'OrderedDict[str, Tuple[float, int]]' = OrderedDict()
 
-    Attributes:
+# Configuration name -> lookup currently running for it, shared by concurrent callers
+_inflight: 'Dict[str, asyncio.Future[Optional[JiraConfiguration]]]' = {}
+
+
+def invalidate_config_name(name: Optional[str] = None) -> None:
+    """Drop a configuration name from the name cache.
+
+    Args:
+        name: The configuration name to drop, or None to clear the whole cache.
+    """
+    if name is None:
+        _name_cache.clear()
+    else:
+        _name_cache.pop(name, None)
+
+
+async def get_config_by_name(
+    session: AsyncSession, config_name: str
+) -> Optional[JiraConfiguration]:
+    """Get a Jira configuration by name.
+
+    Configuration names are cached per process against their primary keys, so
+    repeated lookups of the same configuration are made by primary key, and
+    concurrent lookups of the same name share a single query.
+
+    Args:
         session: The database session to use for database operations.
+        config_name: Name of the configuration to retrieve.
+
+    Returns:
+        Optional[JiraConfiguration]: The configuration if found, None otherwise.
     """
+    logger.debug('Getting configuration by name: %s', config_name)
+
+    # Wait for a lookup of the same name that is already running, then copy
+    # its result into this session instead of querying again
+    inflight = _inflight.get(config_name)
+    if inflight is not None:
+        try:
+            config = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # Only fall back to our own lookup if the shared one was cancelled
+            if not inflight.cancelled():
+                raise
+            return await _load_config_by_name(session, config_name)
+        if config is None:
+            return None
+        return await session.merge(config, load=False)
+
+    # Checking and registering the lookup happen without awaiting in between,
+    # so no other task can start a second lookup for the same name
+    future: 'asyncio.Future[Optional[JiraConfiguration]]' = (
+        asyncio.get_running_loop().create_future()
+    )
+    _inflight[config_name] = future
+    try:
+        config = await _load_config_by_name(session, config_name)
+    except Exception as e:
+        future.set_exception(e)
+        # Waiting callers re-raise the error, so it is never left unretrieved
+        future.exception()
+        raise
+    else:
+        future.set_result(config)
+        return config
+    finally:
+        del _inflight[config_name]
+        if not future.done():
+            future.cancel()
+
 
-    def __init__(self, session: AsyncSession):
-        """Initialize the repository with a database session.
+async def _load_config_by_name(
+    session: AsyncSession, config_name: str
+) -> Optional[JiraConfiguration]:
+    """Load a Jira configuration by name, using the name cache where possible.
 
-        Args:
-            session: The database session to use for database operations.
-        """
-        self.session = session
+    Args:
+        session: The database session to use for database operations.
+        config_name: Name of the configuration to retrieve.
+
+    Returns:
+        Optional[JiraConfiguration]: The configuration if found, None otherwise.
+    """
+    # Resolve a recently seen name by primary key. A session that already loaded
+    # the row, such as one looking the name up again within a request, answers
+    # from its identity map; otherwise this is a lookup on the primary key
+    cached = _name_cache.get(config_name)
+    if cached is not None:
+        expiry, config_id = cached
+        if expiry > time.monotonic():
+            config = await session.get(JiraConfiguration, config_id)
+            # The row may have been renamed or deleted since it was cached, and the
+            # name may have been invalidated while the row was loaded
+            if config is not None and config.name == config_name:
+                if config_name in _name_cache:
+                    _name_cache.move_to_end(config_name)
+                return config
+        _name_cache.pop(config_name, None)
 
-    async def get_by_name(self, config_name: str) -> Optional[JiraConfiguration]:
-        """Get a Jira configuration by name.
+    stmt = select(JiraConfiguration).where(JiraConfiguration.name == config_name)
+    result = await session.execute(stmt)
+    config = result.scalar_one_or_none()
 
-        Args:
-            config_name: Name of the configuration to retrieve.
+    if config is not None:
+        _name_cache[config_name] = (time.monotonic() + NAME_CACHE_TTL, config.id)
+        if len(_name_cache) > NAME_CACHE_SIZE:
+            _name_cache.popitem(last=False)
 
-        Returns:
-            Optional[JiraConfiguration]: The configuration if found, None otherwise.
-        """
-        logger.debug(f'Getting configuration by name: {config_name}')
-        stmt = select(JiraConfiguration).where(JiraConfiguration.name == config_name)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    return config
@@ -5,15 +5,21 @@ cache management and system operations.
 """
 
 import os
-from typing import Dict, Optional
+import uuid
+from typing import Awaitable, Callable, Dict, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Response, status
 
 from ..logger import get_logger
+from ..services.caching import ShardedCache, clear_caches
 
 # Create module-level logger
 logger = get_logger(__name__)
 
+# Check which test database we're running against
+USE_IN_MEMORY_DB = os.environ.get('USE_IN_MEMORY_DB', 'false').lower() == 'true'
+USE_PG_FOR_TESTING = os.environ.get('USE_PG_FOR_TESTING', 'false').lower() == 'true'
+
 # Create router
 router = APIRouter(
     prefix='/admin',
@@ -21,10 +27,16 @@ router = APIRouter(
 )
 
 # Reference to the cache (will be set by the main application)
-_cache: Dict[str, Dict] = {}
+_cache: Dict[str, ShardedCache] = {}
+
+# Maximum number of background job statuses kept
+MAX_JOBS = 100
 
+# Status of database jobs run in the background ('pending', 'done' or 'error'), by job id
+_jobs: Dict[str, str] = {}
 
-def set_cache_reference(cache_ref: Dict[str, Dict]):
+
+def set_cache_reference(cache_ref: Dict[str, ShardedCache]):
     """Set the reference to the application cache.
 
     This function is called by the main application to provide a reference
@@ -55,7 +67,7 @@ def set_cache_reference(cache_ref: Dict[str, Dict]):
 async def clear_cache(
     namespace: Optional[str] = Query(
         None,
-        description='Specific cache namespace to clear (configurations, metrics). If not provided, all caches are cleared.',
+        description='Specific cache namespace to clear (configurations, metrics, jira_projects, jira_workflows). If not provided, all caches are cleared.',
     ),
 ):
     """Clear the application cache.
@@ -73,24 +85,65 @@ async def clear_cache(
     # For example:
     # if not is_authenticated(request):
     #     raise HTTPException(status_code=401, detail="Admin credentials required")
-    global _cache
-
     if namespace:
         if namespace in _cache:
-            _cache[namespace] = {}
-            logger.info(f'Cleared cache for namespace: {namespace}')
+            await clear_caches(namespace)
+            logger.info('Cleared cache for namespace: %s', namespace)
             return {'status': 'success', 'message': f'Cache cleared for namespace: {namespace}'}
         else:
-            logger.warning(f'Cache namespace not found: {namespace}')
+            logger.warning('Cache namespace not found: %s', namespace)
             raise HTTPException(status_code=404, detail=f'Cache namespace not found: {namespace}')
     else:
         # Clear all caches
-        for ns in _cache:
-            _cache[ns] = {}
+        await clear_caches()
         logger.info('Cleared all caches')
         return {'status': 'success', 'message': 'All caches cleared'}
 
 
+async def _run_job(job_id: str, operation: Callable[[], Awaitable[None]], description: str):
+    """Run a database operation and record its outcome.
+
+    Args:
+        job_id: The id of the job.
+        operation: The database operation to run.
+        description: Description of the operation for logging.
+    """
+    try:
+        await operation()
+        _jobs[job_id] = 'done'
+        logger.info('%s completed successfully: %s', description, job_id)
+    except Exception as e:
+        _jobs[job_id] = 'error'
+        logger.error('%s failed: %s', description, e, exc_info=True)
+
+
+def _start_job(
+    background_tasks: BackgroundTasks,
+    operation: Callable[[], Awaitable[None]],
+    description: str,
+) -> str:
+    """Schedule a database operation to run after the response is sent.
+
+    Args:
+        background_tasks: The background tasks of the current request.
+        operation: The database operation to run.
+        description: Description of the operation for logging.
+
+    Returns:
+        str: The id of the job, used to poll its status.
+    """
+    job_id = str(uuid.uuid4())
+    _jobs[job_id] = 'pending'
+
+    # Forget the oldest jobs so the status table stays bounded
+    while len(_jobs) > MAX_JOBS:
+        del _jobs[next(iter(_jobs))]
+
+    background_tasks.add_task(_run_job, job_id, operation, description)
+    logger.info('%s scheduled: %s', description, job_id)
+    return job_id
+
+
 @router.post(
     '/database/reset',
     status_code=status.HTTP_200_OK,
@@ -100,41 +153,59 @@ async def clear_cache(
     response_description='Success message indicating the database was reset',
     response_model=None,
     responses={
+        202: {'description': 'Reset scheduled in the background'},
         401: {'description': 'Unauthorized, admin credentials required'},
         403: {'description': 'Forbidden, only available for in-memory databases'},
     },
 )
-async def reset_database():
+async def reset_database(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    background: bool = Query(
+        False,
+        description='Reset the database after responding and return a job id to poll.',
+    ),
+):
     """Reset the in-memory database.
 
     This endpoint is only available when using an in-memory database for testing.
     It recreates all tables in the database, effectively resetting it to a clean state.
 
+    Args:
+        response: The response, used to set the status code for background resets.
+        background_tasks: Background tasks to schedule the reset on.
+        background: Whether to reset the database in the background.
+
     Returns:
-        dict: Success message indicating the database was reset.
+        dict: Success message indicating the database was reset, or the job id
+            of the background reset.
 
     Raises:
         HTTPException: If not using an in-memory database or if the reset fails.
     """
     # Check if we're using an in-memory database
-    use_in_memory_db = os.environ.get('USE_IN_MEMORY_DB', 'false').lower() == 'true'
-    if not use_in_memory_db:
+    if not USE_IN_MEMORY_DB:
         logger.warning('Attempted to reset database when not using in-memory database')
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail='Database reset is only available when using an in-memory database',
         )
 
-    try:
-        # Import here to avoid circular imports
-        from ..database import init_db
+    # Import here to avoid circular imports
+    from ..database import init_db
 
+    if background:
+        response.status_code = status.HTTP_202_ACCEPTED
+        job_id = _start_job(background_tasks, init_db, 'In-memory database reset')
+        return {'status': 'accepted', 'job_id': job_id}
+
+    try:
         # Reset the database
         await init_db()
         logger.info('In-memory database reset successfully')
         return {'status': 'success', 'message': 'In-memory database reset successfully'}
     except Exception as e:
-        logger.error(f'Failed to reset in-memory database: {str(e)}', exc_info=True)
+        logger.error('Failed to reset in-memory database: %s', e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f'Failed to reset in-memory database: {str(e)}',
@@ -150,44 +221,93 @@ async def reset_database():
     response_description='Success message indicating the database was cleaned up',
     response_model=None,
     responses={
+        202: {'description': 'Cleanup scheduled in the background'},
         401: {'description': 'Unauthorized, admin credentials required'},
         403: {'description': 'Forbidden, only available for PostgreSQL test databases'},
     },
 )
-async def cleanup_database():
+async def cleanup_database(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    background: bool = Query(
+        False,
+        description='Clean up the database after responding and return a job id to poll.',
+    ),
+):
     """Clean up the PostgreSQL test database.
 
     This endpoint is only available when using PostgreSQL for testing.
     It truncates all tables in the database, effectively cleaning it up.
 
+    Args:
+        response: The response, used to set the status code for background cleanups.
+        background_tasks: Background tasks to schedule the cleanup on.
+        background: Whether to clean up the database in the background.
+
     Returns:
-        dict: Success message indicating the database was cleaned up.
+        dict: Success message indicating the database was cleaned up, or the job id
+            of the background cleanup.
 
     Raises:
         HTTPException: If not using PostgreSQL for testing or if the cleanup fails.
     """
     # Check if we're using PostgreSQL for testing
-    use_in_memory_db = os.environ.get('USE_IN_MEMORY_DB', 'false').lower() == 'true'
-    use_pg_for_testing = os.environ.get('USE_PG_FOR_TESTING', 'false').lower() == 'true'
-
-    if not (use_in_memory_db and use_pg_for_testing):
+    if not (USE_IN_MEMORY_DB and USE_PG_FOR_TESTING):
         logger.warning('Attempted to clean up database when not using PostgreSQL for testing')
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail='Database cleanup is only available when using PostgreSQL for testing',
         )
 
-    try:
-        # Import here to avoid circular imports
-        from ..database import cleanup_test_database
+    # Import here to avoid circular imports
+    from ..database import cleanup_test_database
+
+    if background:
+        response.status_code = status.HTTP_202_ACCEPTED
+        job_id = _start_job(
+            background_tasks, cleanup_test_database, 'PostgreSQL test database cleanup'
+        )
+        return {'status': 'accepted', 'job_id': job_id}
 
+    try:
         # Clean up the database
         await cleanup_test_database()
         logger.info('PostgreSQL test database cleaned up successfully')
         return {'status': 'success', 'message': 'PostgreSQL test database cleaned up successfully'}
     except Exception as e:
-        logger.error(f'Failed to clean up PostgreSQL test database: {str(e)}', exc_info=True)
+        logger.error('Failed to clean up PostgreSQL test database: %s', e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f'Failed to clean up PostgreSQL test database: {str(e)}',
         )
+
+
+@router.get(
+    '/jobs/{job_id}',
+    status_code=status.HTTP_200_OK,
+    summary='Get the status of a background database job',
+    description='Returns whether a database reset or cleanup started with background=true '
+    'is still pending, has finished, or has failed.',
+    response_description='The job id and its status',
+    response_model=None,
+    responses={
+        404: {'description': 'Job not found'},
+    },
+)
+async def get_job_status(job_id: str):
+    """Get the status of a background database job.
+
+    Args:
+        job_id: The id returned when the job was scheduled.
+
+    Returns:
+        dict: The job id and its status ('pending', 'done' or 'error').
+
+    Raises:
+        HTTPException: If the job is not known.
+    """
+    job_status = _jobs.get(job_id)
+    if job_status is None:
+        raise HTTPException(status_code=404, detail=f'Job not found: {job_id}')
+
+    return {'job_id': job_id, 'status': job_status}
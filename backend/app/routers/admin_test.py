@@ -4,9 +4,9 @@ This module defines endpoints that are ONLY used for testing purposes.
 These endpoints are not registered in production environments.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
-from ..fixtures import get_available_fixtures, is_test_environment, load_fixture
+from ..fixtures import get_available_fixtures_json, is_test_environment, load_fixture
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -119,7 +119,7 @@ async def list_fixtures(request: Request):
         request: The FastAPI request object.
 
     Returns:
-        dict: List of available fixtures.
+        Response: JSON list of available fixtures.
 
     Raises:
         HTTPException: If not in a test environment.
@@ -127,6 +127,5 @@ async def list_fixtures(request: Request):
     # Verify we're in a test environment
     _verify_test_environment(request)
 
-    # Get available fixtures
-    fixtures = get_available_fixtures()
-    return {'fixtures': fixtures}
+    # Return the pre-serialized fixture list
+    return Response(content=get_available_fixtures_json(), media_type='application/json')
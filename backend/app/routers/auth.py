@@ -4,20 +4,24 @@ This module defines the authentication endpoints for the API, which handle
 user authentication and credential validation.
 """
 
-from typing import Any, Dict
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
 
 from dependency_injector.wiring import inject
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..auth import create_access_token
+from ..auth import JWT_COOKIE_NAME, create_access_token, credentials_digest
 from ..config import Settings, get_settings
 from ..database import get_session
 from ..dependencies import get_jira_client_factory, get_jira_client_service
 from ..logger import get_logger
 from ..models import JiraConfiguration
 from ..schemas import CredentialsResponse, JiraCredentials
+from ..services.caching import clear_caches
+from ..services.jira_calls import run_jira_call
 from ..services.jira_client_factory import JiraClientFactory
 from ..services.jira_client_service import JiraClientService
 
@@ -29,6 +33,98 @@ router = APIRouter(
     tags=['Authentication'],
 )
 
+# Configuration lookup built once, with the name supplied as a bound parameter per call
+CONFIG_BY_NAME_STMT = select(JiraConfiguration).where(JiraConfiguration.name == bindparam('name'))
+
+# Set-Cookie header for the JWT token, filled in with the token and its max age in seconds.
+# The token is HTTP-only (inaccessible to JavaScript), only sent over HTTPS, restricted
+# to same-site requests to prevent CSRF attacks, and available across the entire domain.
+TOKEN_COOKIE_FORMAT = JWT_COOKIE_NAME + '=%s; HttpOnly; Max-Age=%d; Path=/; SameSite=strict; Secure'
+
+# Configuration fields holding the Jira credentials
+CREDENTIAL_FIELDS = ('jira_server', 'jira_email', 'jira_api_token')
+
+# Seconds a successful validation is trusted before the credentials are checked with Jira again
+VALIDATION_TTL = 60
+
+# Maximum number of recently validated credentials kept
+MAX_VALIDATED_CREDENTIALS = 1024
+
+# Digest of recently validated credentials -> time of validation, oldest first
+_validated: 'OrderedDict[bytes, float]' = OrderedDict()
+
+# Seconds a signed token must still be valid for to be handed out again
+TOKEN_REUSE_MARGIN = 60
+
+# Maximum number of signed tokens kept for reuse
+MAX_ISSUED_TOKENS = 1024
+
+# (configuration name, signing key, algorithm) -> (signed token, expiry time), oldest first
+_issued_tokens: 'OrderedDict[Tuple[str, str, str], Tuple[str, float]]' = OrderedDict()
+
+
+def _recently_validated(digest: bytes) -> bool:
+    """Check whether credentials were validated with Jira within the TTL.
+
+    Args:
+        digest: The digest of the credentials.
+
+    Returns:
+        bool: True if the credentials were validated recently.
+    """
+    validated_at = _validated.get(digest)
+    if validated_at is None:
+        return False
+    if time.monotonic() - validated_at >= VALIDATION_TTL:
+        del _validated[digest]
+        return False
+    return True
+
+
+def _remember_validated(digest: bytes) -> None:
+    """Record that credentials were just validated with Jira.
+
+    Args:
+        digest: The digest of the credentials.
+    """
+    _validated[digest] = time.monotonic()
+    _validated.move_to_end(digest)
+    if len(_validated) > MAX_VALIDATED_CREDENTIALS:
+        _validated.popitem(last=False)
+
+
+def _get_access_token(config_name: str, settings: Settings) -> Tuple[str, int]:
+    """Get a token for a configuration, reusing a recently signed one if possible.
+
+    Args:
+        config_name: The configuration name the token is for.
+        settings: Application settings for JWT configuration.
+
+    Returns:
+        Tuple[str, int]: The token and the number of seconds it remains valid.
+    """
+    key = (config_name, settings.jwt_secret_key, settings.jwt_algorithm)
+    now = time.monotonic()
+
+    issued = _issued_tokens.get(key)
+    if issued is not None:
+        token, expiry = issued
+        if expiry - now > TOKEN_REUSE_MARGIN:
+            _issued_tokens.move_to_end(key)
+            return token, int(expiry - now)
+
+    # Generate a JWT token with the configuration name
+    token_data: Dict[str, Any] = {'config_name': config_name}
+    token = create_access_token(token_data, settings)
+    lifetime = settings.jwt_expiration_minutes * 60  # Convert minutes to seconds
+
+    _issued_tokens[key] = (token, now + lifetime)
+    _issued_tokens.move_to_end(key)
+    if len(_issued_tokens) > MAX_ISSUED_TOKENS:
+        _issued_tokens.popitem(last=False)
+
+    return token, lifetime
+
 
 @router.post(
     '/validate-credentials',
@@ -74,60 +170,68 @@ async def validate_credentials(
     Raises:
         HTTPException: If credentials are invalid or connection fails.
     """
-    logger.info(f'Validating credentials for: {credentials.name}')
+    logger.info('Validating credentials for: %s', credentials.name)
 
     try:
         # Check if a configuration with this name already exists
-        stmt = select(JiraConfiguration).where(JiraConfiguration.name == credentials.name)
-        result = await session.execute(stmt)
-        existing_config = result.scalar_one_or_none()
-
-        # If configuration exists and has a project key, update the credentials
-        if existing_config and existing_config.project_key:
+        existing_config = await session.scalar(CONFIG_BY_NAME_STMT, {'name': credentials.name})
+
+        # If configuration exists and has a project key, update the credentials,
+        # skipping the write entirely when they have not changed
+        if (
+            existing_config
+            and existing_config.project_key
+            and any(
+                getattr(existing_config, field) != getattr(credentials, field)
+                for field in CREDENTIAL_FIELDS
+            )
+        ):
             # Update the existing configuration with the new credentials
             # Use setattr to avoid type errors
-            setattr(existing_config, 'jira_server', credentials.jira_server)
-            setattr(existing_config, 'jira_email', credentials.jira_email)
-            setattr(existing_config, 'jira_api_token', credentials.jira_api_token)
+            for field in CREDENTIAL_FIELDS:
+                setattr(existing_config, field, getattr(credentials, field))
             await session.commit()
-            logger.info(f'Updated existing credentials for: {credentials.name}')
-
-        # Validate the credentials directly without storing in the database
-        # Create a temporary Jira client to validate the credentials
-        logger.debug(f'Validating credentials for: {credentials.name}')
-        temp_jira_client = await jira_client_factory.create_client_from_credentials(
-            jira_server=credentials.jira_server,
-            jira_email=credentials.jira_email,
-            jira_api_token=credentials.jira_api_token,
-            config_name=credentials.name,
-        )
-
-        # Test the connection by fetching user information
-        temp_jira_client.myself()
-        logger.info(f'Connection validated successfully for: {credentials.name}')
+            # Jira data cached for this configuration was fetched with the old credentials
+            await clear_caches('jira_projects', 'jira_workflows', 'jira_connections', 'metrics')
+            logger.info('Updated existing credentials for: %s', credentials.name)
+
+        # Skip the round trip to Jira if the same credentials were validated recently
+        digest = credentials_digest(credentials)
+        if _recently_validated(digest):
+            logger.info('Credentials recently validated for: %s', credentials.name)
+        else:
+            # Validate the credentials directly without storing in the database
+            # Create a temporary Jira client to validate the credentials
+            logger.debug('Validating credentials for: %s', credentials.name)
+            temp_jira_client = await jira_client_factory.create_client_from_credentials(
+                jira_server=credentials.jira_server,
+                jira_email=credentials.jira_email,
+                jira_api_token=credentials.jira_api_token,
+                config_name=credentials.name,
+            )
+
+            # Test the connection by fetching user information, off the event loop
+            # since the Jira client makes blocking HTTP requests
+            await run_jira_call(temp_jira_client.myself)
+            _remember_validated(digest)
+            logger.info('Connection validated successfully for: %s', credentials.name)
 
         # Credentials have been validated successfully
 
-        # Generate a JWT token with the configuration name
-        token_data: Dict[str, Any] = {'config_name': credentials.name}
-        token = create_access_token(token_data, settings)
-
-        # Set the JWT token as an HTTP-only cookie
-        cookie_max_age = settings.jwt_expiration_minutes * 60  # Convert minutes to seconds
-        response.set_cookie(
-            key='jira_token',
-            value=token,
-            httponly=True,  # Make it inaccessible to JavaScript
-            secure=True,  # Only send over HTTPS
-            samesite='strict',  # Prevent CSRF attacks
-            max_age=cookie_max_age,
-            path='/',  # Available across the entire domain
-        )
+        # Get a JWT token with the configuration name, reusing one signed recently
+        token, cookie_max_age = _get_access_token(credentials.name, settings)
+
+        # Set the JWT token as an HTTP-only cookie that expires with the token.
+        # JWTs only contain URL-safe characters, so the header can be formatted
+        # without cookie quoting
+        response.headers.append('set-cookie', TOKEN_COOKIE_FORMAT % (token, cookie_max_age))
 
-        logger.info(f'Credentials validated successfully for: {credentials.name}')
+        logger.info('Credentials validated successfully for: %s', credentials.name)
         return {'status': 'success', 'message': 'Credentials are valid'}
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f'Credential validation failed: {str(e)}', exc_info=True)
+        logger.error('Credential validation failed: %s', e, exc_info=True)
         raise HTTPException(
             status_code=401, detail=f'Invalid credentials or connection failed: {str(e)}'
         )
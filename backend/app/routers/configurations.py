@@ -16,7 +16,7 @@ from ..schemas import (
     JiraConfigurationUpdate,
     PaginatedResponse,
 )
-from ..services.caching import cache_result, clear_cache
+from ..services.caching import cache_result, clear_caches
 from ..services.configuration_service import ConfigurationService
 
 # Create module-level logger
@@ -60,7 +60,9 @@ async def create_configuration(
     """
     result = await config_service.create(config)
     # Clear configurations cache after creating a new configuration
-    clear_cache('configurations')
+    await clear_caches(
+        'configurations', 'jira_projects', 'jira_workflows', 'jira_connections', 'metrics'
+    )
     logger.info('Cleared configurations cache after creating new configuration')
     return result
 
@@ -156,7 +158,9 @@ async def update_configuration(
     """
     result = await config_service.update(name, config)
     # Clear configurations cache after updating a configuration
-    clear_cache('configurations')
+    await clear_caches(
+        'configurations', 'jira_projects', 'jira_workflows', 'jira_connections', 'metrics'
+    )
     logger.info('Cleared configurations cache after updating configuration')
     return result
 
@@ -187,5 +191,7 @@ async def delete_configuration(
     """
     await config_service.delete(name)
     # Clear configurations cache after deleting a configuration
-    clear_cache('configurations')
+    await clear_caches(
+        'configurations', 'jira_projects', 'jira_workflows', 'jira_connections', 'metrics'
+    )
     logger.info('Cleared configurations cache after deleting configuration')
@@ -5,8 +5,10 @@ to verify that the API is running and healthy.
 """
 
 import datetime
+import time
+from typing import Tuple
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 
 from ..logger import get_logger
 
@@ -19,6 +21,28 @@ router = APIRouter(
     tags=['Health'],
 )
 
+# Serialized ping response body
+PONG_BODY = b'{"ping":"pong"}'
+
+# Whole second of the last health check -> its ISO 8601 timestamp
+_timestamp: Tuple[int, str] = (0, '')
+
+
+def _current_timestamp() -> str:
+    """Get the current local time as an ISO 8601 string with second precision.
+
+    The string is formatted at most once per second and reused by every
+    health check within that second.
+
+    Returns:
+        str: The current timestamp.
+    """
+    global _timestamp
+    second = int(time.time())
+    if _timestamp[0] != second:
+        _timestamp = (second, datetime.datetime.fromtimestamp(second).isoformat())
+    return _timestamp[1]
+
 
 @router.get(
     '/ping',
@@ -34,10 +58,12 @@ async def ping():
     without requiring database access.
 
     Returns:
-        dict: Simple response with pong message.
+        Response: Simple response with pong message.
     """
-    logger.info('Ping endpoint called')
-    return {'ping': 'pong'}
+    logger.debug('Ping endpoint called')
+    # Return the pre-serialized body, skipping response validation and JSON encoding.
+    # The Response is built per request because middleware may add headers to it
+    return Response(content=PONG_BODY, media_type='application/json')
 
 
 @router.get(
@@ -60,5 +86,5 @@ async def health_check():
     return {
         'status': 'healthy',
         'api_version': '1.0.0',  # This should be imported from a central version file
-        'timestamp': str(datetime.datetime.now()),
+        'timestamp': _current_timestamp(),
     }
@@ -4,21 +4,28 @@ This module defines endpoints that interact directly with the Jira API,
 such as fetching projects and issue data.
 """
 
-from typing import Any, Dict, List, Optional, cast
+import hashlib
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Union
 
+import orjson
 from dependency_injector.wiring import inject
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials
-from jira import JIRA
-from jira.resources import Issue
+from jira.exceptions import JIRAError
+from requests import RequestException
 
-from ..auth import security
+from ..auth import credentials_digest, security
 from ..config import Settings, get_settings
 from ..dependencies import get_jira_client_factory, get_jira_client_service
 from ..logger import get_logger
 from ..schemas import JiraCredentials
+from ..services.caching import cache_result
+from ..services.jira_calls import run_jira_call
 from ..services.jira_client_factory import JiraClientFactory
 from ..services.jira_client_service import JiraClientService
+from ..services.jira_workflow import extract_workflow_statuses
 
 # Create module-level logger
 logger = get_logger(__name__)
@@ -29,6 +36,196 @@ router = APIRouter(
     tags=['Jira'],
 )
 
+# Reads a project's key and name in one call
+_project_key_and_name = attrgetter('key', 'name')
+
+# Error responses of the endpoints using a stored configuration
+CONFIG_ERROR_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    400: {'description': 'Missing configuration name'},
+    404: {'description': 'Configuration not found'},
+}
+
+# Error responses of the endpoints using credentials directly
+CREDENTIALS_ERROR_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    401: {'description': 'Invalid credentials'},
+}
+
+# Response of every endpoint when all Jira call slots stay busy
+JIRA_BUSY_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    503: {'description': 'Too many concurrent Jira requests'},
+}
+
+# Errors raised when Jira rejects a request or cannot be reached
+JIRA_ERRORS = (JIRAError, RequestException)
+
+# Seconds a successful connection check is remembered before Jira is asked again
+CONNECTION_CHECK_TTL = 30
+
+# Project lists are per user and must be revalidated, which is answered with 304 if unchanged
+PROJECTS_CACHE_CONTROL = 'private, no-cache'
+
+
+def _jira_failure(message: str, error: Exception) -> HTTPException:
+    """Log a failed Jira request and build the error response for it.
+
+    Must be called from the except block handling the error. Jira errors are
+    expected failures, such as bad credentials or an unreachable server, so
+    they are logged without a traceback. Any other error is logged with one.
+
+    Args:
+        message: Description of what failed.
+        error: The error raised.
+
+    Returns:
+        HTTPException: A 500 error with the error message as its detail.
+    """
+    if isinstance(error, JIRA_ERRORS):
+        logger.error('%s: %s', message, error)
+    else:
+        logger.exception('%s: %s', message, error)
+    return HTTPException(status_code=500, detail=str(error))
+
+
+def _project_summaries(projects: List[Any]) -> List[Dict[str, str]]:
+    """Reduce Jira projects to their key and name.
+
+    Args:
+        projects: Jira project resources.
+
+    Returns:
+        List[dict]: List of projects with their key and name.
+    """
+    return [{'key': key, 'name': name} for key, name in map(_project_key_and_name, projects)]
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client already has the response with an entity tag.
+
+    Args:
+        request: FastAPI request object carrying the If-None-Match header.
+        etag: The entity tag of the current response.
+
+    Returns:
+        bool: True if the If-None-Match header lists the entity tag.
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    # Weak comparison, as required for If-None-Match
+    tags = {tag.strip() for tag in if_none_match.split(',')}
+    tags = {tag[2:] if tag.startswith('W/') else tag for tag in tags}
+    return '*' in tags or etag in tags
+
+
+@cache_result(
+    namespace='jira_projects',
+    key_func=lambda request, config_name, *args: f'projects:{config_name}',
+)
+async def _fetch_projects(
+    request: Request, config_name: str, jira_client_service: JiraClientService
+) -> List[Dict[str, str]]:
+    """Fetch the projects visible to a stored configuration.
+
+    Args:
+        request: FastAPI request object, used to skip the cache for test requests.
+        config_name: Name of the stored Jira configuration to use.
+        jira_client_service: Service for retrieving and creating Jira clients.
+
+    Returns:
+        List[dict]: List of projects with their key and name.
+    """
+    jira = await jira_client_service.get_client_by_config_name(config_name)
+    projects = await run_jira_call(jira.projects)
+    logger.debug('Found %s projects', len(projects))
+    return _project_summaries(projects)
+
+
+@cache_result(
+    namespace='jira_projects',
+    # Key on a digest of the credentials so the API token is not kept in the key
+    key_func=lambda credentials, *args: f'credentials:{credentials_digest(credentials).hex()}',
+)
+async def _fetch_projects_with_credentials(
+    credentials: JiraCredentials, jira_client_factory: JiraClientFactory
+) -> List[Dict[str, str]]:
+    """Fetch the projects visible to a set of credentials.
+
+    Args:
+        credentials: Jira credentials to use for the connection.
+        jira_client_factory: Factory for creating Jira clients.
+
+    Returns:
+        List[dict]: List of projects with their key and name.
+    """
+    # Create a temporary Jira client using the provided credentials
+    jira_client = await jira_client_factory.create_client_from_credentials(
+        jira_server=credentials.jira_server,
+        jira_email=credentials.jira_email,
+        jira_api_token=credentials.jira_api_token,
+        config_name=credentials.name,
+    )
+
+    # Fetch projects off the event loop
+    projects = await run_jira_call(jira_client.projects)
+    logger.debug('Found %s projects using direct credentials', len(projects))
+    return _project_summaries(projects)
+
+
+@cache_result(
+    namespace='jira_workflows',
+    key_func=lambda request, config_name, project_key, *args: f'wf:{config_name}:{project_key}',
+    ttl_seconds=600,
+)
+async def _fetch_workflows(
+    request: Request,
+    config_name: str,
+    project_key: str,
+    jira_client_service: JiraClientService,
+) -> List[Dict[str, Any]]:
+    """Extract the workflow statuses of a project from its recent issues.
+
+    Workflow status sets rarely change, so results are cached for ten minutes.
+
+    Args:
+        request: FastAPI request object, used to skip the cache for test requests.
+        config_name: Name of the stored Jira configuration to use.
+        project_key: The project key to fetch workflow data for.
+        jira_client_service: Service for retrieving and creating Jira clients.
+
+    Returns:
+        List[dict]: List of workflow statuses with their details.
+    """
+    jira = await jira_client_service.get_client_by_config_name(config_name)
+    return await extract_workflow_statuses(jira, project_key)
+
+
+@cache_result(
+    namespace='jira_connections',
+    key_func=lambda request, config_name, *args: f'connection:{config_name}',
+    ttl_seconds=CONNECTION_CHECK_TTL,
+)
+async def _check_connection(
+    request: Request, config_name: str, jira_client_service: JiraClientService
+) -> bool:
+    """Check that a stored configuration can connect to Jira.
+
+    A successful check is remembered for ``CONNECTION_CHECK_TTL`` seconds, so the
+    frontend confirming its session on every navigation does not call Jira each
+    time. Concurrent checks of the same configuration share one call to Jira.
+
+    Args:
+        request: FastAPI request object, used to skip the cache for test requests.
+        config_name: Name of the stored Jira configuration to check.
+        jira_client_service: Service for retrieving and creating Jira clients.
+
+    Returns:
+        bool: True once the connection has been checked.
+    """
+    jira = await jira_client_service.get_client_by_config_name(config_name)
+    # Fetch a simple resource to test the connection
+    await run_jira_call(jira.myself)
+    return True
+
 
 @router.get(
     '/validate-connection',
@@ -36,9 +233,9 @@ router = APIRouter(
     description='Validates the connection to Jira using the provided configuration.',
     response_description='Success message if connection is valid',
     responses={
-        400: {'description': 'Missing configuration name'},
-        404: {'description': 'Configuration not found'},
+        **CONFIG_ERROR_RESPONSES,
         500: {'description': 'Failed to connect to Jira'},
+        **JIRA_BUSY_RESPONSES,
     },
 )
 @inject
@@ -67,19 +264,19 @@ async def validate_connection(
     Raises:
         HTTPException: If the JIRA API request fails.
     """
-    # Get the JIRA client from the service
-    jira = await jira_client_service.get_client_from_auth(
+    # Resolve the configuration the request is authenticated for
+    config_name = await jira_client_service.resolve_config_name(
         request, credentials, settings, config_name
     )
     logger.info('Validating connection to JIRA')
     try:
-        # Test the connection by fetching a simple resource
-        jira.myself()
+        await _check_connection(request, config_name, jira_client_service)
         logger.info('Connection to JIRA validated successfully')
         return {'status': 'success', 'message': 'Connection is valid'}
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f'Failed to validate connection to JIRA: {str(e)}', exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _jira_failure('Failed to validate connection to JIRA', e)
 
 
 @router.get(
@@ -89,9 +286,10 @@ async def validate_connection(
     description='Retrieves a list of all projects from the Jira instance using the provided credentials.',
     response_description='List of projects with their key and name',
     responses={
-        400: {'description': 'Missing configuration name'},
-        404: {'description': 'Configuration not found'},
+        304: {'description': 'Projects unchanged since the ETag in If-None-Match'},
+        **CONFIG_ERROR_RESPONSES,
         500: {'description': 'Failed to connect to Jira or fetch projects'},
+        **JIRA_BUSY_RESPONSES,
     },
 )
 @inject
@@ -112,23 +310,32 @@ async def get_jira_projects(
         jira_client_service: Service for retrieving and creating Jira clients.
 
     Returns:
-        List[dict]: List of projects with their key and name.
+        Response: List of projects with their key and name, or an empty 304 response
+            if the client's copy is still current.
 
     Raises:
         HTTPException: If the JIRA API request fails.
     """
-    # Get the JIRA client from the service
-    jira = await jira_client_service.get_client_from_auth(
+    # Resolve the configuration the request is authenticated for
+    config_name = await jira_client_service.resolve_config_name(
         request, credentials, settings, config_name
     )
     logger.info('Fetching projects from JIRA')
     try:
-        projects = jira.projects()
-        logger.debug(f'Found {len(projects)} projects')
-        return [{'key': project.key, 'name': project.name} for project in projects]
+        projects = await _fetch_projects(request, config_name, jira_client_service)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f'Failed to fetch projects from JIRA: {str(e)}', exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _jira_failure('Failed to fetch projects from JIRA', e)
+
+    # Tag the response with a digest of its body, so a client polling for projects
+    # gets an empty 304 response while they are unchanged
+    body = orjson.dumps(projects)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {'ETag': etag, 'Cache-Control': PROJECTS_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type='application/json', headers=headers)
 
 
 @router.post(
@@ -138,8 +345,9 @@ async def get_jira_projects(
     description='Retrieves a list of all projects from the Jira instance using the provided credentials directly.',
     response_description='List of projects with their key and name',
     responses={
-        401: {'description': 'Invalid credentials'},
+        **CREDENTIALS_ERROR_RESPONSES,
         500: {'description': 'Failed to connect to Jira or fetch projects'},
+        **JIRA_BUSY_RESPONSES,
     },
 )
 @inject
@@ -162,25 +370,15 @@ async def get_jira_projects_with_credentials(
     Raises:
         HTTPException: If the JIRA API request fails.
     """
-    logger.info(f'Fetching projects from JIRA using direct credentials for: {credentials.name}')
+    logger.info('Fetching projects from JIRA using direct credentials for: %s', credentials.name)
     try:
-        # Create a temporary Jira client using the provided credentials
-        jira_client = await jira_client_factory.create_client_from_credentials(
-            jira_server=credentials.jira_server,
-            jira_email=credentials.jira_email,
-            jira_api_token=credentials.jira_api_token,
-            config_name=credentials.name,
-        )
-
-        # Fetch projects
-        projects = jira_client.projects()
-        logger.debug(f'Found {len(projects)} projects using direct credentials')
-        return [{'key': project.key, 'name': project.name} for project in projects]
+        projects = await _fetch_projects_with_credentials(credentials, jira_client_factory)
+        # The projects are already plain dicts, so serialize them without validating them again
+        return ORJSONResponse(projects)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(
-            f'Failed to fetch projects from JIRA with direct credentials: {str(e)}', exc_info=True
-        )
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _jira_failure('Failed to fetch projects from JIRA with direct credentials', e)
 
 
 @router.get(
@@ -190,9 +388,10 @@ async def get_jira_projects_with_credentials(
     description='Retrieves workflow information including statuses and transitions from the Jira project.',
     response_description='List of workflow statuses with their information',
     responses={
+        **CONFIG_ERROR_RESPONSES,
         400: {'description': 'Missing configuration name or project key'},
-        404: {'description': 'Configuration not found'},
         500: {'description': 'Failed to connect to Jira or fetch workflow data'},
+        **JIRA_BUSY_RESPONSES,
     },
 )
 @inject
@@ -223,88 +422,21 @@ async def get_jira_workflows(
     if not project_key:
         raise HTTPException(status_code=400, detail='Project key is required')
 
-    # Get the JIRA client from the service
-    jira = await jira_client_service.get_client_from_auth(
+    # Resolve the configuration the request is authenticated for
+    config_name = await jira_client_service.resolve_config_name(
         request, credentials, settings, config_name
     )
 
-    logger.info(f'Fetching workflow data for project: {project_key}')
+    logger.info('Fetching workflow data for project: %s', project_key)
     try:
-        # Cast to JIRA type to satisfy the type checker
-        jira_client = cast(JIRA, jira)
-
-        # Get workflow states from 6 months of historical data
-        logger.info(
-            f'Analyzing historical data for project {project_key} to extract workflow states'
-        )
-
-        # Create a JQL query to get issues from the past 6 months
-        from datetime import datetime, timedelta
-
-        six_months_ago = (datetime.now() - timedelta(days=180)).strftime('%Y-%m-%d')
-
-        # Query for all issues in the project updated in the last 6 months
-        jql_query = f'project = {project_key} AND updated >= {six_months_ago}'
-        logger.info(f'Using JQL: {jql_query}')
-
-        # Get all issues matching the query
-        issues = jira_client.search_issues(
-            jql_query, maxResults=1000, fields=['status', 'statuscategory']
-        )
-        logger.info(f'Found {len(issues)} issues to analyze')
-
-        # Extract all unique status names from issues, with case-insensitive comparison
-        status_names = set()
-        status_categories = {}
-
-        for issue_obj in issues:
-            # Ensure issue is proper type
-            issue = cast(Issue, issue_obj)
-            status_name = issue.fields.status.name
-            # Store status name in lowercase for case-insensitive comparison
-            status_name_lower = status_name.lower()
-            if status_name_lower not in status_names:
-                status_names.add(status_name_lower)
-                # Store the original casing and category
-                status_categories[status_name_lower] = {
-                    'name': status_name,
-                    'category': getattr(issue.fields.status, 'statusCategory', {}).get('name', ''),
-                }
-
-        # If we don't find any issues, try getting statuses from the project configuration
-        if not status_names:
-            logger.info(
-                'No issues found, falling back to project configuration for workflow states'
-            )
-            try:
-                # Get available statuses from project metadata
-                status_meta = jira_client.statuses()
-                for status in status_meta:
-                    status_name_lower = status.name.lower()
-                    if status_name_lower not in status_names:
-                        status_names.add(status_name_lower)
-                        status_categories[status_name_lower] = {
-                            'name': status.name,
-                            'category': getattr(status, 'statusCategory', {}).get('name', ''),
-                        }
-            except Exception as e:
-                logger.warning(f'Error getting statuses from project metadata: {str(e)}')
-
-        # Format and return result
-        result = [
-            {
-                'id': '',  # We don't need the ID as per requirements
-                'name': info['name'],
-                'category': info['category'],
-            }
-            for status_key, info in status_categories.items()
-        ]
-
-        logger.debug(f'Found {len(result)} workflow statuses')
-        return result
+        statuses = await _fetch_workflows(request, config_name, project_key, jira_client_service)
+        # The statuses are already plain dicts, so serialize them directly rather than
+        # validating them against the response model again
+        return ORJSONResponse(statuses)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f'Failed to fetch workflow data from JIRA: {str(e)}', exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _jira_failure('Failed to fetch workflow data from JIRA', e)
 
 
 @router.post(
@@ -314,8 +446,9 @@ async def get_jira_workflows(
     description='Retrieves workflow statuses for a project using the provided credentials directly.',
     response_description='List of workflow statuses',
     responses={
-        401: {'description': 'Invalid credentials'},
+        **CREDENTIALS_ERROR_RESPONSES,
         500: {'description': 'Failed to connect to Jira or fetch workflow data'},
+        **JIRA_BUSY_RESPONSES,
     },
 )
 @inject
@@ -343,7 +476,7 @@ async def get_jira_workflows_with_credentials(
     if not project_key:
         raise HTTPException(status_code=400, detail='Project key is required')
 
-    logger.info(f'Fetching workflow data for project: {project_key} using direct credentials')
+    logger.info('Fetching workflow data for project: %s using direct credentials', project_key)
     try:
         # Create a temporary Jira client using the provided credentials
         jira_client = await jira_client_factory.create_client_from_credentials(
@@ -353,80 +486,10 @@ async def get_jira_workflows_with_credentials(
             config_name=credentials.name,
         )
 
-        # Cast to JIRA type to satisfy the type checker
-        jira_real = cast(JIRA, jira_client)
-
-        # Get workflow states from 6 months of historical data
-        logger.info(
-            f'Analyzing historical data for project {project_key} to extract workflow states'
-        )
-
-        # Create a JQL query to get issues from the past 6 months
-        from datetime import datetime, timedelta
-
-        six_months_ago = (datetime.now() - timedelta(days=180)).strftime('%Y-%m-%d')
-
-        # Query for all issues in the project updated in the last 6 months
-        jql_query = f'project = {project_key} AND updated >= {six_months_ago}'
-        logger.info(f'Using JQL: {jql_query}')
-
-        # Get all issues matching the query
-        issues = jira_real.search_issues(
-            jql_query, maxResults=1000, fields=['status', 'statuscategory']
-        )
-        logger.info(f'Found {len(issues)} issues to analyze')
-
-        # Extract all unique status names from issues, with case-insensitive comparison
-        status_names = set()
-        status_categories = {}
-
-        for issue_obj in issues:
-            # Ensure issue is proper type
-            issue = cast(Issue, issue_obj)
-            status_name = issue.fields.status.name
-            # Store status name in lowercase for case-insensitive comparison
-            status_name_lower = status_name.lower()
-            if status_name_lower not in status_names:
-                status_names.add(status_name_lower)
-                # Store the original casing and category
-                status_categories[status_name_lower] = {
-                    'name': status_name,
-                    'category': getattr(issue.fields.status, 'statusCategory', {}).get('name', ''),
-                }
-
-        # If we don't find any issues, try getting statuses from the project configuration
-        if not status_names:
-            logger.info(
-                'No issues found, falling back to project configuration for workflow states'
-            )
-            try:
-                # Get available statuses from project metadata
-                status_meta = jira_real.statuses()
-                for status in status_meta:
-                    status_name_lower = status.name.lower()
-                    if status_name_lower not in status_names:
-                        status_names.add(status_name_lower)
-                        status_categories[status_name_lower] = {
-                            'name': status.name,
-                            'category': getattr(status, 'statusCategory', {}).get('name', ''),
-                        }
-            except Exception as e:
-                logger.warning(f'Error getting statuses from project metadata: {str(e)}')
-
-        # Format and return result
-        result = [
-            {
-                'id': '',  # We don't need the ID as per requirements
-                'name': info['name'],
-                'category': info['category'],
-            }
-            for status_key, info in status_categories.items()
-        ]
-
-        logger.debug(f'Found {len(result)} workflow statuses using direct credentials')
-        return result
+        statuses = await extract_workflow_statuses(jira_client, project_key)
+        # The statuses are already plain dicts, so serialize them without validating them again
+        return ORJSONResponse(statuses)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(
-            f'Failed to fetch workflow data with direct credentials: {str(e)}', exc_info=True
-        )
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _jira_failure('Failed to fetch workflow data with direct credentials', e)
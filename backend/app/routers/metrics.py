@@ -4,13 +4,17 @@ This module defines the metrics endpoints for the API, which calculate
 various metrics for Jira issues.
 """
 
-from typing import Optional
+import functools
+import hashlib
+from itertools import zip_longest
+from typing import Any, Callable, Dict, List, Optional
 
 from dependency_injector.wiring import inject
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials
 
-from ..auth import security
+from ..auth import JWT_COOKIE_NAME, security
 from ..config import Settings, get_settings
 from ..dependencies import get_jira_client_service
 from ..logger import get_logger
@@ -23,6 +27,7 @@ from ..metrics import (
 )
 from ..services.caching import cache_result
 from ..services.jira_client_service import JiraClientService
+from ..services.jira_paginator import fetch_all_issues
 from ..services.jql_validator import validate_jql_query
 
 # Create module-level logger
@@ -32,8 +37,167 @@ logger = get_logger(__name__)
 router = APIRouter(
     prefix='/metrics',
     tags=['Metrics'],
+    default_response_class=ORJSONResponse,
 )
 
+# Issue fields each metric reads, so Jira sends nothing else
+LEAD_TIME_FIELDS = ['created', 'resolutiondate']
+THROUGHPUT_FIELDS = ['resolutiondate', 'status']
+WIP_FIELDS = ['status']
+CFD_FIELDS = ['created', 'resolutiondate', 'status']
+
+# Cycle time only reads the expanded changelog; one small field keeps the issues themselves light
+CYCLE_TIME_FIELDS = ['status']
+
+# Days covered by the cumulative flow diagram
+CFD_PERIOD_DAYS = 30
+
+# Seconds a metric result is cached
+METRICS_CACHE_TTL = 60
+
+
+def _metric_cache_key(metric: str) -> Callable[..., str]:
+    """Build the cache key function of a metric endpoint.
+
+    A result depends on the Jira configuration the caller is authenticated for,
+    which the JWT token names ahead of the config_name parameter. The key covers
+    the JQL query, the parameter and the token, digested so the token is not
+    kept in the cache.
+
+    Args:
+        metric: Name of the metric, used as the key prefix.
+
+    Returns:
+        Callable[..., str]: A function building the cache key from the endpoint arguments.
+    """
+
+    def key_func(*args, **kwargs) -> str:
+        credentials = kwargs.get('credentials')
+        token = kwargs['request'].cookies.get(JWT_COOKIE_NAME) or (
+            credentials.credentials if credentials else None
+        )
+        key = repr((kwargs.get('jql', ''), kwargs.get('config_name'), token))
+        return f'{metric}:{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}'
+
+    return key_func
+
+
+def _orjson_response(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Send a metrics endpoint's result with orjson instead of FastAPI's encoder.
+
+    A plain dict return value is first converted by jsonable_encoder, which walks
+    every CFD data point in Python before orjson runs. Wrapping the result in an
+    ORJSONResponse skips that pass. The wrapped endpoint still returns the dict,
+    so the cache keeps plain data that can be shared through Redis.
+
+    Args:
+        endpoint: The metrics endpoint to wrap.
+
+    Returns:
+        Callable[..., Any]: The endpoint, returning an ORJSONResponse.
+    """
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> ORJSONResponse:
+        return ORJSONResponse(await endpoint(*args, **kwargs))
+
+    return wrapper
+
+
+async def _run_metric(
+    metric: str,
+    jql: str,
+    request: Request,
+    config_name: Optional[str],
+    credentials: Optional[HTTPAuthorizationCredentials],
+    settings: Settings,
+    jira_client_service: JiraClientService,
+    fields: List[str],
+    calculate: Callable[[List[Any]], Dict[str, Any]],
+    expand: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Fetch the issues matching a JQL query and calculate a metric from them.
+
+    Args:
+        metric: Name of the metric, used in log and error messages.
+        jql: JQL query to select issues.
+        request: The FastAPI request object.
+        config_name: Name of the Jira configuration to use.
+        credentials: HTTP authorization credentials from the request.
+        settings: Application settings.
+        jira_client_service: Service for creating Jira client instances.
+        fields: The issue fields the metric reads.
+        calculate: Function calculating the metric from the issues.
+        expand: Optional issue properties to expand, such as the changelog.
+
+    Returns:
+        dict: The metric, or an error message if it could not be calculated from the issues.
+
+    Raises:
+        HTTPException: If the JIRA API request fails.
+    """
+    logger.info('Calculating %s metrics with JQL: %s', metric, jql)
+    try:
+        # Get the JIRA client from the service
+        jira = await jira_client_service.get_client_from_auth(
+            request, credentials, settings, config_name
+        )
+
+        # Validate and sanitize the JQL query
+        sanitized_jql = validate_jql_query(jql)
+
+        logger.debug('Fetching issues from JIRA')
+        try:
+            issues = await fetch_all_issues(jira, sanitized_jql, fields=fields, expand=expand)
+            logger.debug('Found %s issues', len(issues))
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error('Failed to fetch issues from JIRA: %s', e, exc_info=True)
+            raise HTTPException(status_code=500, detail=f'JIRA API error: {str(e)}')
+
+        logger.debug('Calculating %s metrics', metric)
+        result = calculate(issues)
+
+        # Check if there was an error in the calculation
+        if 'error' in result:
+            logger.warning('%s calculation returned error: %s', metric, result['error'])
+        else:
+            logger.info('%s calculation complete', metric)
+        return result
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except Exception as e:
+        logger.error('Failed to calculate %s: %s', metric, e, exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _cfd_data_points(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert CFD data to the format the frontend expects.
+
+    Args:
+        result: CFD data with the dates and the status counts of each date.
+
+    Returns:
+        dict: The statuses and one data point per date, or the result unchanged if
+            it holds an error or has an unexpected format.
+    """
+    if 'error' in result:
+        return result
+    if 'data' not in result or 'dates' not in result:
+        logger.warning('CFD calculation returned unexpected format')
+        return result
+
+    statuses = list(result['data'][0]) if result['data'] else []
+    # Every day counts the same statuses, so each data point is the day's counts
+    # behind its date. Without workflow states there are no counts, only dates.
+    cumulative_data = [
+        {'date': date, **counts}
+        for date, counts in zip_longest(result['dates'], result['data'], fillvalue={})
+    ]
+    return {'statuses': statuses, 'data': cumulative_data}
+
 
 @router.get(
     '/lead-time',
@@ -44,10 +208,15 @@ router = APIRouter(
     responses={
         400: {'description': 'Invalid JQL query or missing configuration name'},
         500: {'description': 'Failed to calculate lead time'},
+        503: {'description': 'Too many concurrent Jira requests'},
     },
 )
+@_orjson_response
 @cache_result(
-    namespace='metrics', key_func=lambda *args, **kwargs: f'lead_time:{kwargs.get("jql", "")}'
+    namespace='metrics',
+    key_func=_metric_cache_key('lead_time'),
+    ttl_seconds=METRICS_CACHE_TTL,
+    shared=True,
 )
 @inject
 async def get_lead_time(
@@ -76,44 +245,17 @@ async def get_lead_time(
     Raises:
         HTTPException: If the JIRA API request fails.
     """
-    logger.info(f'Calculating lead time metrics with JQL: {jql}')
-    try:
-        # Get the JIRA client from the service
-        jira = await jira_client_service.get_client_from_auth(
-            request, credentials, settings, config_name
-        )
-
-        # Validate and sanitize the JQL query
-        sanitized_jql = validate_jql_query(jql)
-
-        logger.debug('Fetching issues from JIRA')
-        try:
-            issues = jira.search_issues(
-                sanitized_jql, maxResults=1000, fields=['created', 'resolutiondate']
-            )
-            logger.debug(f'Found {len(issues)} issues')
-        except Exception as e:
-            logger.error(f'Failed to fetch issues from JIRA: {str(e)}', exc_info=True)
-            raise HTTPException(status_code=500, detail=f'JIRA API error: {str(e)}')
-
-        logger.debug('Calculating lead time metrics')
-        result = calculate_lead_time(list(issues))
-
-        # Check if there was an error in the calculation
-        if 'error' in result:
-            logger.warning(f'Lead time calculation returned error: {result["error"]}')
-            return result
-
-        logger.info(
-            f'Lead time calculation complete: avg={result.get("average")}, median={result.get("median")}'
-        )
-        return result
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f'Failed to calculate lead time: {str(e)}', exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _run_metric(
+        'lead time',
+        jql,
+        request,
+        config_name,
+        credentials,
+        settings,
+        jira_client_service,
+        fields=LEAD_TIME_FIELDS,
+        calculate=calculate_lead_time,
+    )
 
 
 @router.get(
@@ -125,10 +267,15 @@ async def get_lead_time(
     responses={
         400: {'description': 'Invalid JQL query or missing configuration name'},
         500: {'description': 'Failed to calculate throughput'},
+        503: {'description': 'Too many concurrent Jira requests'},
     },
 )
+@_orjson_response
 @cache_result(
-    namespace='metrics', key_func=lambda *args, **kwargs: f'throughput:{kwargs.get("jql", "")}'
+    namespace='metrics',
+    key_func=_metric_cache_key('throughput'),
+    ttl_seconds=METRICS_CACHE_TTL,
+    shared=True,
 )
 @inject
 async def get_throughput(
@@ -157,42 +304,17 @@ async def get_throughput(
     Raises:
         HTTPException: If the JIRA API request fails.
     """
-    logger.info(f'Calculating throughput metrics with JQL: {jql}')
-    try:
-        # Get the JIRA client from the service
-        jira = await jira_client_service.get_client_from_auth(
-            request, credentials, settings, config_name
-        )
-
-        # Validate and sanitize the JQL query
-        sanitized_jql = validate_jql_query(jql)
-
-        logger.debug('Fetching issues from JIRA')
-        try:
-            issues = jira.search_issues(
-                sanitized_jql, maxResults=1000, fields=['created', 'resolutiondate', 'status']
-            )
-            logger.debug(f'Found {len(issues)} issues')
-        except Exception as e:
-            logger.error(f'Failed to fetch issues from JIRA: {str(e)}', exc_info=True)
-            raise HTTPException(status_code=500, detail=f'JIRA API error: {str(e)}')
-
-        logger.debug('Calculating throughput metrics')
-        result = calculate_throughput(list(issues))
-
-        # Check if there was an error in the calculation
-        if 'error' in result:
-            logger.warning(f'Throughput calculation returned error: {result["error"]}')
-            return result
-
-        logger.info(f'Throughput calculation complete: avg={result.get("average")}')
-        return result
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f'Failed to calculate throughput: {str(e)}', exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _run_metric(
+        'throughput',
+        jql,
+        request,
+        config_name,
+        credentials,
+        settings,
+        jira_client_service,
+        fields=THROUGHPUT_FIELDS,
+        calculate=calculate_throughput,
+    )
 
 
 @router.get(
@@ -204,9 +326,16 @@ async def get_throughput(
     responses={
         400: {'description': 'Invalid JQL query or missing configuration name'},
         500: {'description': 'Failed to calculate WIP'},
+        503: {'description': 'Too many concurrent Jira requests'},
     },
 )
-@cache_result(namespace='metrics', key_func=lambda *args, **kwargs: f'wip:{kwargs.get("jql", "")}')
+@_orjson_response
+@cache_result(
+    namespace='metrics',
+    key_func=_metric_cache_key('wip'),
+    ttl_seconds=METRICS_CACHE_TTL,
+    shared=True,
+)
 @inject
 async def get_wip(
     jql: str,
@@ -234,43 +363,20 @@ async def get_wip(
     Raises:
         HTTPException: If the JIRA API request fails.
     """
-    logger.info(f'Calculating WIP metrics with JQL: {jql}')
-    try:
-        # Get the JIRA client from the service
-        jira = await jira_client_service.get_client_from_auth(
-            request, credentials, settings, config_name
-        )
-
-        # Validate and sanitize the JQL query
-        sanitized_jql = validate_jql_query(jql)
-
-        logger.debug('Fetching issues from JIRA')
-        try:
-            issues = jira.search_issues(sanitized_jql, maxResults=1000, fields=['status'])
-            logger.debug(f'Found {len(issues)} issues')
-        except Exception as e:
-            logger.error(f'Failed to fetch issues from JIRA: {str(e)}', exc_info=True)
-            raise HTTPException(status_code=500, detail=f'JIRA API error: {str(e)}')
-
-        workflow_states = settings.workflow_states if hasattr(settings, 'workflow_states') else None
-        logger.debug(f'Using workflow states: {workflow_states}')
-
-        logger.debug('Calculating WIP metrics')
-        result = calculate_wip(list(issues), workflow_states)
-
-        # Check if there was an error in the calculation
-        if 'error' in result:
-            logger.warning(f'WIP calculation returned error: {result["error"]}')
-            return result
-
-        logger.info(f'WIP calculation complete: total={result.get("total")}')
-        return result
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f'Failed to calculate WIP: {str(e)}', exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    workflow_states = getattr(settings, 'workflow_states', None)
+    logger.debug('Using workflow states: %s', workflow_states)
+
+    return await _run_metric(
+        'WIP',
+        jql,
+        request,
+        config_name,
+        credentials,
+        settings,
+        jira_client_service,
+        fields=WIP_FIELDS,
+        calculate=lambda issues: calculate_wip(issues, workflow_states),
+    )
 
 
 @router.get(
@@ -283,10 +389,15 @@ async def get_wip(
     responses={
         400: {'description': 'Invalid JQL query or missing configuration name'},
         500: {'description': 'Failed to calculate cycle time'},
+        503: {'description': 'Too many concurrent Jira requests'},
     },
 )
+@_orjson_response
 @cache_result(
-    namespace='metrics', key_func=lambda *args, **kwargs: f'cycle_time:{kwargs.get("jql", "")}'
+    namespace='metrics',
+    key_func=_metric_cache_key('cycle_time'),
+    ttl_seconds=METRICS_CACHE_TTL,
+    shared=True,
 )
 @inject
 async def get_cycle_time(
@@ -316,61 +427,27 @@ async def get_cycle_time(
     Raises:
         HTTPException: If the JIRA API request fails.
     """
-    logger.info(f'Calculating cycle time metrics with JQL: {jql}')
-    try:
-        # Get the JIRA client from the service
-        jira = await jira_client_service.get_client_from_auth(
-            request, credentials, settings, config_name
-        )
-
-        # Validate and sanitize the JQL query
-        sanitized_jql = validate_jql_query(jql)
-
-        logger.debug('Fetching issues from JIRA with changelog')
-        try:
-            issues = jira.search_issues(
-                sanitized_jql,
-                maxResults=1000,
-                fields=['created', 'resolutiondate', 'status', 'changelog'],
-                expand='changelog',
-            )
-            logger.debug(f'Found {len(issues)} issues')
-        except Exception as e:
-            logger.error(f'Failed to fetch issues from JIRA: {str(e)}', exc_info=True)
-            raise HTTPException(status_code=500, detail=f'JIRA API error: {str(e)}')
-
-        start_state = (
-            settings.cycle_time_start_state
-            if hasattr(settings, 'cycle_time_start_state')
-            else 'In Progress'
-        )
-        end_state = (
-            settings.cycle_time_end_state if hasattr(settings, 'cycle_time_end_state') else 'Done'
-        )
-        logger.debug(f'Using cycle time states: start={start_state}, end={end_state}')
-
-        logger.debug('Calculating cycle time metrics')
-        result = calculate_cycle_time(list(issues), start_state, end_state)
-
-        # Add state information to the result
-        if 'error' not in result:
-            result['start_state'] = start_state
-            result['end_state'] = end_state
-            logger.info(
-                f'Cycle time calculation complete: avg={result.get("average")}, median={result.get("median")}'
-            )
-        else:
-            result['start_state'] = start_state
-            result['end_state'] = end_state
-            logger.warning(f'Cycle time calculation returned error: {result.get("error")}')
-
-        return result
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f'Failed to calculate cycle time: {str(e)}', exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    start_state = getattr(settings, 'cycle_time_start_state', 'In Progress')
+    end_state = getattr(settings, 'cycle_time_end_state', 'Done')
+    logger.debug('Using cycle time states: start=%s, end=%s', start_state, end_state)
+
+    def calculate(issues: List[Any]) -> Dict[str, Any]:
+        result = calculate_cycle_time(issues, start_state, end_state)
+        # Report the states the cycle is measured between, also when it could not be measured
+        return {**result, 'start_state': start_state, 'end_state': end_state}
+
+    return await _run_metric(
+        'cycle time',
+        jql,
+        request,
+        config_name,
+        credentials,
+        settings,
+        jira_client_service,
+        fields=CYCLE_TIME_FIELDS,
+        calculate=calculate,
+        expand='changelog',
+    )
 
 
 @router.get(
@@ -384,9 +461,16 @@ async def get_cycle_time(
     responses={
         400: {'description': 'Invalid JQL query or missing configuration name'},
         500: {'description': 'Failed to generate CFD'},
+        503: {'description': 'Too many concurrent Jira requests'},
     },
 )
-@cache_result(namespace='metrics', key_func=lambda *args, **kwargs: f'cfd:{kwargs.get("jql", "")}')
+@_orjson_response
+@cache_result(
+    namespace='metrics',
+    key_func=_metric_cache_key('cfd'),
+    ttl_seconds=METRICS_CACHE_TTL,
+    shared=True,
+)
 @inject
 async def get_cfd(
     jql: str,
@@ -416,61 +500,19 @@ async def get_cfd(
     Raises:
         HTTPException: If the JIRA API request fails.
     """
-    logger.info(f'Generating CFD data with JQL: {jql}')
-    try:
-        # Get the JIRA client from the service
-        jira = await jira_client_service.get_client_from_auth(
-            request, credentials, settings, config_name
-        )
-
-        # Validate and sanitize the JQL query
-        sanitized_jql = validate_jql_query(jql)
-
-        logger.debug('Fetching issues from JIRA')
-        try:
-            issues = jira.search_issues(
-                sanitized_jql,
-                maxResults=1000,
-                fields=['status', 'created', 'resolutiondate'],
-            )
-            logger.debug(f'Found {len(issues)} issues')
-        except Exception as e:
-            logger.error(f'Failed to fetch issues from JIRA: {str(e)}', exc_info=True)
-            raise HTTPException(status_code=500, detail=f'JIRA API error: {str(e)}')
-
-        workflow_states = settings.workflow_states if hasattr(settings, 'workflow_states') else None
-        period_days = 30  # Default to 30 days
-        logger.debug(f'Using workflow states: {workflow_states}, period: {period_days} days')
-
-        logger.debug('Calculating CFD data')
-        result = calculate_cfd(list(issues), workflow_states, period_days)
-
-        # Check if there was an error in the calculation
-        if 'error' in result:
-            logger.warning(f'CFD calculation returned error: {result["error"]}')
-            return result
-
-        # Convert to the expected format for the frontend
-        if 'data' in result and 'dates' in result:
-            statuses = list(result['data'][0].keys()) if result['data'] else []
-            cumulative_data = []
-
-            for i, date in enumerate(result['dates']):
-                data_point = {'date': date}
-                for status in statuses:
-                    data_point[status] = result['data'][i][status]
-                cumulative_data.append(data_point)
-
-            logger.info(
-                f'CFD calculation complete: {len(statuses)} statuses, {len(result["dates"])} dates'
-            )
-            return {'statuses': statuses, 'data': cumulative_data}
-
-        logger.warning('CFD calculation returned unexpected format')
-        return result
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f'Failed to generate CFD: {str(e)}', exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    workflow_states = getattr(settings, 'workflow_states', None)
+    logger.debug('Using workflow states: %s, period: %s days', workflow_states, CFD_PERIOD_DAYS)
+
+    return await _run_metric(
+        'CFD',
+        jql,
+        request,
+        config_name,
+        credentials,
+        settings,
+        jira_client_service,
+        fields=CFD_FIELDS,
+        calculate=lambda issues: _cfd_data_points(
+            calculate_cfd(issues, workflow_states, CFD_PERIOD_DAYS)
+        ),
+    )
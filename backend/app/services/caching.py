@@ -4,12 +4,17 @@ This module provides caching functionality for the API, allowing
 expensive operations to be cached for improved performance.
 """
 
+import asyncio
 import datetime
 import functools
 import os
-from typing import Any, Callable, Dict, Optional, TypeVar
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TypeVar
+
+import orjson
 
 from ..logger import get_logger
+from .redis_client import get_redis_client
 
 # Create module-level logger
 logger = get_logger(__name__)
@@ -17,35 +22,169 @@ logger = get_logger(__name__)
 # Type variable for generic functions
 T = TypeVar('T')
 
+# Number of shards per namespace, a power of two so a shard is picked with a mask
+SHARD_COUNT = 16
+
+
+class ShardedCache:
+    """Cache namespace split across several dictionaries.
+
+    Keys are spread over ``SHARD_COUNT`` dictionaries by hash. Clearing the cache
+    rebinds every shard to a new empty dictionary instead of emptying the
+    existing one, so a reader holding a shard keeps a consistent view and writes
+    to different shards never touch the same dictionary.
+
+    A cache created with ``max_entries`` keeps each shard in least recently used
+    order and drops the oldest entry of a shard once it holds its share of the
+    limit.
+
+    Attributes:
+        shards: The dictionaries holding the cache entries.
+        shard_limit: The most entries a shard holds, or None if unbounded.
+    """
+
+    __slots__ = ('shards', 'shard_limit')
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: The most entries to keep, or None to keep every entry.
+        """
+        self.shard_limit = -(-max_entries // SHARD_COUNT) if max_entries else None
+        self.shards = self._empty_shards()
+
+    def _empty_shards(self) -> List[Dict[str, Any]]:
+        """Create empty shards.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per shard, ordered by use if bounded.
+        """
+        if self.shard_limit is None:
+            return [{} for _ in range(SHARD_COUNT)]
+        return [OrderedDict() for _ in range(SHARD_COUNT)]
+
+    def _shard(self, key: str) -> Dict[str, Any]:
+        """Get the shard holding a key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Dict[str, Any]: The shard the key belongs to.
+        """
+        return self.shards[hash(key) & (SHARD_COUNT - 1)]
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cache entry.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Optional[Any]: The cache entry, or None if the key is not cached.
+        """
+        shard = self._shard(key)
+        value = shard.get(key)
+        if value is not None and self.shard_limit is not None:
+            shard.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a cache entry.
+
+        Args:
+            key: The cache key.
+            value: The cache entry.
+        """
+        shard = self._shard(key)
+        shard[key] = value
+        if self.shard_limit is not None:
+            shard.move_to_end(key)
+            if len(shard) > self.shard_limit:
+                shard.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        self.shards = self._empty_shards()
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is cached."""
+        return key in self._shard(key)
+
+    def __len__(self) -> int:
+        """Count the cache entries."""
+        return sum(len(shard) for shard in self.shards)
+
+
+# Most metric results kept in memory, one per metric, query and caller
+METRICS_CACHE_ENTRIES = 1024
+
 # Simple in-memory cache
-_cache: Dict[str, Dict[str, Any]] = {
-    'configurations': {},
-    'metrics': {},
+_cache: Dict[str, ShardedCache] = {
+    'configurations': ShardedCache(),
+    'metrics': ShardedCache(max_entries=METRICS_CACHE_ENTRIES),
+    'jira_projects': ShardedCache(),
+    'jira_workflows': ShardedCache(),
+    'jira_connections': ShardedCache(),
 }
 
+# Namespace and cache key -> call currently computing that entry, shared by concurrent misses
+_inflight: Dict[str, asyncio.Future] = {}
+
+# Refreshes of stale entries running in the background
+_refreshing: Set[asyncio.Task] = set()
+
 # Check if we're running in test mode
 IS_TEST_ENV = os.environ.get('USE_MOCK_JIRA', 'false').lower() == 'true'
 
 # Flag to enable/disable caching
 CACHING_ENABLED = not IS_TEST_ENV
 
+# Redis channel used to tell every worker to clear cache namespaces
+CACHE_INVALIDATION_CHANNEL = 'cache-invalidate'
+
+# Message on the invalidation channel that clears every namespace
+ALL_NAMESPACES = '*'
+
+# Prefix of the Redis keys holding cache entries shared between workers
+SHARED_CACHE_PREFIX = 'cache:'
+
 
 def get_cache():
     """Get the cache dictionary.
 
     Returns:
-        Dict[str, Dict[str, Any]]: The cache dictionary.
+        Dict[str, ShardedCache]: The cache dictionary.
     """
     return _cache
 
 
-def cache_result(namespace: str, key_func: Optional[Callable] = None, ttl_seconds: int = 300):
+def cache_result(
+    namespace: str,
+    key_func: Optional[Callable] = None,
+    ttl_seconds: int = 300,
+    stale_seconds: int = 0,
+    shared: bool = False,
+):
     """Cache the result of a function call.
 
+    An entry older than ``ttl_seconds`` but within ``stale_seconds`` after that
+    is still returned, while the function runs again in the background to
+    refresh it. The refresh reuses the arguments of the call that found the
+    entry stale, so only enable this for functions whose arguments remain
+    usable after the request has been answered.
+
+    Shared results are also stored in Redis, when it is configured, so every
+    worker can answer from them and they survive restarts. They must be JSON
+    serializable.
+
     Args:
         namespace: The namespace to store the cache in.
         key_func: A function that returns a cache key based on the function arguments.
         ttl_seconds: Time to live for the cache entry in seconds.
+        stale_seconds: How long after expiring an entry is served while it is refreshed.
+        shared: Whether to share the cache entries between workers through Redis.
 
     Returns:
         Callable: The decorated function.
@@ -56,13 +195,13 @@ def cache_result(namespace: str, key_func: Optional[Callable] = None, ttl_second
         async def wrapper(*args, **kwargs):
             # Skip caching in test environment or if explicitly disabled
             if not CACHING_ENABLED:
-                logger.debug(f'Caching disabled, executing function directly: {func.__name__}')
+                logger.debug('Caching disabled, executing function directly: %s', func.__name__)
                 return await func(*args, **kwargs)
 
             # Check for test-specific request header
             request = next((arg for arg in args if hasattr(arg, 'headers')), None)
             if request and hasattr(request, 'headers') and 'x-test-request' in request.headers:
-                logger.debug(f'Test request detected, skipping cache for: {func.__name__}')
+                logger.debug('Test request detected, skipping cache for: %s', func.__name__)
                 return await func(*args, **kwargs)
 
             # Generate cache key
@@ -72,54 +211,180 @@ def cache_result(namespace: str, key_func: Optional[Callable] = None, ttl_second
             else:
                 # Default key is the function name and arguments
                 cache_key = f'{func.__name__}:{str(args)}:{str(kwargs)}'
+            inflight_key = f'{namespace}:{cache_key}'
 
-            # Check if result is in cache
-            if namespace in _cache and cache_key in _cache[namespace]:
-                cache_entry = _cache[namespace][cache_key]
+            # Ensure namespace exists
+            cache = _cache.get(namespace)
+            if cache is None:
+                cache = _cache.setdefault(namespace, ShardedCache())
+
+            async def compute(future: asyncio.Future) -> Any:
+                # Execute function and cache result, sharing the outcome with waiting callers
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    future.set_exception(e)
+                    # Waiting callers re-raise the error, so it is never left unretrieved
+                    future.exception()
+                    raise
+                else:
+                    future.set_result(result)
+                finally:
+                    del _inflight[inflight_key]
+                    if not future.done():
+                        future.cancel()
+
+                # Store result in cache
+                entry = {
+                    'data': result,
+                    'timestamp': datetime.datetime.now().timestamp(),
+                }
+                cache.set(cache_key, entry)
+                if shared:
+                    await _store_shared(inflight_key, entry, ttl_seconds + stale_seconds)
+                logger.debug('Cache miss for %s:%s, stored result', namespace, cache_key)
+                return result
+
+            def start() -> asyncio.Future:
+                # Register the call before it runs so concurrent callers find it
+                future = asyncio.get_running_loop().create_future()
+                _inflight[inflight_key] = future
+                return future
+
+            # Check if result is in cache, falling back to the entries shared by other workers
+            cache_entry = cache.get(cache_key)
+            if cache_entry is None and shared:
+                cache_entry = await _load_shared(inflight_key)
+                if cache_entry is not None:
+                    cache.set(cache_key, cache_entry)
+            if cache_entry is not None:
                 # Check if cache entry is still valid
-                if datetime.datetime.now().timestamp() - cache_entry['timestamp'] < ttl_seconds:
-                    logger.debug(f'Cache hit for {namespace}:{cache_key}')
+                age = datetime.datetime.now().timestamp() - cache_entry['timestamp']
+                if age < ttl_seconds:
+                    logger.debug('Cache hit for %s:%s', namespace, cache_key)
+                    return cache_entry['data']
+                if age < ttl_seconds + stale_seconds:
+                    # Serve the stale entry and refresh it unless a refresh is already running
+                    logger.debug('Stale cache hit for %s:%s', namespace, cache_key)
+                    if inflight_key not in _inflight:
+                        _refresh_in_background(inflight_key, compute(start()))
                     return cache_entry['data']
 
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-
-            # Ensure namespace exists
-            if namespace not in _cache:
-                _cache[namespace] = {}
-
-            # Store result in cache
-            _cache[namespace][cache_key] = {
-                'data': result,
-                'timestamp': datetime.datetime.now().timestamp(),
-            }
-            logger.debug(f'Cache miss for {namespace}:{cache_key}, stored result')
+            # Wait for a call already computing the same entry instead of repeating it
+            inflight = _inflight.get(inflight_key)
+            if inflight is not None:
+                try:
+                    return await asyncio.shield(inflight)
+                except asyncio.CancelledError:
+                    # Only compute the entry ourselves if the shared call was cancelled
+                    if not inflight.cancelled():
+                        raise
+                    return await func(*args, **kwargs)
 
-            return result
+            return await compute(start())
 
         return wrapper
 
     return decorator
 
 
+def _refresh_in_background(key: str, refresh: Awaitable[Any]) -> None:
+    """Run a cache refresh without waiting for it.
+
+    Args:
+        key: The namespace and cache key being refreshed, used for logging.
+        refresh: The call computing and storing the new entry.
+    """
+
+    async def run():
+        try:
+            await refresh
+        except Exception as e:
+            logger.warning('Failed to refresh cache entry %s: %s', key, e)
+
+    task = asyncio.create_task(run())
+    # Keep a reference so the task is not garbage collected before it finishes
+    _refreshing.add(task)
+    task.add_done_callback(_refreshing.discard)
+
+
+async def _load_shared(key: str) -> Optional[Dict[str, Any]]:
+    """Read a cache entry shared through Redis.
+
+    Args:
+        key: The namespace and cache key of the entry.
+
+    Returns:
+        Optional[Dict[str, Any]]: The cache entry, or None if Redis is not configured,
+            holds no entry for the key or cannot be reached.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return None
+
+    try:
+        value = await redis.get(SHARED_CACHE_PREFIX + key)
+    except Exception as e:
+        logger.warning('Failed to read shared cache entry %s: %s', key, e)
+        return None
+    return orjson.loads(value) if value is not None else None
+
+
+async def _store_shared(key: str, entry: Dict[str, Any], ttl_seconds: int) -> None:
+    """Store a cache entry in Redis to share it with the other workers.
+
+    Args:
+        key: The namespace and cache key of the entry.
+        entry: The cache entry.
+        ttl_seconds: How long Redis keeps the entry.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return
+
+    try:
+        value = orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY)
+        await redis.set(SHARED_CACHE_PREFIX + key, value, ex=ttl_seconds)
+    except Exception as e:
+        logger.warning('Failed to store shared cache entry %s: %s', key, e)
+
+
+async def _clear_shared(*namespaces: str) -> None:
+    """Delete the cache entries shared through Redis.
+
+    Args:
+        namespaces: The namespaces to clear. If none are given, all shared entries are deleted.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return
+
+    patterns = [f'{SHARED_CACHE_PREFIX}{namespace}:*' for namespace in namespaces]
+    try:
+        for pattern in patterns or [f'{SHARED_CACHE_PREFIX}*']:
+            keys = [key async for key in redis.scan_iter(match=pattern)]
+            if keys:
+                await redis.unlink(*keys)
+    except Exception as e:
+        logger.warning('Failed to clear shared cache entries: %s', e)
+
+
 def clear_cache(namespace: Optional[str] = None):
     """Clear the cache.
 
     Args:
         namespace: Optional namespace to clear. If not provided, all caches are cleared.
     """
-    global _cache
-
     if namespace:
         if namespace in _cache:
-            _cache[namespace] = {}
-            logger.info(f'Cleared cache for namespace: {namespace}')
+            _cache[namespace].clear()
+            logger.info('Cleared cache for namespace: %s', namespace)
         else:
-            logger.warning(f'Cache namespace not found: {namespace}')
+            logger.warning('Cache namespace not found: %s', namespace)
     else:
         # Clear all caches
-        for ns in _cache:
-            _cache[ns] = {}
+        for cache in _cache.values():
+            cache.clear()
         logger.info('Cleared all caches')
 
 
@@ -131,4 +396,79 @@ def enable_caching(enabled: bool = True):
     """
     global CACHING_ENABLED
     CACHING_ENABLED = enabled
-    logger.info(f'Caching {"enabled" if enabled else "disabled"}')
+    logger.info('Caching %s', 'enabled' if enabled else 'disabled')
+
+
+async def publish_cache_invalidation(*namespaces: str):
+    """Tell the other workers to clear cache namespaces.
+
+    Each worker keeps its own in-memory cache, so clearing it in one worker
+    leaves stale entries in the others. When Redis is configured, one message
+    per namespace is published on the invalidation channel in a single pipelined
+    round trip. Without Redis there is only one cache to clear and nothing is sent.
+
+    Args:
+        namespaces: The namespaces to clear. If none are given, all caches are cleared.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return
+
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            for namespace in namespaces or (ALL_NAMESPACES,):
+                pipe.publish(CACHE_INVALIDATION_CHANNEL, namespace)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning('Failed to publish cache invalidation: %s', e)
+
+
+async def clear_caches(*namespaces: str):
+    """Clear cache namespaces in this worker and every other worker.
+
+    The namespaces are cleared locally, then a single pipelined publish tells
+    the other workers to clear them too, so invalidating several namespaces
+    costs one Redis round trip. Entries shared through Redis are deleted first,
+    so no worker reloads them once its own copy is gone.
+
+    Args:
+        namespaces: The namespaces to clear. If none are given, all caches are cleared.
+    """
+    await _clear_shared(*namespaces)
+    if namespaces:
+        for namespace in namespaces:
+            clear_cache(namespace)
+    else:
+        clear_cache()
+    await publish_cache_invalidation(*namespaces)
+
+
+async def listen_for_cache_invalidation():
+    """Clear cache namespaces as other workers publish invalidations.
+
+    Runs until cancelled. Returns immediately when Redis is not configured.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return
+
+    pubsub = redis.pubsub()
+    try:
+        await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+        logger.info('Listening for cache invalidations on: %s', CACHE_INVALIDATION_CHANNEL)
+        async for message in pubsub.listen():
+            if message.get('type') != 'message':
+                continue
+
+            namespace = message['data']
+            if isinstance(namespace, bytes):
+                namespace = namespace.decode()
+
+            if namespace == ALL_NAMESPACES:
+                clear_cache()
+            elif namespace in _cache:
+                clear_cache(namespace)
+    except Exception as e:
+        logger.error('Stopped listening for cache invalidations: %s', e, exc_info=True)
+    finally:
+        await pubsub.aclose()
@@ -56,10 +56,10 @@ class ConfigurationService:
         Returns:
             PaginatedResponse[JiraConfigurationList]: Paginated list of configurations.
         """
-        logger.info(f'Getting all configurations with pagination: skip={skip}, limit={limit}')
+        logger.info('Getting all configurations with pagination: skip=%s, limit=%s', skip, limit)
         configs = await self.repository.get_all(skip, limit)
         total = await self.repository.count()
-        logger.debug(f'Found {len(configs)} configurations (total: {total})')
+        logger.debug('Found %s configurations (total: %s)', len(configs), total)
 
         # Create a properly typed response using type annotation
         result: Dict[str, Any] = {
@@ -83,15 +83,15 @@ class ConfigurationService:
         Raises:
             HTTPException: If the configuration is not found.
         """
-        logger.info(f'Getting configuration: {name}')
+        logger.info('Getting configuration: %s', name)
         config = await self.repository.get_by_name(name)
         if not config:
-            logger.warning(f'Configuration not found: {name}')
+            logger.warning('Configuration not found: %s', name)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Configuration '{name}' not found",
             )
-        logger.debug(f'Configuration found: {name}')
+        logger.debug('Configuration found: %s', name)
         # Cast the model to the schema type
         return cast(JiraConfigSchema, config)
 
@@ -107,7 +107,7 @@ class ConfigurationService:
         Raises:
             HTTPException: If the configuration creation fails.
         """
-        logger.info(f'Creating new configuration: {config.name}')
+        logger.info('Creating new configuration: %s', config.name)
 
         # Validate project_key is present
         if not config.project_key:
@@ -122,7 +122,7 @@ class ConfigurationService:
             # Cast the model to the schema type
             return cast(JiraConfigSchema, result)
         except Exception as e:
-            logger.error(f'Failed to create configuration: {str(e)}', exc_info=True)
+            logger.error('Failed to create configuration: %s', e, exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f'Could not create configuration: {str(e)}',
@@ -141,23 +141,23 @@ class ConfigurationService:
         Raises:
             HTTPException: If the configuration is not found or update fails.
         """
-        logger.info(f'Updating configuration: {name}')
+        logger.info('Updating configuration: %s', name)
         try:
             updated_config = await self.repository.update(name, config)
             if not updated_config:
-                logger.warning(f'Configuration not found: {name}')
+                logger.warning('Configuration not found: %s', name)
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Configuration '{name}' not found",
                 )
-            logger.info(f'Configuration updated successfully: {name}')
+            logger.info('Configuration updated successfully: %s', name)
             # Cast the model to the schema type
             return cast(JiraConfigSchema, updated_config)
         except HTTPException:
             # Re-raise HTTP exceptions
             raise
         except Exception as e:
-            logger.error(f'Failed to update configuration: {str(e)}', exc_info=True)
+            logger.error('Failed to update configuration: %s', e, exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f'Could not update configuration: {str(e)}',
@@ -172,21 +172,21 @@ class ConfigurationService:
         Raises:
             HTTPException: If the configuration is not found or deletion fails.
         """
-        logger.info(f'Deleting configuration: {name}')
+        logger.info('Deleting configuration: %s', name)
         try:
             success = await self.repository.delete(name)
             if not success:
-                logger.warning(f'Configuration not found: {name}')
+                logger.warning('Configuration not found: %s', name)
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Configuration '{name}' not found",
                 )
-            logger.info(f'Configuration deleted successfully: {name}')
+            logger.info('Configuration deleted successfully: %s', name)
         except HTTPException:
             # Re-raise HTTP exceptions
             raise
         except Exception as e:
-            logger.error(f'Failed to delete configuration: {str(e)}', exc_info=True)
+            logger.error('Failed to delete configuration: %s', e, exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f'Could not delete configuration: {str(e)}',
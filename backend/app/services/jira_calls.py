@@ -0,0 +1,103 @@
+"""Bounded execution of blocking Jira client calls.
+
+This module runs the synchronous Jira client's calls in a dedicated thread pool,
+limiting how many run at once so a burst of requests cannot flood Jira or take
+the threads other blocking work runs on.
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from fastapi import HTTPException
+
+from ..config import get_settings
+from ..logger import get_logger
+
+# Create module-level logger
+logger = get_logger(__name__)
+
+# Type variable for the result of a Jira call
+T = TypeVar('T')
+
+# Limits the Jira calls running in worker threads, created on first use from the settings
+_semaphore: Optional[asyncio.Semaphore] = None
+
+# Threads the Jira calls run in, one per slot, created on first use from the settings
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent Jira calls.
+
+    Returns:
+        asyncio.Semaphore: The semaphore, sized by the jira_max_concurrent_calls setting.
+    """
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(get_settings().jira_max_concurrent_calls)
+    return _semaphore
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the thread pool Jira calls run in.
+
+    The pool has a thread for every slot, so an admitted call never queues behind
+    other blocking work in the event loop's default executor, whose size depends
+    on the CPU count.
+
+    Returns:
+        ThreadPoolExecutor: The pool, sized by the jira_max_concurrent_calls setting.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=get_settings().jira_max_concurrent_calls, thread_name_prefix='jira'
+        )
+    return _executor
+
+
+def shutdown_jira_calls() -> None:
+    """Shut down the Jira call thread pool, waiting for running calls to finish."""
+    global _executor, _semaphore
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+    _executor = None
+    _semaphore = None
+
+
+async def run_jira_call(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking Jira client call in a worker thread.
+
+    The call waits for one of a limited number of slots. If no slot frees up
+    within the jira_call_wait_seconds setting, the request fails fast instead of
+    queueing behind other Jira calls.
+
+    Args:
+        func: The blocking function to call.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        The result of the call.
+
+    Raises:
+        HTTPException: If no slot became free in time.
+    """
+    semaphore = _get_semaphore()
+    try:
+        await asyncio.wait_for(semaphore.acquire(), get_settings().jira_call_wait_seconds)
+    except asyncio.TimeoutError:
+        logger.warning('Timed out waiting for a free Jira call slot')
+        raise HTTPException(
+            status_code=503, detail='Too many concurrent Jira requests, please try again'
+        )
+    try:
+        # Run the call with the caller's context, as asyncio.to_thread does
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), call)
+    finally:
+        semaphore.release()
@@ -4,14 +4,21 @@ This module provides a factory for creating Jira clients, either real or mock
 depending on the environment.
 """
 
+import asyncio
+import hashlib
 import os
-from typing import Optional, Tuple, Union
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
 
 from jira import JIRA
+from requests.adapters import HTTPAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import get_settings
 from ..logger import get_logger
 from ..mock_jira import MockJira
+from .jira_calls import run_jira_call
 
 # Check if we're running in test mode
 USE_MOCK_JIRA = os.environ.get('USE_MOCK_JIRA', 'false').lower() == 'true'
@@ -19,12 +26,62 @@ USE_MOCK_JIRA = os.environ.get('USE_MOCK_JIRA', 'false').lower() == 'true'
 # Create module-level logger
 logger = get_logger(__name__)
 
+# Seconds a Jira client is reused before a new one is built, like a connection pool's recycle time
+CLIENT_POOL_RECYCLE = 1800
+
+# Maximum number of Jira clients kept for reuse
+CLIENT_POOL_SIZE = 64
+
+# Digest of the server and credentials -> (expiry time, client), least recently used first
+_client_pool: 'OrderedDict[bytes, Tuple[float, JIRA]]' = OrderedDict()
+
+# Digest of the server and credentials -> client currently being built for them
+_pending_clients: 'Dict[bytes, asyncio.Future[JIRA]]' = {}
+
+
+def clear_client_pool() -> None:
+    """Close and drop every pooled Jira client, so the next request builds a new one."""
+    for _, client in _client_pool.values():
+        client.close()
+    _client_pool.clear()
+
+
+def _size_connection_pool(client: JIRA) -> None:
+    """Let a Jira client keep a connection open for every concurrent Jira call.
+
+    requests keeps at most 10 connections per host by default, so concurrent calls
+    beyond that open connections that are discarded afterwards, each paying for a
+    new TLS handshake.
+
+    Args:
+        client: The Jira client whose HTTP session is resized.
+    """
+    adapter = HTTPAdapter(pool_maxsize=get_settings().jira_max_concurrent_calls)
+    client._session.mount('https://', adapter)
+    client._session.mount('http://', adapter)
+
+
+def _client_key(server: str, auth: Tuple[str, str]) -> bytes:
+    """Hash a server and credentials so clients can be pooled without keeping the API token.
+
+    Args:
+        server: Jira server URL.
+        auth: Tuple of (email, api_token) for authentication.
+
+    Returns:
+        bytes: A digest identifying the server, email and API token.
+    """
+    key = f'{server}|{auth[0]}|{auth[1]}'
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
 
 class JiraClientFactory:
     """Factory for creating Jira clients.
 
     This class provides methods for creating either real or mock Jira clients
-    depending on the environment.
+    depending on the environment. Real clients are pooled per process and reused
+    for the same server and credentials, so their HTTP sessions and connections
+    outlive a single request.
     """
 
     def __init__(self, session: Optional[AsyncSession] = None):
@@ -55,11 +112,56 @@ class JiraClientFactory:
             JIRA: A Jira client instance (either real or mock).
         """
         if USE_MOCK_JIRA:
-            logger.info(f'Creating mock JIRA client for configuration: {config_name or "unnamed"}')
+            logger.info('Creating mock JIRA client for configuration: %s', config_name or 'unnamed')
             return MockJira(server=server, basic_auth=auth)
 
-        logger.debug(f'Creating real JIRA client for configuration: {config_name or "unnamed"}')
-        return JIRA(server=server, basic_auth=auth)
+        key = _client_key(server, auth)
+
+        # Reuse a pooled client until it is due to be recycled
+        pooled = _client_pool.get(key)
+        if pooled is not None:
+            expiry, client = pooled
+            if expiry > time.monotonic():
+                _client_pool.move_to_end(key)
+                return client
+            del _client_pool[key]
+            # Close the recycled client so its pooled connections are released
+            client.close()
+
+        # Wait for a client already being built for the same credentials
+        pending = _pending_clients.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only build our own client if the shared build was cancelled
+                if not pending.cancelled():
+                    raise
+
+        logger.debug('Creating real JIRA client for configuration: %s', config_name or 'unnamed')
+        future: 'asyncio.Future[JIRA]' = asyncio.get_running_loop().create_future()
+        _pending_clients[key] = future
+        try:
+            # The client fetches server info over blocking HTTP, so build it off the event loop
+            client = await run_jira_call(JIRA, server=server, basic_auth=auth)
+            _size_connection_pool(client)
+        except Exception as e:
+            future.set_exception(e)
+            # Waiting callers re-raise the error, so it is never left unretrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(client)
+        finally:
+            del _pending_clients[key]
+            if not future.done():
+                future.cancel()
+
+        _client_pool[key] = (time.monotonic() + CLIENT_POOL_RECYCLE, client)
+        if len(_client_pool) > CLIENT_POOL_SIZE:
+            _, (_, evicted) = _client_pool.popitem(last=False)
+            evicted.close()
+        return client
 
     async def create_client_from_credentials(
         self,
@@ -15,7 +15,7 @@ from ..auth import get_current_config_name
 from ..config import Settings
 from ..logger import get_logger
 from ..mock_jira import MockJira
-from ..repositories.jira_client_repository import JiraClientRepository
+from ..repositories.configuration_repository import ConfigurationRepository
 from .jira_client_factory import JiraClientFactory
 
 # Create module-level logger
@@ -33,7 +33,7 @@ class JiraClientService:
         self,
         session: AsyncSession,
         jira_client_factory: JiraClientFactory,
-        repository: JiraClientRepository,
+        repository: ConfigurationRepository,
     ):
         """Initialize the Jira client service.
 
@@ -70,6 +70,33 @@ class JiraClientService:
         Raises:
             HTTPException: If authentication fails, configuration is not found, or connection fails.
         """
+        config_name = await self.resolve_config_name(request, credentials, settings, config_name)
+        return await self.get_client_by_config_name(config_name)
+
+    async def resolve_config_name(
+        self,
+        request: Request,
+        credentials: Optional[HTTPAuthorizationCredentials],
+        settings: Settings,
+        config_name: Optional[str] = None,
+    ) -> str:
+        """Resolve the configuration name a request is authenticated for.
+
+        The configuration name in the JWT token takes priority over the one
+        passed as a query parameter.
+
+        Args:
+            request: FastAPI request object to access cookies.
+            credentials: JWT token credentials containing the configuration name.
+            settings: Application settings for JWT configuration.
+            config_name: Optional name of a stored Jira configuration to use.
+
+        Returns:
+            str: The configuration name.
+
+        Raises:
+            HTTPException: If no configuration name can be resolved.
+        """
         # First try to get the config_name from the JWT token
         token_config_name = None
         try:
@@ -95,7 +122,7 @@ class JiraClientService:
                 detail='Authentication required. Please provide a valid JWT token.',
             )
 
-        return await self.get_client_by_config_name(config_name)
+        return config_name
 
     async def get_client_by_config_name(self, config_name: str) -> Union[JIRA, MockJira]:
         """Get a Jira client using a configuration name.
@@ -111,14 +138,14 @@ class JiraClientService:
         Raises:
             HTTPException: If configuration is not found or connection fails.
         """
-        logger.debug(f'Creating JIRA client using configuration: {config_name}')
+        logger.debug('Creating JIRA client using configuration: %s', config_name)
 
         try:
             # Use repository to fetch configuration
             config = await self.repository.get_by_name(config_name)
 
             if not config:
-                logger.warning(f'Configuration not found: {config_name}')
+                logger.warning('Configuration not found: %s', config_name)
                 raise HTTPException(
                     status_code=404, detail=f"Configuration '{config_name}' not found"
                 )
@@ -131,11 +158,11 @@ class JiraClientService:
                 config_name=config_name,
             )
 
-            logger.info(f'Successfully connected to JIRA using configuration: {config_name}')
+            logger.info('Successfully connected to JIRA using configuration: %s', config_name)
             return jira_client
 
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f'Failed to connect to JIRA: {str(e)}', exc_info=True)
+            logger.error('Failed to connect to JIRA: %s', e, exc_info=True)
             raise HTTPException(status_code=500, detail=f'Failed to connect to Jira: {str(e)}')
@@ -0,0 +1,87 @@
+"""Concurrent paging through Jira issue searches.
+
+Jira returns search results in pages of at most 100 issues, and the Jira client
+fetches the pages of a large search one after another. This module fetches the
+first page to learn how many issues match, then requests the remaining pages
+concurrently.
+"""
+
+import asyncio
+from typing import Any, List, Optional
+
+from ..logger import get_logger
+from .jira_calls import run_jira_call
+
+# Create module-level logger
+logger = get_logger(__name__)
+
+# Issues requested per page, the most Jira Cloud returns in one response
+PAGE_SIZE = 100
+
+# Pages of one search fetched at once, so a single search cannot take every Jira call slot
+MAX_CONCURRENT_PAGES = 4
+
+# Most issues fetched for one search
+MAX_ISSUES = 1000
+
+
+async def fetch_all_issues(
+    jira: Any,
+    jql: str,
+    fields: List[str],
+    expand: Optional[str] = None,
+    max_results: int = MAX_ISSUES,
+) -> List[Any]:
+    """Fetch the issues matching a JQL query, requesting the pages concurrently.
+
+    If Jira returns fewer issues per page than requested, the remaining pages
+    are requested with the size Jira used. Each call gets its own copy of the
+    field list, because the Jira client rewrites field names in place.
+
+    Args:
+        jira: The Jira client.
+        jql: The sanitized JQL query.
+        fields: The issue fields to fetch.
+        expand: Optional issue properties to expand, such as the changelog.
+        max_results: The most issues to fetch.
+
+    Returns:
+        List[Any]: The matching issues, in the order Jira returned them.
+
+    Raises:
+        HTTPException: If no Jira call slot frees up in time.
+    """
+    # The first page tells how many issues match and how many Jira returns per page
+    first = await run_jira_call(
+        jira.search_issues,
+        jql,
+        startAt=0,
+        maxResults=min(PAGE_SIZE, max_results),
+        fields=list(fields),
+        expand=expand,
+    )
+    issues = list(first)
+    total = min(getattr(first, 'total', len(issues)), max_results)
+    page_size = len(issues)
+    if not page_size or page_size >= total:
+        return issues
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+    async def fetch_page(start: int) -> List[Any]:
+        async with semaphore:
+            return await run_jira_call(
+                jira.search_issues,
+                jql,
+                startAt=start,
+                maxResults=min(page_size, total - start),
+                fields=list(fields),
+                expand=expand,
+            )
+
+    logger.debug('Fetching %s issues in pages of %s', total, page_size)
+    starts = range(page_size, total, page_size)
+    pages = await asyncio.gather(*(fetch_page(start) for start in starts))
+    for page in pages:
+        issues.extend(page)
+    return issues
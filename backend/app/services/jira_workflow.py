@@ -0,0 +1,176 @@
+"""Workflow status extraction for Jira projects.
+
+This module provides the extraction of a project's workflow statuses from its
+recently updated issues, shared by the workflow endpoints.
+"""
+
+import asyncio
+from datetime import date, timedelta
+from typing import Any, Dict, List, Union, cast
+
+from jira import JIRA
+
+from ..logger import get_logger
+from ..mock_jira import MockJira
+from .jira_calls import run_jira_call
+
+# Create module-level logger
+logger = get_logger(__name__)
+
+# How far back issues are scanned for statuses, in whole weeks so the window starts on a Monday
+HISTORY_WINDOW = timedelta(weeks=26)
+
+# Maximum number of recently updated issues scanned for statuses
+MAX_ISSUES = 1000
+
+# Number of issues requested per search page
+PAGE_SIZE = 100
+
+# Maximum number of search pages requested from Jira at the same time
+MAX_CONCURRENT_PAGES = 4
+
+# Shared default for a missing status category, so lookups don't build a new dict
+_EMPTY: Dict[str, Any] = {}
+
+
+def _workflow_jql(project_key: str) -> str:
+    """Build the JQL query selecting a project's recently updated issues.
+
+    The project key is quoted so it cannot change the query. The start of the
+    history window is aligned to a Monday, so the query text only changes once
+    a week and repeated queries can be served from Jira's caches.
+
+    Args:
+        project_key: The project key to select issues from.
+
+    Returns:
+        str: The JQL query.
+    """
+    quoted_key = project_key.replace('\\', '\\\\').replace('"', '\\"')
+    today = date.today()
+    monday = today - timedelta(days=today.weekday())
+    window_start = monday - HISTORY_WINDOW
+    return f'project = "{quoted_key}" AND updated >= {window_start.isoformat()}'
+
+
+async def _search_page(
+    jira_client: JIRA, jql_query: str, start_at: int, max_results: int
+) -> Dict[str, Any]:
+    """Fetch one page of raw search results with only the status field.
+
+    Only the status field is requested, since it already contains the status
+    category, and the raw JSON is used instead of building an Issue resource
+    per result. The search runs off the event loop.
+
+    Args:
+        jira_client: The Jira client to use.
+        jql_query: The JQL query to select issues.
+        start_at: Index of the first issue to return.
+        max_results: Maximum number of issues to return.
+
+    Returns:
+        Dict[str, Any]: The raw search result.
+    """
+    return await run_jira_call(
+        jira_client.search_issues,
+        jql_query,
+        startAt=start_at,
+        maxResults=max_results,
+        fields='status',
+        json_result=True,
+    )
+
+
+async def extract_workflow_statuses(
+    jira: Union[JIRA, MockJira], project_key: str
+) -> List[Dict[str, Any]]:
+    """Extract the workflow statuses of a Jira project.
+
+    Statuses are collected from issues updated in the last six months. If the
+    project has no such issues, the statuses defined in Jira are used instead.
+
+    Args:
+        jira: The Jira client to use.
+        project_key: The project key to fetch workflow data for.
+
+    Returns:
+        List[dict]: List of workflow statuses with their details.
+    """
+    # Cast to JIRA type to satisfy the type checker
+    jira_client = cast(JIRA, jira)
+
+    # Get workflow states from 6 months of historical data
+    logger.info('Analyzing historical data for project %s to extract workflow states', project_key)
+
+    # Query for all issues in the project updated in the last 6 months
+    jql_query = _workflow_jql(project_key)
+    logger.info('Using JQL: %s', jql_query)
+
+    # Get the first page of matching issues, which also tells how many there are
+    first_page = await _search_page(jira_client, jql_query, 0, PAGE_SIZE)
+    issues: List[Dict[str, Any]] = list(first_page['issues'])
+    total = min(first_page['total'], MAX_ISSUES)
+    # Jira may return fewer issues per page than requested, so page by what it returned
+    page_size = len(issues)
+
+    # Fetch the remaining pages concurrently, a few at a time, keeping them in order
+    if page_size and total > page_size:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async def fetch_page(start_at: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await _search_page(
+                    jira_client, jql_query, start_at, min(page_size, total - start_at)
+                )
+
+        pages = await asyncio.gather(
+            *(fetch_page(start_at) for start_at in range(page_size, total, page_size))
+        )
+        for page in pages:
+            issues.extend(page['issues'])
+    logger.info('Found %s issues to analyze', len(issues))
+
+    # Extract all unique status names from issues, with case-insensitive comparison.
+    # The lowercased name keys a single dict, so each issue costs one lookup
+    status_categories = {}
+
+    for issue in issues:
+        status = issue['fields']['status']
+        # Store status name in lowercase for case-insensitive comparison
+        status_name_lower = status['name'].lower()
+        if status_name_lower not in status_categories:
+            # Store the original casing and category
+            status_categories[status_name_lower] = {
+                'name': status['name'],
+                'category': status.get('statusCategory', _EMPTY).get('name', ''),
+            }
+
+    # If we don't find any issues, try getting statuses from the project configuration
+    if not status_categories:
+        logger.info('No issues found, falling back to project configuration for workflow states')
+        try:
+            # Get available statuses from project metadata. Nested fields of a status
+            # resource are plain attribute holders, so the category is read from its raw JSON
+            status_meta = await run_jira_call(jira_client.statuses)
+            for status in status_meta:
+                status_name_lower = status.name.lower()
+                if status_name_lower not in status_categories:
+                    status_categories[status_name_lower] = {
+                        'name': status.name,
+                        'category': status.raw.get('statusCategory', _EMPTY).get('name', ''),
+                    }
+        except Exception as e:
+            logger.warning('Error getting statuses from project metadata: %s', e)
+
+    # Format and return result
+    result = [
+        {
+            'id': '',  # We don't need the ID as per requirements
+            'name': info['name'],
+            'category': info['category'],
+        }
+        for status_key, info in status_categories.items()
+    ]
+
+    logger.debug('Found %s workflow statuses', len(result))
+    return result
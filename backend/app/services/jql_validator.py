@@ -5,6 +5,7 @@ to prevent injection attacks and handle invalid syntax.
 """
 
 import re
+from functools import lru_cache
 
 from fastapi import HTTPException
 
@@ -14,6 +15,28 @@ from ..logger import get_logger
 logger = get_logger(__name__)
 
 
+# Valid queries remembered, so queries polled by dashboards are only checked once
+JQL_CACHE_SIZE = 1024
+
+# Patterns that might indicate injection attempts, combined into one expression
+SUSPICIOUS_PATTERN = re.compile(
+    '|'.join(
+        [
+            r'DROP\s+TABLE',
+            r'DELETE\s+FROM',
+            r'INSERT\s+INTO',
+            r'UPDATE\s+.*\s+SET',
+            r'UNION\s+SELECT',
+            r"'\s*OR\s*'\s*[0-9a-zA-Z]+\s*'='",  # Pattern like ' OR '1'='1
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Incomplete expressions like "project = " without a value
+INCOMPLETE_EXPRESSION_PATTERN = re.compile(r'=\s*$')
+
+
 def validate_jql_query(jql: str) -> str:
     """Validate and sanitize a JQL query to prevent injection attacks and handle invalid syntax.
 
@@ -31,37 +54,43 @@ def validate_jql_query(jql: str) -> str:
         logger.warning('Empty JQL query provided')
         return jql  # Return as is, will be handled by the metrics calculation
 
+    return _validate_non_empty_jql(jql)
+
+
+@lru_cache(maxsize=JQL_CACHE_SIZE)
+def _validate_non_empty_jql(jql: str) -> str:
+    """Validate a non-empty JQL query.
+
+    Only valid queries are cached, since a rejected query raises.
+
+    Args:
+        jql: The JQL query to validate.
+
+    Returns:
+        str: The sanitized JQL query.
+
+    Raises:
+        HTTPException: If the JQL query is invalid or contains disallowed patterns.
+    """
     # Check for semicolons which could be used for injection
     if ';' in jql:
-        logger.warning(f'JQL injection attempt detected: {jql}')
+        logger.warning('JQL injection attempt detected: %s', jql)
         raise HTTPException(
             status_code=400,
             detail='Invalid JQL query: Semicolons (;) are not allowed in JQL queries.',
         )
 
     # Check for other suspicious patterns that might indicate injection attempts
-    suspicious_patterns = [
-        r'DROP\s+TABLE',
-        r'DELETE\s+FROM',
-        r'INSERT\s+INTO',
-        r'UPDATE\s+.*\s+SET',
-        r'UNION\s+SELECT',
-        r"'\s*OR\s*'\s*[0-9a-zA-Z]+\s*'='",  # Pattern like ' OR '1'='1
-    ]
-
-    for pattern in suspicious_patterns:
-        if re.search(pattern, jql, re.IGNORECASE):
-            logger.warning(f'JQL injection attempt detected: {jql}')
-            raise HTTPException(
-                status_code=400,
-                detail='Invalid JQL query: The query contains suspicious patterns that are not allowed.',
-            )
+    if SUSPICIOUS_PATTERN.search(jql):
+        logger.warning('JQL injection attempt detected: %s', jql)
+        raise HTTPException(
+            status_code=400,
+            detail='Invalid JQL query: The query contains suspicious patterns that are not allowed.',
+        )
 
     # Basic syntax validation for common JQL errors
-    # Check for incomplete expressions like "project = " without a value
-    incomplete_expr_pattern = r'=\s*$'
-    if re.search(incomplete_expr_pattern, jql):
-        logger.warning(f'Invalid JQL syntax detected: {jql}')
+    if INCOMPLETE_EXPRESSION_PATTERN.search(jql):
+        logger.warning('Invalid JQL syntax detected: %s', jql)
         raise HTTPException(
             status_code=400,
             detail='Invalid JQL query: Incomplete expression. Expected a value after the operator.',
@@ -0,0 +1,39 @@
+"""Shared Redis client service.
+
+This module provides the Redis client used for state that has to be shared
+between worker processes. Redis is optional: when ``REDIS_URL`` is not set,
+no client is created and callers fall back to per-process in-memory state.
+"""
+
+import os
+from functools import lru_cache
+
+from ..logger import get_logger
+
+# Create module-level logger
+logger = get_logger(__name__)
+
+
+@lru_cache()
+def get_redis_client():
+    """Get the shared Redis client.
+
+    The client is created once per process and reused, so every caller shares
+    the same connection pool.
+
+    Returns:
+        redis.asyncio.Redis: The Redis client, or None if ``REDIS_URL`` is not set
+            or the redis package is not installed.
+    """
+    redis_url = os.environ.get('REDIS_URL')
+    if not redis_url:
+        return None
+
+    try:
+        from redis import asyncio as redis_asyncio
+    except ImportError:
+        logger.warning('REDIS_URL is set but the redis package is not installed')
+        return None
+
+    logger.info('Using Redis for shared state')
+    return redis_asyncio.Redis.from_url(redis_url)
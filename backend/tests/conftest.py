@@ -45,6 +45,10 @@ class MockSettings:
     jwt_algorithm = 'HS256'
     jwt_expiration_minutes = 60
 
+    # Limits for blocking Jira calls
+    jira_max_concurrent_calls = 20
+    jira_call_wait_seconds = 5.0
+
 
 # Global variables to store database objects for reuse
 _test_engine = None
@@ -237,7 +241,7 @@ def mock_jira_client_dependency():
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from app.container import container
-    from app.dependencies import get_jira_client_repository, get_jira_client_service
+    from app.dependencies import get_jira_client_service
     from app.main import app
 
     # Set environment variable to use mock Jira
@@ -252,7 +256,7 @@ def mock_jira_client_dependency():
     # Create a mock JIRA client
     mock_client = Mock()
 
-    # Create a mock JiraClientRepository
+    # Create a mock ConfigurationRepository
     mock_repository = Mock()
 
     # Create an async mock for get_by_name
@@ -277,17 +281,19 @@ def mock_jira_client_dependency():
     async def mock_get_client_by_config_name(config_name):
         return mock_client
 
+    async def mock_resolve_config_name(request, credentials, settings, config_name):
+        return config_name or 'test_config'
+
     # Use the async mocks for the service methods
     mock_service.get_client_from_auth = mock_get_client_from_auth
     mock_service.get_client_by_config_name = mock_get_client_by_config_name
+    mock_service.resolve_config_name = mock_resolve_config_name
     mock_service.repository = mock_repository
 
     # Override the dependencies in FastAPI
     original_service_dependency = app.dependency_overrides.get(get_jira_client_service)
-    original_repository_dependency = app.dependency_overrides.get(get_jira_client_repository)
 
     app.dependency_overrides[get_jira_client_service] = lambda: mock_service
-    app.dependency_overrides[get_jira_client_repository] = lambda: mock_repository
 
     yield mock_client
 
@@ -297,11 +303,6 @@ def mock_jira_client_dependency():
     else:
         del app.dependency_overrides[get_jira_client_service]
 
-    if original_repository_dependency:
-        app.dependency_overrides[get_jira_client_repository] = original_repository_dependency
-    else:
-        del app.dependency_overrides[get_jira_client_repository]
-
     # Reset environment variable
     os.environ.pop('USE_MOCK_JIRA', None)
 
@@ -0,0 +1,97 @@
+"""Unit tests for the admin router.
+
+This module contains unit tests for the admin cache endpoint, served by a
+minimal FastAPI application.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import admin
+from app.services import caching
+from app.services.caching import ShardedCache
+
+
+class FakeRedis:
+    """Minimal stand-in for a Redis client storing shared cache entries in a dictionary."""
+
+    def __init__(self, values):
+        """Initialize the store with the given entries."""
+        self.values = values
+
+    async def get(self, key):
+        """Get a value."""
+        return self.values.get(key)
+
+    async def scan_iter(self, match):
+        """Yield the keys matching a prefix pattern."""
+        for key in list(self.values):
+            if key.startswith(match.rstrip('*')):
+                yield key
+
+    async def unlink(self, *keys):
+        """Delete keys."""
+        for key in keys:
+            del self.values[key]
+
+    def pipeline(self, transaction):
+        """Start a pipeline that publishes nowhere."""
+        return FakePipeline()
+
+
+class FakePipeline:
+    """Minimal stand-in for a Redis pipeline that drops published messages."""
+
+    async def __aenter__(self):
+        """Enter the pipeline context."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Leave the pipeline context."""
+        return False
+
+    def publish(self, channel, message):
+        """Drop a message."""
+
+    async def execute(self):
+        """Do nothing."""
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    """Enable caching with a cached metric stored both locally and in Redis.
+
+    Returns:
+        FakeRedis: The Redis stand-in holding the shared metric.
+    """
+    cache = {'configurations': ShardedCache(), 'metrics': ShardedCache()}
+    cache['metrics'].set('wip', {'data': {'total': 3}, 'timestamp': 0})
+    redis = FakeRedis({'cache:metrics:wip': b'{}'})
+    monkeypatch.setattr(caching, 'CACHING_ENABLED', True)
+    monkeypatch.setattr(caching, '_cache', cache)
+    monkeypatch.setattr(caching, 'get_redis_client', lambda: redis)
+    monkeypatch.setattr(admin, '_cache', cache)
+    return redis
+
+
+@pytest.fixture
+def client():
+    """Create a test client for an application serving the admin router.
+
+    Returns:
+        TestClient: The test client.
+    """
+    app = FastAPI()
+    app.include_router(admin.router)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize('params', [{'namespace': 'metrics'}, {}])
+def test_clear_cache_deletes_shared_entries(redis, client, params):
+    """Test that clearing the cache also deletes the entries shared through Redis."""
+    response = client.post('/admin/cache/clear', params=params)
+
+    assert response.status_code == 200
+    assert redis.values == {}
+    assert len(caching._cache['metrics']) == 0
@@ -0,0 +1,244 @@
+"""Unit tests for the authentication router.
+
+This module contains unit tests for the validate_credentials endpoint.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Response
+
+from app.routers import auth as auth_router
+from app.schemas import JiraCredentials
+
+
+@pytest.fixture
+def credentials():
+    """Create Jira credentials for testing.
+
+    Returns:
+        JiraCredentials: Credentials for a configuration without a stored project.
+    """
+    return JiraCredentials(
+        name='auth_test_config',
+        jira_server='https://auth.atlassian.net',
+        jira_email='auth@example.com',
+        jira_api_token='auth-token',
+    )
+
+
+@pytest.fixture
+def session():
+    """Create a database session that finds no existing configuration.
+
+    Returns:
+        AsyncMock: A mock database session.
+    """
+    session = AsyncMock()
+    session.scalar.return_value = None
+    return session
+
+
+@pytest.fixture
+def jira_client_factory():
+    """Create a Jira client factory returning a client with a working connection.
+
+    Returns:
+        AsyncMock: A mock Jira client factory.
+    """
+    factory = AsyncMock()
+    factory.create_client_from_credentials.return_value = MagicMock()
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def clear_validated(monkeypatch):
+    """Start every test without remembered validations or tokens."""
+    monkeypatch.setattr(auth_router, '_validated', auth_router.OrderedDict())
+    monkeypatch.setattr(auth_router, '_issued_tokens', auth_router.OrderedDict())
+
+
+def settings():
+    """Create the settings used to sign tokens.
+
+    Returns:
+        SimpleNamespace: Settings with JWT configuration.
+    """
+    return SimpleNamespace(
+        jwt_secret_key='test_secret_key', jwt_algorithm='HS256', jwt_expiration_minutes=60
+    )
+
+
+async def validate(credentials, session, jira_client_factory):
+    """Call validate_credentials with mocked dependencies.
+
+    Returns:
+        Response: The response the token cookie was set on.
+    """
+    response = Response()
+    result = await auth_router.validate_credentials(
+        credentials,
+        MagicMock(),
+        response,
+        session=session,
+        settings=settings(),
+        jira_client_service=MagicMock(),
+        jira_client_factory=jira_client_factory,
+    )
+    assert result['status'] == 'success'
+    return response
+
+
+@pytest.mark.asyncio
+async def test_recently_validated_credentials_skip_jira(credentials, session, jira_client_factory):
+    """Test that the same credentials are only checked with Jira once within the TTL."""
+    await validate(credentials, session, jira_client_factory)
+    response = await validate(credentials, session, jira_client_factory)
+
+    jira_client_factory.create_client_from_credentials.assert_called_once()
+    assert 'jira_token=' in response.headers['set-cookie']
+
+
+@pytest.mark.asyncio
+async def test_changed_credentials_are_validated_again(credentials, session, jira_client_factory):
+    """Test that a different API token is checked with Jira again."""
+    await validate(credentials, session, jira_client_factory)
+    changed = credentials.model_copy(update={'jira_api_token': 'other-token'})
+    await validate(changed, session, jira_client_factory)
+
+    assert jira_client_factory.create_client_from_credentials.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_validation_expires_after_ttl(credentials, session, jira_client_factory):
+    """Test that credentials are checked with Jira again once the TTL has passed."""
+    with patch('app.routers.auth.time') as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        await validate(credentials, session, jira_client_factory)
+
+        mock_time.monotonic.return_value = 1000.0 + auth_router.VALIDATION_TTL
+        await validate(credentials, session, jira_client_factory)
+
+    assert jira_client_factory.create_client_from_credentials.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_token_cookie_matches_set_cookie(credentials, session, jira_client_factory):
+    """Test that the token cookie has the same attributes Response.set_cookie would set."""
+    response = await validate(credentials, session, jira_client_factory)
+    token = response.headers['set-cookie'].split(';')[0].split('=', 1)[1]
+
+    expected = Response()
+    expected.set_cookie(
+        key='jira_token',
+        value=token,
+        httponly=True,
+        secure=True,
+        samesite='strict',
+        max_age=3600,
+        path='/',
+    )
+
+    assert response.headers['set-cookie'] == expected.headers['set-cookie']
+
+
+def cookie_attributes(response):
+    """Split the token cookie into its value and Max-Age.
+
+    Returns:
+        Tuple[str, int]: The token and the cookie's max age in seconds.
+    """
+    parts = response.headers['set-cookie'].split('; ')
+    token = parts[0].split('=', 1)[1]
+    max_age = next(int(part.split('=')[1]) for part in parts if part.startswith('Max-Age='))
+    return token, max_age
+
+
+@pytest.mark.asyncio
+async def test_signed_token_is_reused(credentials, session, jira_client_factory):
+    """Test that a token signed recently is reused with its remaining lifetime."""
+    with patch('app.routers.auth.time') as mock_time, patch.object(
+        auth_router, 'create_access_token', wraps=auth_router.create_access_token
+    ) as mock_create:
+        mock_time.monotonic.return_value = 1000.0
+        first_token, first_max_age = cookie_attributes(
+            await validate(credentials, session, jira_client_factory)
+        )
+
+        mock_time.monotonic.return_value = 1600.0
+        second_token, second_max_age = cookie_attributes(
+            await validate(credentials, session, jira_client_factory)
+        )
+
+    assert mock_create.call_count == 1
+    assert second_token == first_token
+    assert (first_max_age, second_max_age) == (3600, 3000)
+
+
+@pytest.mark.asyncio
+async def test_token_close_to_expiry_is_signed_again(credentials, session, jira_client_factory):
+    """Test that a new token is signed once the cached one is about to expire."""
+    with patch('app.routers.auth.time') as mock_time, patch.object(
+        auth_router, 'create_access_token', wraps=auth_router.create_access_token
+    ) as mock_create:
+        mock_time.monotonic.return_value = 1000.0
+        await validate(credentials, session, jira_client_factory)
+
+        mock_time.monotonic.return_value = 1000.0 + 3600 - auth_router.TOKEN_REUSE_MARGIN
+        response = await validate(credentials, session, jira_client_factory)
+
+    assert mock_create.call_count == 2
+    assert cookie_attributes(response)[1] == 3600
+
+
+def existing_config(credentials, **overrides):
+    """Create a stored configuration with the given credentials.
+
+    Returns:
+        SimpleNamespace: A configuration with a project key.
+    """
+    fields = {
+        'project_key': 'AUTH',
+        'jira_server': credentials.jira_server,
+        'jira_email': credentials.jira_email,
+        'jira_api_token': credentials.jira_api_token,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_credentials_are_not_written(credentials, session, jira_client_factory):
+    """Test that no write is made when the stored credentials already match."""
+    session.scalar.return_value = existing_config(credentials)
+
+    await validate(credentials, session, jira_client_factory)
+
+    session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changed_credentials_are_written(credentials, session, jira_client_factory):
+    """Test that changed credentials are stored on the existing configuration."""
+    config = existing_config(credentials, jira_api_token='old-token')
+    session.scalar.return_value = config
+
+    await validate(credentials, session, jira_client_factory)
+
+    session.commit.assert_awaited_once()
+    assert config.jira_api_token == credentials.jira_api_token
+
+
+@pytest.mark.asyncio
+async def test_changed_credentials_clear_cached_metrics(
+    credentials, session, jira_client_factory, monkeypatch
+):
+    """Test that metrics fetched with the old credentials are no longer served."""
+    session.scalar.return_value = existing_config(credentials, jira_api_token='old-token')
+    clear_caches = AsyncMock()
+    monkeypatch.setattr(auth_router, 'clear_caches', clear_caches)
+
+    await validate(credentials, session, jira_client_factory)
+
+    assert 'metrics' in clear_caches.await_args.args
@@ -0,0 +1,346 @@
+"""Unit tests for the caching service.
+
+This module contains unit tests for the in-memory cache and the cache_result decorator.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import caching
+from app.services.caching import ShardedCache, cache_result, clear_cache
+
+
+@pytest.fixture
+def enabled_cache(monkeypatch):
+    """Enable caching with empty namespaces for the duration of a test.
+
+    Returns:
+        Dict[str, ShardedCache]: The cache dictionary.
+    """
+    monkeypatch.setattr(caching, 'CACHING_ENABLED', True)
+    cache = {'configurations': ShardedCache(), 'metrics': ShardedCache()}
+    monkeypatch.setattr(caching, '_cache', cache)
+    return cache
+
+
+class TestShardedCache:
+    """Tests for the ShardedCache class."""
+
+    def test_set_and_get(self):
+        """Test that stored entries can be read back."""
+        cache = ShardedCache()
+
+        for i in range(100):
+            cache.set(f'key-{i}', i)
+
+        assert cache.get('key-42') == 42
+        assert 'key-42' in cache
+        assert cache.get('missing') is None
+        assert len(cache) == 100
+
+    def test_clear_keeps_existing_shard_views_intact(self):
+        """Test that clearing swaps in new shards instead of emptying the old ones."""
+        cache = ShardedCache()
+        cache.set('key', 'value')
+        old_shards = cache.shards
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert 'key' not in cache
+        assert sum(len(shard) for shard in old_shards) == 1
+
+    def test_bounded_cache_drops_least_recently_used(self):
+        """Test that a full shard drops the entry read or written longest ago."""
+        cache = ShardedCache(max_entries=2 * caching.SHARD_COUNT)
+        first, second, third = [
+            key for key in (f'key-{i}' for i in range(1000)) if cache._shard(key) is cache.shards[0]
+        ][:3]
+
+        cache.set(first, 1)
+        cache.set(second, 2)
+        assert cache.get(first) == 1
+        cache.set(third, 3)
+
+        assert first in cache
+        assert third in cache
+        assert second not in cache
+        assert len(cache) == 2
+
+
+class TestCacheResult:
+    """Tests for the cache_result decorator."""
+
+    @pytest.mark.asyncio
+    async def test_result_is_cached_per_key(self, enabled_cache):
+        """Test that a cached result is returned without calling the function again."""
+        calls = []
+
+        @cache_result(namespace='metrics', key_func=lambda value: f'value:{value}')
+        async def compute(value):
+            calls.append(value)
+            return value * 2
+
+        assert await compute(2) == 4
+        assert await compute(2) == 4
+        assert await compute(3) == 6
+
+        assert calls == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_recompute(self, enabled_cache):
+        """Test that clearing a namespace drops its cached results."""
+        calls = []
+
+        @cache_result(namespace='configurations', key_func=lambda: 'all')
+        async def compute():
+            calls.append(True)
+            return 'result'
+
+        await compute()
+        clear_cache('configurations')
+        await compute()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self, enabled_cache):
+        """Test that concurrent calls for an uncached key run the function once."""
+        calls = []
+
+        @cache_result(namespace='metrics', key_func=lambda value: f'value:{value}')
+        async def compute(value):
+            calls.append(value)
+            await asyncio.sleep(0)
+            return value * 2
+
+        results = await asyncio.gather(*(compute(2) for _ in range(5)))
+
+        assert results == [4] * 5
+        assert calls == [2]
+        assert not caching._inflight
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_errors(self, enabled_cache):
+        """Test that a failing call is not cached and its error reaches every waiting caller."""
+        calls = []
+
+        @cache_result(namespace='metrics', key_func=lambda: 'failing')
+        async def compute():
+            calls.append(True)
+            await asyncio.sleep(0)
+            raise ValueError('Jira unavailable')
+
+        results = await asyncio.gather(*(compute() for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(calls) == 1
+        assert len(enabled_cache['metrics']) == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_result_is_served_while_refreshed(self, enabled_cache):
+        """Test that an expired entry within the stale window is returned and refreshed once."""
+        calls = []
+
+        @cache_result(
+            namespace='metrics', key_func=lambda: 'cfd', ttl_seconds=60, stale_seconds=600
+        )
+        async def compute():
+            calls.append(True)
+            return len(calls)
+
+        assert await compute() == 1
+        enabled_cache['metrics'].get('cfd')['timestamp'] -= 120
+
+        assert await asyncio.gather(compute(), compute()) == [1, 1]
+        await asyncio.gather(*caching._refreshing)
+
+        assert await compute() == 2
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_result_past_the_stale_window_is_recomputed(self, enabled_cache):
+        """Test that an entry older than the stale window is not served."""
+
+        @cache_result(namespace='metrics', key_func=lambda: 'cfd', ttl_seconds=60, stale_seconds=60)
+        async def compute():
+            return 'fresh'
+
+        enabled_cache['metrics'].set('cfd', {'data': 'old', 'timestamp': 0})
+
+        assert await compute() == 'fresh'
+
+    @pytest.mark.asyncio
+    async def test_shared_result_is_stored_in_and_read_from_redis(self, enabled_cache, monkeypatch):
+        """Test that shared entries reach Redis and are loaded by workers without a local copy."""
+        redis = FakeRedis()
+        monkeypatch.setattr(caching, 'get_redis_client', lambda: redis)
+        calls = []
+
+        @cache_result(
+            namespace='metrics',
+            key_func=lambda: 'wip',
+            ttl_seconds=60,
+            stale_seconds=30,
+            shared=True,
+        )
+        async def compute():
+            calls.append(True)
+            return {'total': 3}
+
+        assert await compute() == {'total': 3}
+        assert redis.expiry == {'cache:metrics:wip': 90}
+
+        enabled_cache['metrics'].clear()
+        assert await compute() == {'total': 3}
+        assert len(calls) == 1
+
+
+class FakeRedis:
+    """Minimal stand-in for a Redis client storing values in a dictionary."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.values = {}
+        self.expiry = {}
+        self.published = []
+
+    async def get(self, key):
+        """Get a value."""
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        """Store a value and its time to live."""
+        self.values[key] = value
+        self.expiry[key] = ex
+
+    async def scan_iter(self, match):
+        """Yield the keys matching a prefix pattern."""
+        for key in list(self.values):
+            if key.startswith(match.rstrip('*')):
+                yield key
+
+    async def unlink(self, *keys):
+        """Delete keys."""
+        for key in keys:
+            del self.values[key]
+
+    def pipeline(self, transaction):
+        """Start a pipeline publishing to this client."""
+        return FakePipeline(self.published)
+
+
+class FakePipeline:
+    """Minimal stand-in for a Redis pipeline that records published messages."""
+
+    def __init__(self, published):
+        """Initialize the pipeline with the list messages are published to."""
+        self.published = published
+        self.queued = []
+
+    async def __aenter__(self):
+        """Enter the pipeline context."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Leave the pipeline context."""
+        return False
+
+    def publish(self, channel, message):
+        """Queue a message to publish."""
+        self.queued.append((channel, message))
+
+    async def execute(self):
+        """Publish the queued messages in one batch."""
+        self.published.append(list(self.queued))
+
+
+class FakePubSub:
+    """Minimal stand-in for a Redis pub/sub connection replaying fixed messages."""
+
+    def __init__(self, messages):
+        """Initialize the connection with the messages it will deliver."""
+        self.messages = messages
+        self.closed = False
+
+    async def subscribe(self, channel):
+        """Subscribe to a channel."""
+        self.channel = channel
+
+    async def listen(self):
+        """Yield the messages, then stop."""
+        for message in self.messages:
+            yield message
+
+    async def aclose(self):
+        """Close the connection."""
+        self.closed = True
+
+
+class TestCacheInvalidation:
+    """Tests for cache invalidation across workers."""
+
+    @pytest.mark.asyncio
+    async def test_publish_sends_all_namespaces_in_one_pipeline(self, monkeypatch):
+        """Test that invalidations for several namespaces are sent in one round trip."""
+        published = []
+        redis = SimpleNamespace(pipeline=lambda transaction: FakePipeline(published))
+        monkeypatch.setattr(caching, 'get_redis_client', lambda: redis)
+
+        await caching.publish_cache_invalidation('configurations', 'metrics')
+
+        assert published == [
+            [
+                (caching.CACHE_INVALIDATION_CHANNEL, 'configurations'),
+                (caching.CACHE_INVALIDATION_CHANNEL, 'metrics'),
+            ]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_publish_without_redis_is_a_no_op(self, monkeypatch):
+        """Test that nothing is published when Redis is not configured."""
+        monkeypatch.setattr(caching, 'get_redis_client', lambda: None)
+
+        await caching.publish_cache_invalidation('metrics')
+
+    @pytest.mark.asyncio
+    async def test_clear_caches_clears_locally_and_publishes_once(self, enabled_cache, monkeypatch):
+        """Test that several namespaces are cleared here, in Redis and in one publish round trip."""
+        enabled_cache['configurations'].set('all', 'configs')
+        enabled_cache['metrics'].set('lead_time', 'metrics')
+        redis = FakeRedis()
+        redis.values = {'cache:metrics:lead_time': b'{}', 'cache:jira_projects:all': b'[]'}
+        monkeypatch.setattr(caching, 'get_redis_client', lambda: redis)
+
+        await caching.clear_caches('configurations', 'metrics')
+
+        assert len(enabled_cache['configurations']) == len(enabled_cache['metrics']) == 0
+        assert list(redis.values) == ['cache:jira_projects:all']
+        assert redis.published == [
+            [
+                (caching.CACHE_INVALIDATION_CHANNEL, 'configurations'),
+                (caching.CACHE_INVALIDATION_CHANNEL, 'metrics'),
+            ]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_listener_clears_published_namespaces(self, enabled_cache, monkeypatch):
+        """Test that invalidations from other workers clear the local cache."""
+        enabled_cache['configurations'].set('all', 'configs')
+        enabled_cache['metrics'].set('lead_time', 'metrics')
+        pubsub = FakePubSub(
+            [
+                {'type': 'subscribe', 'data': 1},
+                {'type': 'message', 'data': b'metrics'},
+            ]
+        )
+        redis = SimpleNamespace(pubsub=lambda: pubsub)
+        monkeypatch.setattr(caching, 'get_redis_client', lambda: redis)
+
+        await caching.listen_for_cache_invalidation()
+
+        assert len(enabled_cache['metrics']) == 0
+        assert len(enabled_cache['configurations']) == 1
+        assert pubsub.closed
@@ -3,11 +3,13 @@
 This module contains unit tests for the ConfigurationRepository class.
 """
 
+from datetime import datetime
+
 import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import JiraConfiguration
+from app.models import JiraConfiguration, MetricsAnalysis
 from app.repositories.configuration_repository import ConfigurationRepository
 from app.schemas import JiraConfigurationCreate, JiraConfigurationUpdate
 
@@ -226,6 +228,47 @@ async def test_delete(db_session: AsyncSession):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_delete_removes_metrics_analyses(db_session: AsyncSession):
+    """Test that deleting a configuration also deletes its metrics analyses."""
+    # Arrange
+    repo = ConfigurationRepository(db_session)
+    config = JiraConfiguration(
+        name='Analysed Config',
+        jira_server='https://analysed.atlassian.net',
+        jira_email='analysed@example.com',
+        jira_api_token='analysed-token',
+        jql_query='project = ANALYSED',
+        project_key='ANALYSED',
+        workflow_states=['To Do', 'In Progress', 'Done'],
+        lead_time_start_state='To Do',
+        lead_time_end_state='Done',
+        cycle_time_start_state='In Progress',
+        cycle_time_end_state='Done',
+    )
+    db_session.add(config)
+    await db_session.commit()
+    db_session.add(
+        MetricsAnalysis(
+            id='analysis-1',
+            configuration_id=config.id,
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 2, 1),
+            jql_query='project = ANALYSED',
+            metrics_data={'lead_time': []},
+        )
+    )
+    await db_session.commit()
+
+    # Act
+    result = await repo.delete('Analysed Config')
+
+    # Assert
+    assert result is True
+    db_result = await db_session.execute(select(MetricsAnalysis))
+    assert db_result.scalars().all() == []
+
+
 @pytest.mark.asyncio
 async def test_count(db_session: AsyncSession):
     """Test counting configurations."""
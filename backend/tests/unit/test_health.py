@@ -0,0 +1,46 @@
+"""Unit tests for the health check endpoints."""
+
+import datetime
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.routers import health
+
+
+@pytest.mark.asyncio
+async def test_health_check_timestamp_has_second_precision():
+    """Test that the health check reports the current time in ISO 8601 to the second."""
+    with patch('app.routers.health.time') as mock_time:
+        mock_time.time.return_value = 1700000000.75
+        result = await health.health_check()
+
+    assert result['status'] == 'healthy'
+    assert result['timestamp'] == datetime.datetime.fromtimestamp(1700000000).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_health_check_timestamp_is_reused_within_a_second():
+    """Test that the timestamp is only formatted again once the second changes."""
+    with patch('app.routers.health.time') as mock_time, patch(
+        'app.routers.health.datetime', wraps=datetime
+    ) as mock_datetime:
+        mock_time.time.return_value = 1700000100.1
+        first = await health.health_check()
+        mock_time.time.return_value = 1700000100.9
+        second = await health.health_check()
+        mock_time.time.return_value = 1700000101.0
+        third = await health.health_check()
+
+    assert first['timestamp'] == second['timestamp'] != third['timestamp']
+    assert mock_datetime.datetime.fromtimestamp.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ping_returns_pong():
+    """Test that ping returns a JSON pong response."""
+    response = await health.ping()
+
+    assert response.media_type == 'application/json'
+    assert json.loads(response.body) == {'ping': 'pong'}
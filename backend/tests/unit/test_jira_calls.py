@@ -0,0 +1,76 @@
+"""Unit tests for bounded Jira calls.
+
+This module contains unit tests for run_jira_call.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import jira_calls
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """Allow two concurrent Jira calls and a short wait for a free slot.
+
+    Yields:
+        SimpleNamespace: The settings used by run_jira_call.
+    """
+    settings = SimpleNamespace(jira_max_concurrent_calls=2, jira_call_wait_seconds=0.05)
+    monkeypatch.setattr(jira_calls, 'get_settings', lambda: settings)
+    jira_calls.shutdown_jira_calls()
+    yield settings
+    jira_calls.shutdown_jira_calls()
+
+
+@pytest.mark.asyncio
+async def test_calls_run_in_the_jira_thread_pool(settings):
+    """Test that the call runs in a Jira worker thread and its result is returned."""
+    result = await jira_calls.run_jira_call(
+        lambda value: (value, threading.current_thread().name), 'ok'
+    )
+
+    assert result[0] == 'ok'
+    assert result[1].startswith('jira')
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_limited(settings):
+    """Test that no more calls run at once than the configured limit."""
+    settings.jira_call_wait_seconds = 5
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def call():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.02)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*(jira_calls.run_jira_call(call) for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_waiting_too_long_for_a_slot_fails_fast(settings):
+    """Test that a call fails with 503 when every slot stays busy, and frees no slot."""
+    release = threading.Event()
+    busy = [asyncio.create_task(jira_calls.run_jira_call(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await jira_calls.run_jira_call(lambda: None)
+
+    release.set()
+    await asyncio.gather(*busy)
+    assert exc_info.value.status_code == 503
+    assert await jira_calls.run_jira_call(lambda: 'free') == 'free'
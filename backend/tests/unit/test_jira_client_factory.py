@@ -4,12 +4,14 @@ This module contains tests for the JiraClientFactory class, which is responsible
 for creating Jira clients.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.config import get_settings
 from app.mock_jira import MockJira
-from app.services.jira_client_factory import JiraClientFactory
+from app.services.jira_client_factory import JiraClientFactory, clear_client_pool
 
 # Mark all tests in this module as asyncio tests
 pytestmark = pytest.mark.asyncio
@@ -21,6 +23,14 @@ def mock_session():
     return AsyncMock()
 
 
+@pytest.fixture(autouse=True)
+def empty_client_pool():
+    """Start and end every test without pooled clients."""
+    clear_client_pool()
+    yield
+    clear_client_pool()
+
+
 class TestJiraClientFactory:
     """Test cases for the JiraClientFactory class."""
 
@@ -85,3 +95,100 @@ class TestJiraClientFactory:
             auth=(str(jira_email), str(jira_api_token)),
             config_name=config_name,
         )
+
+    @pytest.mark.asyncio
+    @patch('app.services.jira_client_factory.USE_MOCK_JIRA', False)
+    @patch('app.services.jira_client_factory.JIRA')
+    async def test_create_client_reuses_pooled_client(self, mock_jira_class, mock_session):
+        """Test that a client is reused for the same server and credentials."""
+        # Arrange
+        mock_jira_class.side_effect = lambda **kwargs: MagicMock()
+        factory = JiraClientFactory(mock_session)
+        server = 'https://jira.example.com'
+
+        # Act
+        first = await factory.create_client(server, ('user@example.com', 'api_token'))
+        second = await JiraClientFactory(mock_session).create_client(
+            server, ('user@example.com', 'api_token')
+        )
+        other = await factory.create_client(server, ('user@example.com', 'other_token'))
+
+        # Assert
+        assert second is first
+        assert other is not first
+        assert mock_jira_class.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch('app.services.jira_client_factory.USE_MOCK_JIRA', False)
+    @patch('app.services.jira_client_factory.JIRA')
+    async def test_concurrent_create_client_builds_one_client(self, mock_jira_class, mock_session):
+        """Test that concurrent requests for the same credentials share one client build."""
+        # Arrange
+        mock_jira_class.side_effect = lambda **kwargs: MagicMock()
+        factory = JiraClientFactory(mock_session)
+        auth = ('user@example.com', 'api_token')
+
+        # Act
+        clients = await asyncio.gather(
+            *(factory.create_client('https://jira.example.com', auth) for _ in range(5))
+        )
+
+        # Assert
+        assert all(client is clients[0] for client in clients)
+        mock_jira_class.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('app.services.jira_client_factory.USE_MOCK_JIRA', False)
+    @patch('app.services.jira_client_factory.JIRA')
+    async def test_pooled_client_keeps_a_connection_per_call_slot(
+        self, mock_jira_class, mock_session
+    ):
+        """Test that a client's HTTP session keeps a connection for every Jira call slot."""
+        # Arrange
+        factory = JiraClientFactory(mock_session)
+
+        # Act
+        client = await factory.create_client('https://jira.example.com', ('user', 'token'))
+        clear_client_pool()
+
+        # Assert
+        scheme, adapter = client._session.mount.call_args_list[0].args
+        assert scheme == 'https://'
+        assert adapter._pool_maxsize == get_settings().jira_max_concurrent_calls
+        client.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('app.services.jira_client_factory.USE_MOCK_JIRA', False)
+    @patch('app.services.jira_client_factory.CLIENT_POOL_SIZE', 1)
+    @patch('app.services.jira_client_factory.JIRA')
+    async def test_evicted_client_is_closed(self, mock_jira_class, mock_session):
+        """Test that a client dropped from a full pool has its HTTP session closed."""
+        # Arrange
+        mock_jira_class.side_effect = lambda **kwargs: MagicMock()
+        factory = JiraClientFactory(mock_session)
+
+        # Act
+        first = await factory.create_client('https://jira.example.com', ('user', 'token'))
+        second = await factory.create_client('https://jira.example.com', ('user', 'other'))
+
+        # Assert
+        first.close.assert_called_once()
+        second.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('app.services.jira_client_factory.USE_MOCK_JIRA', False)
+    @patch('app.services.jira_client_factory.CLIENT_POOL_RECYCLE', 0)
+    @patch('app.services.jira_client_factory.JIRA')
+    async def test_recycled_client_is_closed(self, mock_jira_class, mock_session):
+        """Test that a client past its recycle time is closed and replaced."""
+        # Arrange
+        mock_jira_class.side_effect = lambda **kwargs: MagicMock()
+        factory = JiraClientFactory(mock_session)
+
+        # Act
+        first = await factory.create_client('https://jira.example.com', ('user', 'token'))
+        second = await factory.create_client('https://jira.example.com', ('user', 'token'))
+
+        # Assert
+        assert second is not first
+        first.close.assert_called_once()
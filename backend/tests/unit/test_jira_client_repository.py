@@ -1,10 +1,18 @@
-"""Tests for the JiraClientRepository class."""
+"""Tests for the shared Jira configuration lookup by name."""
+
+import asyncio
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select
 
 from app.models import JiraConfiguration
-from app.repositories.jira_client_repository import JiraClientRepository
+from app.repositories.jira_client_repository import (
+    _inflight,
+    _name_cache,
+    get_config_by_name,
+    invalidate_config_name,
+)
 
 
 @pytest.mark.asyncio
@@ -29,11 +37,10 @@ async def test_get_by_name_found(db_session):
     db_session.add(config)
     await db_session.commit()
 
-    repo = JiraClientRepository(db_session)
     config_name = 'test_jira_client_config'
 
     # Act
-    result = await repo.get_by_name(config_name)
+    result = await get_config_by_name(db_session, config_name)
 
     # Assert
     assert result is not None
@@ -47,11 +54,10 @@ async def test_get_by_name_found(db_session):
 async def test_get_by_name_not_found(db_session):
     """Test getting a configuration by name when it doesn't exist."""
     # Arrange
-    repo = JiraClientRepository(db_session)
     non_existent_name = 'non_existent_config'
 
     # Act
-    result = await repo.get_by_name(non_existent_name)
+    result = await get_config_by_name(db_session, non_existent_name)
 
     # Assert
     assert result is None
@@ -79,11 +85,10 @@ async def test_repository_uses_session_correctly(db_session):
     db_session.add(config)
     await db_session.commit()
 
-    repo = JiraClientRepository(db_session)
     config_name = 'test_jira_client_config2'
 
     # Act
-    await repo.get_by_name(config_name)
+    await get_config_by_name(db_session, config_name)
 
     # Assert - Verify that the session was used correctly
     # This is an implementation detail test, but it's important to ensure
@@ -94,3 +99,135 @@ async def test_repository_uses_session_correctly(db_session):
 
     assert config is not None
     assert config.name == config_name
+
+
+@pytest.mark.asyncio
+async def test_get_by_name_uses_cached_primary_key(db_session):
+    """Test that a repeated lookup resolves the name through its cached primary key."""
+    # Arrange
+    config = JiraConfiguration(
+        name='test_cached_config',
+        jira_server='https://test.atlassian.net',
+        jira_email='test@example.com',
+        jira_api_token='test-token',
+        jql_query='project = TEST',
+        project_key='TEST',
+        workflow_states=['Backlog', 'In Progress', 'Done'],
+        lead_time_start_state='Backlog',
+        lead_time_end_state='Done',
+        cycle_time_start_state='In Progress',
+        cycle_time_end_state='Done',
+    )
+    db_session.add(config)
+    await db_session.commit()
+
+    first = await get_config_by_name(db_session, 'test_cached_config')
+
+    # Act
+    with patch.object(db_session, 'execute', wraps=db_session.execute) as mock_execute:
+        second = await get_config_by_name(db_session, 'test_cached_config')
+
+    # Assert
+    assert second is first
+    mock_execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_by_name_ignores_renamed_cached_config(db_session):
+    """Test that a cached primary key is not used once its configuration is renamed."""
+    # Arrange
+    config = JiraConfiguration(
+        name='test_renamed_config',
+        jira_server='https://test.atlassian.net',
+        jira_email='test@example.com',
+        jira_api_token='test-token',
+        jql_query='project = TEST',
+        project_key='TEST',
+        workflow_states=['Backlog', 'In Progress', 'Done'],
+        lead_time_start_state='Backlog',
+        lead_time_end_state='Done',
+        cycle_time_start_state='In Progress',
+        cycle_time_end_state='Done',
+    )
+    db_session.add(config)
+    await db_session.commit()
+
+    await get_config_by_name(db_session, 'test_renamed_config')
+
+    config.name = 'test_renamed_config_v2'
+    await db_session.commit()
+
+    # Act
+    result = await get_config_by_name(db_session, 'test_renamed_config')
+
+    # Assert
+    assert result is None
+    assert 'test_renamed_config' not in _name_cache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_by_name_shares_one_query(db_session):
+    """Test that concurrent lookups of the same name are served by a single query."""
+    # Arrange
+    config = JiraConfiguration(
+        name='test_single_flight_config',
+        jira_server='https://test.atlassian.net',
+        jira_email='test@example.com',
+        jira_api_token='test-token',
+        jql_query='project = TEST',
+        project_key='TEST',
+        workflow_states=['Backlog', 'In Progress', 'Done'],
+        lead_time_start_state='Backlog',
+        lead_time_end_state='Done',
+        cycle_time_start_state='In Progress',
+        cycle_time_end_state='Done',
+    )
+    db_session.add(config)
+    await db_session.commit()
+    _name_cache.pop('test_single_flight_config', None)
+
+    # Act
+    with patch.object(db_session, 'execute', wraps=db_session.execute) as mock_execute:
+        results = await asyncio.gather(
+            *(get_config_by_name(db_session, 'test_single_flight_config') for _ in range(5))
+        )
+
+    # Assert
+    assert all(result is config for result in results)
+    mock_execute.assert_called_once()
+    assert 'test_single_flight_config' not in _inflight
+
+
+@pytest.mark.asyncio
+async def test_get_by_name_survives_invalidation_during_lookup(db_session):
+    """Test that a name invalidated while its cached row is loaded does not fail the lookup."""
+    # Arrange
+    config = JiraConfiguration(
+        name='test_invalidated_config',
+        jira_server='https://test.atlassian.net',
+        jira_email='test@example.com',
+        jira_api_token='test-token',
+        jql_query='project = TEST',
+        project_key='TEST',
+        workflow_states=['Backlog', 'In Progress', 'Done'],
+        lead_time_start_state='Backlog',
+        lead_time_end_state='Done',
+        cycle_time_start_state='In Progress',
+        cycle_time_end_state='Done',
+    )
+    db_session.add(config)
+    await db_session.commit()
+    await get_config_by_name(db_session, 'test_invalidated_config')
+    config_id = config.id
+
+    async def get_and_invalidate(*args, **kwargs):
+        invalidate_config_name('test_invalidated_config')
+        return None
+
+    # Act
+    with patch.object(db_session, 'get', side_effect=get_and_invalidate):
+        result = await get_config_by_name(db_session, 'test_invalidated_config')
+
+    # Assert
+    assert result is config
+    assert _name_cache['test_invalidated_config'][1] == config_id
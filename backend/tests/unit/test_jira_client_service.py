@@ -11,7 +11,7 @@ from fastapi import HTTPException
 from jira import JIRA
 
 from app.models import JiraConfiguration
-from app.repositories.jira_client_repository import JiraClientRepository
+from app.repositories.configuration_repository import ConfigurationRepository
 from app.services.jira_client_factory import JiraClientFactory
 from app.services.jira_client_service import JiraClientService
 
@@ -27,9 +27,9 @@ def mock_session():
 
 
 @pytest.fixture
-def mock_jira_client_repository(mock_session):
-    """Create a mock JiraClientRepository."""
-    repository = AsyncMock(spec=JiraClientRepository)
+def mock_configuration_repository(mock_session):
+    """Create a mock ConfigurationRepository."""
+    repository = AsyncMock(spec=ConfigurationRepository)
 
     # Create a mock config that will be returned by get_by_name
     config = MagicMock(spec=JiraConfiguration)
@@ -59,12 +59,16 @@ class TestJiraClientService:
     """Test cases for the JiraClientService class."""
 
     async def test_get_client_by_config_name_success(
-        self, mock_session, mock_jira_client_repository, mock_jira_client_factory, mock_jira_client
+        self,
+        mock_session,
+        mock_configuration_repository,
+        mock_jira_client_factory,
+        mock_jira_client,
     ):
         """Test getting a client by config name when the config exists."""
         # Arrange
         session = mock_session
-        mock_repository, mock_config = mock_jira_client_repository
+        mock_repository, mock_config = mock_configuration_repository
         mock_config.name = 'test_config'
         mock_config.jira_server = 'https://jira.example.com'
         mock_config.jira_email = 'user@example.com'
@@ -90,12 +94,12 @@ class TestJiraClientService:
         assert client == mock_jira_client
 
     async def test_get_client_by_config_name_not_found(
-        self, mock_session, mock_jira_client_repository, mock_jira_client_factory
+        self, mock_session, mock_configuration_repository, mock_jira_client_factory
     ):
         """Test getting a client by config name when the config doesn't exist."""
         # Arrange
         session = mock_session
-        mock_repository, _ = mock_jira_client_repository
+        mock_repository, _ = mock_configuration_repository
         # Override the return value to None for this test
         mock_repository.get_by_name.return_value = None
 
@@ -111,12 +115,12 @@ class TestJiraClientService:
         assert mock_jira_client_factory.create_client_from_credentials.call_count == 0
 
     async def test_get_client_by_config_name_connection_error(
-        self, mock_session, mock_jira_client_repository, mock_jira_client_factory
+        self, mock_session, mock_configuration_repository, mock_jira_client_factory
     ):
         """Test getting a client by config name when connection fails."""
         # Arrange
         session = mock_session
-        mock_repository, mock_config = mock_jira_client_repository
+        mock_repository, mock_config = mock_configuration_repository
         mock_config.name = 'test_config'
         mock_config.jira_server = 'https://jira.example.com'
         mock_config.jira_email = 'user@example.com'
@@ -143,14 +147,14 @@ class TestJiraClientService:
         self,
         mock_get_current_config_name,
         mock_session,
-        mock_jira_client_repository,
+        mock_configuration_repository,
         mock_jira_client_factory,
         mock_jira_client,
     ):
         """Test getting a client from auth with a valid token."""
         # Arrange
         session = mock_session
-        mock_repository, mock_config = mock_jira_client_repository
+        mock_repository, mock_config = mock_configuration_repository
         mock_request = MagicMock()
         mock_credentials = MagicMock()
         mock_settings = MagicMock()
@@ -187,14 +191,14 @@ class TestJiraClientService:
         self,
         mock_get_current_config_name,
         mock_session,
-        mock_jira_client_repository,
+        mock_configuration_repository,
         mock_jira_client_factory,
         mock_jira_client,
     ):
         """Test getting a client from auth with a query parameter."""
         # Arrange
         session = mock_session
-        mock_repository, mock_config = mock_jira_client_repository
+        mock_repository, mock_config = mock_configuration_repository
         mock_request = MagicMock()
         mock_credentials = MagicMock()
         mock_settings = MagicMock()
@@ -231,13 +235,13 @@ class TestJiraClientService:
         self,
         mock_get_current_config_name,
         mock_session,
-        mock_jira_client_repository,
+        mock_configuration_repository,
         mock_jira_client_factory,
     ):
         """Test getting a client from auth with no config name."""
         # Arrange
         session = mock_session
-        mock_repository, _ = mock_jira_client_repository
+        mock_repository, _ = mock_configuration_repository
         mock_request = MagicMock()
         mock_credentials = MagicMock()
         mock_settings = MagicMock()
@@ -0,0 +1,111 @@
+"""Unit tests for concurrent Jira search paging.
+
+This module contains unit tests for fetch_all_issues.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import jira_calls
+from app.services.jira_paginator import fetch_all_issues
+
+
+class ResultList(list):
+    """List of search results carrying the total number of matches, like the Jira client's."""
+
+    def __init__(self, issues, total):
+        """Initialize the page with its issues and the total number of matches."""
+        super().__init__(issues)
+        self.total = total
+
+
+@pytest.fixture(autouse=True)
+def jira_threads():
+    """Give each test a fresh Jira thread pool."""
+    jira_calls.shutdown_jira_calls()
+    yield
+    jira_calls.shutdown_jira_calls()
+
+
+def jira_with_issues(count, page_cap=100):
+    """Create a Jira client whose search returns pages of numbered issues.
+
+    Args:
+        count: The number of matching issues.
+        page_cap: The most issues Jira returns in one page.
+
+    Returns:
+        MagicMock: A mock Jira client.
+    """
+    jira = MagicMock()
+
+    def search_issues(jql, startAt, maxResults, fields, expand):
+        end = min(startAt + min(maxResults, page_cap), count)
+        return ResultList(range(startAt, end), count)
+
+    jira.search_issues.side_effect = search_issues
+    return jira
+
+
+@pytest.mark.asyncio
+async def test_remaining_pages_are_fetched_in_order():
+    """Test that every page is fetched once and the issues keep Jira's order."""
+    jira = jira_with_issues(250)
+
+    issues = await fetch_all_issues(jira, 'project = TEST', fields=['status'])
+
+    assert issues == list(range(250))
+    starts = sorted(call.kwargs['startAt'] for call in jira.search_issues.call_args_list)
+    assert starts == [0, 100, 200]
+
+
+@pytest.mark.asyncio
+async def test_pages_follow_the_size_jira_returns():
+    """Test that a smaller page size imposed by Jira is used for the remaining pages."""
+    jira = jira_with_issues(120, page_cap=50)
+
+    issues = await fetch_all_issues(jira, 'project = TEST', fields=['status'], expand='changelog')
+
+    assert issues == list(range(120))
+    assert jira.search_issues.call_count == 3
+    assert all(call.kwargs['expand'] == 'changelog' for call in jira.search_issues.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_fetching_stops_at_the_result_limit():
+    """Test that no more issues than the limit are requested."""
+    jira = jira_with_issues(5000)
+
+    issues = await fetch_all_issues(jira, 'project = TEST', fields=['status'], max_results=250)
+
+    assert len(issues) == 250
+    pages = sorted(
+        (call.kwargs['startAt'], call.kwargs['maxResults'])
+        for call in jira.search_issues.call_args_list
+    )
+    assert pages == [(0, 100), (100, 100), (200, 50)]
+
+
+@pytest.mark.asyncio
+async def test_single_page_needs_one_call():
+    """Test that a search fitting in one page is fetched with a single call."""
+    jira = jira_with_issues(3)
+
+    issues = await fetch_all_issues(jira, 'project = TEST', fields=[])
+
+    assert issues == [0, 1, 2]
+    assert jira.search_issues.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_each_call_gets_its_own_field_list():
+    """Test that the caller's field list is not shared with the Jira client, which edits it."""
+    jira = jira_with_issues(250)
+    fields = ['status']
+
+    await fetch_all_issues(jira, 'project = TEST', fields=fields)
+
+    passed = [call.kwargs['fields'] for call in jira.search_issues.call_args_list]
+    assert all(field_list == fields and field_list is not fields for field_list in passed)
+    assert len({id(field_list) for field_list in passed}) == 3
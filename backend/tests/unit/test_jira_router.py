@@ -0,0 +1,317 @@
+"""Unit tests for the Jira router.
+
+This module contains unit tests for the Jira endpoints, calling them directly
+with mocked dependencies.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from jira.exceptions import JIRAError
+
+from app.routers import jira as jira_router
+from app.schemas import JiraCredentials
+from app.services import caching
+from app.services.caching import ShardedCache
+
+
+@pytest.fixture(autouse=True)
+def enabled_cache(monkeypatch):
+    """Enable caching with empty namespaces for the duration of a test.
+
+    Returns:
+        Dict[str, ShardedCache]: The cache dictionary.
+    """
+    monkeypatch.setattr(caching, 'CACHING_ENABLED', True)
+    cache = {
+        'jira_projects': ShardedCache(),
+        'jira_workflows': ShardedCache(),
+        'jira_connections': ShardedCache(),
+    }
+    monkeypatch.setattr(caching, '_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def jira_client():
+    """Create a Jira client with two projects and one issue in progress.
+
+    Returns:
+        MagicMock: A mock Jira client.
+    """
+    client = MagicMock()
+    client.search_issues.return_value = {
+        'startAt': 0,
+        'total': 1,
+        'issues': [
+            {
+                'fields': {
+                    'status': {'name': 'In Progress', 'statusCategory': {'name': 'In Progress'}}
+                }
+            }
+        ],
+    }
+    client.projects.return_value = [
+        SimpleNamespace(key='ONE', name='Project One'),
+        SimpleNamespace(key='TWO', name='Project Two'),
+    ]
+    return client
+
+
+@pytest.fixture
+def jira_client_service(jira_client):
+    """Create a Jira client service that resolves the configuration name it is given.
+
+    Returns:
+        AsyncMock: A mock Jira client service.
+    """
+    service = AsyncMock()
+    service.resolve_config_name.side_effect = (
+        lambda request, credentials, settings, config_name: config_name
+    )
+    service.get_client_by_config_name.return_value = jira_client
+    return service
+
+
+@pytest.fixture
+def jira_client_factory(jira_client):
+    """Create a Jira client factory returning the mock Jira client.
+
+    Returns:
+        AsyncMock: A mock Jira client factory.
+    """
+    factory = AsyncMock()
+    factory.create_client_from_credentials.return_value = jira_client
+    return factory
+
+
+def request(headers=None):
+    """Create a request without the test header.
+
+    Returns:
+        SimpleNamespace: A request with the given headers.
+    """
+    return SimpleNamespace(headers=headers or {})
+
+
+async def get_projects(config_name, jira_client_service, headers=None):
+    """Call get_jira_projects with mocked dependencies.
+
+    Returns:
+        Response: The response returned by the endpoint.
+    """
+    return await jira_router.get_jira_projects(
+        request(headers),
+        config_name=config_name,
+        credentials=None,
+        settings=MagicMock(),
+        jira_client_service=jira_client_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_projects_are_cached_per_configuration(jira_client, jira_client_service):
+    """Test that projects are fetched from Jira once per configuration."""
+    first = await get_projects('config_a', jira_client_service)
+    second = await get_projects('config_a', jira_client_service)
+    await get_projects('config_b', jira_client_service)
+
+    assert orjson.loads(first.body) == [
+        {'key': 'ONE', 'name': 'Project One'},
+        {'key': 'TWO', 'name': 'Project Two'},
+    ]
+    assert second.body == first.body
+    assert jira_client.projects.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unchanged_projects_are_not_modified(jira_client, jira_client_service):
+    """Test that a request with the current entity tag gets an empty 304 response."""
+    first = await get_projects('config_a', jira_client_service)
+    etag = first.headers['etag']
+
+    unchanged = await get_projects('config_a', jira_client_service, {'if-none-match': etag})
+    weak = await get_projects('config_a', jira_client_service, {'if-none-match': f'W/{etag}'})
+    stale = await get_projects('config_a', jira_client_service, {'if-none-match': '"stale"'})
+
+    assert first.status_code == 200
+    assert first.headers['cache-control'] == 'private, no-cache'
+    assert unchanged.status_code == weak.status_code == 304
+    assert unchanged.body == b''
+    assert unchanged.headers['etag'] == etag
+    assert stale.status_code == 200
+    assert stale.body == first.body
+
+
+@pytest.mark.asyncio
+async def test_projects_with_credentials_are_cached_per_api_token(
+    jira_client, jira_client_factory, enabled_cache
+):
+    """Test that cached projects are only shared by identical credentials."""
+    credentials = JiraCredentials(
+        name='new_config',
+        jira_server='https://projects.atlassian.net',
+        jira_email='projects@example.com',
+        jira_api_token='projects-token',
+    )
+    other_token = credentials.model_copy(update={'jira_api_token': 'other-token'})
+
+    first = await jira_router.get_jira_projects_with_credentials(credentials, jira_client_factory)
+    await jira_router.get_jira_projects_with_credentials(credentials, jira_client_factory)
+    await jira_router.get_jira_projects_with_credentials(other_token, jira_client_factory)
+
+    assert orjson.loads(first.body) == [
+        {'key': 'ONE', 'name': 'Project One'},
+        {'key': 'TWO', 'name': 'Project Two'},
+    ]
+    assert jira_client.projects.call_count == 2
+    assert not any(
+        'projects-token' in key for shard in enabled_cache['jira_projects'].shards for key in shard
+    )
+
+
+@pytest.mark.asyncio
+async def test_workflows_are_cached_per_configuration_and_project(jira_client, jira_client_service):
+    """Test that workflow statuses are extracted once per configuration and project."""
+
+    async def get_workflows(config_name, project_key):
+        return await jira_router.get_jira_workflows(
+            request(),
+            project_key,
+            config_name=config_name,
+            credentials=None,
+            settings=MagicMock(),
+            jira_client_service=jira_client_service,
+        )
+
+    first = await get_workflows('config_a', 'ONE')
+    second = await get_workflows('config_a', 'ONE')
+    await get_workflows('config_a', 'TWO')
+    await get_workflows('config_b', 'ONE')
+
+    statuses = [{'id': '', 'name': 'In Progress', 'category': 'In Progress'}]
+    assert orjson.loads(first.body) == orjson.loads(second.body) == statuses
+    assert jira_client.search_issues.call_count == 3
+
+
+async def validate(jira_client_service, config_name):
+    """Validate the connection of a stored configuration.
+
+    Returns:
+        dict: The validation response.
+    """
+    return await jira_router.validate_connection(
+        request(),
+        config_name=config_name,
+        credentials=None,
+        settings=MagicMock(),
+        jira_client_service=jira_client_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connection_checks_share_one_call(jira_client, jira_client_service):
+    """Test that simultaneous validations of a configuration call Jira once."""
+    results = await asyncio.gather(*(validate(jira_client_service, 'config_a') for _ in range(3)))
+
+    assert all(result['status'] == 'success' for result in results)
+    assert jira_client.myself.call_count == 1
+    assert not caching._inflight
+
+
+@pytest.mark.asyncio
+async def test_recent_connection_check_is_reused(jira_client, jira_client_service, enabled_cache):
+    """Test that a recently validated configuration is not checked again until cleared."""
+    await validate(jira_client_service, 'config_a')
+    await validate(jira_client_service, 'config_a')
+    assert jira_client.myself.call_count == 1
+
+    await validate(jira_client_service, 'config_b')
+    assert jira_client.myself.call_count == 2
+
+    enabled_cache['jira_connections'].clear()
+    await validate(jira_client_service, 'config_a')
+    assert jira_client.myself.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_check_is_not_remembered(jira_client, jira_client_service):
+    """Test that a failed validation calls Jira again on the next request."""
+    jira_client.myself.side_effect = JIRAError(status_code=401, text='Unauthorized')
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            await validate(jira_client_service, 'config_a')
+
+    assert jira_client.myself.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_workflows_require_a_project_key(jira_client_service, jira_client_factory):
+    """Test that both workflow endpoints reject an empty project key."""
+    credentials = JiraCredentials(
+        name='new_config',
+        jira_server='https://workflows.atlassian.net',
+        jira_email='workflows@example.com',
+        jira_api_token='workflows-token',
+    )
+
+    with pytest.raises(HTTPException) as stored:
+        await jira_router.get_jira_workflows(
+            request(),
+            '',
+            config_name='config_a',
+            credentials=None,
+            settings=MagicMock(),
+            jira_client_service=jira_client_service,
+        )
+    with pytest.raises(HTTPException) as direct:
+        await jira_router.get_jira_workflows_with_credentials(credentials, '', jira_client_factory)
+
+    assert stored.value.status_code == direct.value.status_code == 400
+    assert stored.value.detail == direct.value.detail == 'Project key is required'
+
+
+@pytest.mark.asyncio
+async def test_workflows_with_credentials_use_a_client_for_them(jira_client_factory):
+    """Test that workflow statuses are extracted with a client for the given credentials."""
+    credentials = JiraCredentials(
+        name='new_config',
+        jira_server='https://workflows.atlassian.net',
+        jira_email='workflows@example.com',
+        jira_api_token='workflows-token',
+    )
+
+    response = await jira_router.get_jira_workflows_with_credentials(
+        credentials, 'ONE', jira_client_factory
+    )
+
+    assert orjson.loads(response.body) == [
+        {'id': '', 'name': 'In Progress', 'category': 'In Progress'}
+    ]
+    jira_client_factory.create_client_from_credentials.assert_called_once_with(
+        jira_server=credentials.jira_server,
+        jira_email=credentials.jira_email,
+        jira_api_token=credentials.jira_api_token,
+        config_name=credentials.name,
+    )
+
+
+@pytest.mark.asyncio
+async def test_jira_errors_are_reported_without_a_traceback(
+    jira_client, jira_client_service, caplog
+):
+    """Test that Jira rejecting a request becomes a 500 error logged without a traceback."""
+    jira_client.projects.side_effect = JIRAError(status_code=401, text='Unauthorized')
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_projects('config_a', jira_client_service)
+
+    assert exc_info.value.status_code == 500
+    assert 'Unauthorized' in exc_info.value.detail
+    record = next(r for r in caplog.records if r.levelname == 'ERROR')
+    assert record.exc_info is None
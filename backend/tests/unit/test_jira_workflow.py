@@ -0,0 +1,121 @@
+"""Unit tests for workflow status extraction.
+
+This module contains unit tests for extract_workflow_statuses.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.jira_workflow import MAX_ISSUES, _workflow_jql, extract_workflow_statuses
+
+
+def status(name, category):
+    """Create a Jira status resource.
+
+    Returns:
+        SimpleNamespace: A status with a name and its raw JSON, including the status category.
+    """
+    return SimpleNamespace(name=name, raw={'name': name, 'statusCategory': {'name': category}})
+
+
+def issue(name, category):
+    """Create a raw Jira issue in a status, as returned in JSON search results.
+
+    Returns:
+        dict: An issue with the given status.
+    """
+    return {'fields': {'status': {'name': name, 'statusCategory': {'name': category}}}}
+
+
+def search_result(issues, start_at=0, total=None):
+    """Create a raw Jira search result page.
+
+    Returns:
+        dict: The search result with the given issues.
+    """
+    return {
+        'startAt': start_at,
+        'total': len(issues) if total is None else total,
+        'issues': issues,
+    }
+
+
+@pytest.mark.asyncio
+async def test_statuses_are_deduplicated_case_insensitively():
+    """Test that each status is reported once, with the casing it was first seen in."""
+    jira = MagicMock()
+    jira.search_issues.return_value = search_result(
+        [
+            issue('To Do', 'To Do'),
+            issue('In Progress', 'In Progress'),
+            issue('in progress', 'In Progress'),
+            issue('Done', 'Done'),
+        ]
+    )
+
+    result = await extract_workflow_statuses(jira, 'TEST')
+
+    assert result == [
+        {'id': '', 'name': 'To Do', 'category': 'To Do'},
+        {'id': '', 'name': 'In Progress', 'category': 'In Progress'},
+        {'id': '', 'name': 'Done', 'category': 'Done'},
+    ]
+    jira.statuses.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_project_statuses_are_used_without_issues():
+    """Test that the statuses defined in Jira are used when no issues are found."""
+    jira = MagicMock()
+    jira.search_issues.return_value = search_result([])
+    jira.statuses.return_value = [status('Backlog', 'To Do'), status('Done', 'Done')]
+
+    result = await extract_workflow_statuses(jira, 'TEST')
+
+    assert result == [
+        {'id': '', 'name': 'Backlog', 'category': 'To Do'},
+        {'id': '', 'name': 'Done', 'category': 'Done'},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_issues_are_fetched_in_pages_of_the_size_jira_returns():
+    """Test that the remaining pages are fetched after the first, in order, up to the limit."""
+    # A project with more matching issues than are scanned, in pages of 50
+    names = [f'Status {index // 50}' for index in range(MAX_ISSUES + 200)]
+
+    def search_issues(jql, startAt, maxResults, **kwargs):
+        page = names[startAt : startAt + min(maxResults, 50)]
+        return search_result([issue(name, '') for name in page], startAt, total=len(names))
+
+    jira = MagicMock()
+    jira.search_issues.side_effect = search_issues
+
+    result = await extract_workflow_statuses(jira, 'TEST')
+
+    assert [status['name'] for status in result] == [f'Status {page}' for page in range(20)]
+    start_ats = sorted(call.kwargs['startAt'] for call in jira.search_issues.call_args_list)
+    assert start_ats == list(range(0, MAX_ISSUES, 50))
+
+
+def test_workflow_jql_is_stable_for_a_week():
+    """Test that the JQL window starts on a Monday, so the query is the same all week."""
+    with patch('app.services.jira_workflow.date') as mock_date:
+        mock_date.today.return_value = date(2024, 7, 8)
+        monday = _workflow_jql('PROJ')
+        mock_date.today.return_value = date(2024, 7, 14)
+        sunday = _workflow_jql('PROJ')
+
+    assert monday == sunday == 'project = "PROJ" AND updated >= 2024-01-08'
+    window_start = date.fromisoformat(monday.rsplit(' ', 1)[1])
+    assert window_start.weekday() == 0
+
+
+def test_workflow_jql_quotes_the_project_key():
+    """Test that a project key cannot change the rest of the query."""
+    jql = _workflow_jql('PROJ" OR project = "OTHER')
+
+    assert jql.startswith('project = "PROJ\\" OR project = \\"OTHER" AND updated >= ')
@@ -0,0 +1,62 @@
+"""Unit tests for the JQL validator.
+
+This module contains unit tests for validate_jql_query.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import jql_validator
+from app.services.jql_validator import validate_jql_query
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start each test without remembered queries."""
+    jql_validator._validate_non_empty_jql.cache_clear()
+    yield
+    jql_validator._validate_non_empty_jql.cache_clear()
+
+
+@pytest.mark.parametrize(
+    'jql',
+    [
+        'project = TEST; DROP TABLE issues',
+        "summary ~ 'x' union select password",
+        "assignee = '' OR '1'='1'",
+        'update issues set status = Done',
+        'project = ',
+    ],
+)
+def test_invalid_queries_are_rejected(jql):
+    """Test that injection attempts and incomplete expressions are rejected with 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        validate_jql_query(jql)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_valid_queries_are_checked_once():
+    """Test that a repeated valid query is answered from the cache."""
+    jql = 'project = TEST AND status = "In Progress"'
+
+    assert validate_jql_query(jql) == jql
+    assert validate_jql_query(jql) == jql
+
+    cache_info = jql_validator._validate_non_empty_jql.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+
+def test_rejected_queries_are_checked_every_time():
+    """Test that rejected queries are not cached, so every attempt is rejected and logged."""
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            validate_jql_query('project = ')
+
+    assert jql_validator._validate_non_empty_jql.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize('jql', ['', '   '])
+def test_empty_queries_are_returned_unchanged(jql):
+    """Test that empty queries pass through for the metrics calculation to handle."""
+    assert validate_jql_query(jql) == jql
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 
 import pytest
 
+from app import metrics
 from app.metrics import (
     calculate_cfd,
     calculate_cycle_time,
@@ -226,6 +227,27 @@ class TestCycleTimeCalculation:
         assert result['start_state'] == 'Development'
         assert result['end_state'] == 'Testing'
 
+    def test_calculate_cycle_time_only_parses_relevant_transitions(
+        self, mock_jira_issue_factory, mock_jira_changelog_factory
+    ):
+        """Test that histories not entering the start or end state are not date-parsed."""
+        today = datetime.now()
+
+        issue = mock_jira_issue_factory(today - timedelta(days=10), today, 'Done')
+        issue.changelog = mock_jira_changelog_factory(
+            [
+                (today - timedelta(days=8), 'Backlog', 'In Progress'),
+                (today - timedelta(days=5), 'In Progress', 'Review'),
+                (today - timedelta(days=2), 'Review', 'Done'),
+            ]
+        )
+        issue.changelog.histories[1].created = 'invalid-date'
+
+        result = calculate_cycle_time([issue], 'In Progress', 'Done')
+
+        assert result['data'] == [6]
+        assert result['average'] == result['median'] == result['min'] == result['max'] == 6
+
 
 class TestThroughputCalculation:
     """Tests for the throughput calculation function."""
@@ -432,3 +454,28 @@ class TestCfdCalculation:
         # Verify the structure is correct
         assert all(isinstance(day, dict) for day in result['data'])
         assert all(all(isinstance(count, int) for count in day.values()) for day in result['data'])
+
+    def test_calculate_cfd_counts_each_day(self, mock_jira_issue_factory, monkeypatch):
+        """Test the daily counts, parsing each issue's dates only once for the whole period."""
+        today = datetime.now()
+        issues = [
+            mock_jira_issue_factory(today - timedelta(days=10), None, 'Backlog'),
+            mock_jira_issue_factory(today - timedelta(days=5), today - timedelta(days=2), 'Done'),
+            # A status outside the workflow states counts as the first non-Done state
+            mock_jira_issue_factory(today - timedelta(days=3), None, 'Blocked'),
+        ]
+        parsed = []
+
+        def parse(date_str):
+            parsed.append(date_str)
+            return parse_jira_datetime(date_str)
+
+        monkeypatch.setattr(metrics, 'parse_jira_datetime', parse)
+
+        result = calculate_cfd(issues, ['Backlog', 'In Progress', 'Done'], period_days=10)
+
+        assert len(parsed) == 4
+        assert result['data'][0] == {'Backlog': 1, 'In Progress': 0, 'Done': 0}
+        assert result['data'][3] == {'Backlog': 1, 'In Progress': 0, 'Done': 0}
+        assert result['data'][4] == {'Backlog': 1, 'In Progress': 0, 'Done': 1}
+        assert result['data'][-1] == {'Backlog': 2, 'In Progress': 0, 'Done': 1}
@@ -0,0 +1,189 @@
+"""Unit tests for the metrics router.
+
+This module contains unit tests for the metrics endpoints, calling them directly
+with mocked dependencies.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+
+from app.services import caching, jira_paginator
+
+
+@pytest.fixture(autouse=True)
+def disabled_cache(monkeypatch):
+    """Disable caching so every call reaches Jira."""
+    monkeypatch.setattr(caching, 'CACHING_ENABLED', False)
+
+
+@pytest.fixture
+def metrics_router():
+    """Import the metrics router once the test settings are in place.
+
+    The router binds get_settings when it is imported, so importing it while the
+    tests are collected would bypass the patched settings other tests rely on.
+
+    Returns:
+        module: The metrics router module.
+    """
+    from app.routers import metrics
+
+    return metrics
+
+
+@pytest.fixture
+def jira_client():
+    """Create a Jira client whose search records the thread it runs in.
+
+    Returns:
+        MagicMock: A mock Jira client.
+    """
+    client = MagicMock()
+    client.threads = []
+
+    def search_issues(*args, **kwargs):
+        client.threads.append(threading.current_thread().name)
+        return []
+
+    client.search_issues.side_effect = search_issues
+    return client
+
+
+@pytest.fixture
+def jira_client_service(jira_client):
+    """Create a Jira client service returning the mock client.
+
+    Returns:
+        AsyncMock: A mock Jira client service.
+    """
+    service = AsyncMock()
+    service.get_client_from_auth.return_value = jira_client
+    return service
+
+
+async def get_wip(metrics_router, jira_client_service):
+    """Call get_wip with mocked dependencies.
+
+    Returns:
+        ORJSONResponse: The WIP data returned by the endpoint.
+    """
+    return await metrics_router.get_wip(
+        jql='project = TEST',
+        request=SimpleNamespace(headers={}),
+        config_name='config_a',
+        credentials=None,
+        settings=SimpleNamespace(workflow_states=['To Do', 'Done']),
+        jira_client_service=jira_client_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_issues_are_searched_off_the_event_loop(
+    metrics_router, jira_client, jira_client_service
+):
+    """Test that the blocking issue search runs in a Jira worker thread."""
+    await get_wip(metrics_router, jira_client_service)
+
+    assert len(jira_client.threads) == 1
+    assert jira_client.threads[0].startswith('jira')
+
+
+@pytest.mark.asyncio
+async def test_busy_jira_is_not_reported_as_a_jira_error(
+    monkeypatch, metrics_router, jira_client, jira_client_service
+):
+    """Test that the 503 raised when no Jira slot is free reaches the client unchanged."""
+    busy = HTTPException(status_code=503, detail='Too many concurrent Jira requests')
+    monkeypatch.setattr(jira_paginator, 'run_jira_call', AsyncMock(side_effect=busy))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_wip(metrics_router, jira_client_service)
+
+    assert exc_info.value.status_code == 503
+
+
+def test_cache_key_depends_on_the_caller(metrics_router):
+    """Test that cached metrics are only shared by callers of the same configuration."""
+    key_func = metrics_router._metric_cache_key('wip')
+
+    def key(config_name=None, cookie=None, bearer=None):
+        return key_func(
+            jql='project = TEST',
+            request=SimpleNamespace(headers={}, cookies={'jira_token': cookie} if cookie else {}),
+            config_name=config_name,
+            credentials=SimpleNamespace(credentials=bearer) if bearer else None,
+        )
+
+    assert key(cookie='token-a') == key(cookie='token-a')
+    assert key(cookie='token-a') != key(cookie='token-b')
+    assert key(bearer='token-a') == key(cookie='token-a')
+    assert key(config_name='config_a') != key(config_name='config_b')
+    assert key(cookie='token-a').startswith('wip:')
+    assert 'token-a' not in key(cookie='token-a')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'data, expected',
+    [
+        (
+            [{'To Do': 2, 'Done': 0}, {'To Do': 1, 'Done': 1}],
+            {
+                'statuses': ['To Do', 'Done'],
+                'data': [
+                    {'date': '2024-01-01', 'To Do': 2, 'Done': 0},
+                    {'date': '2024-01-02', 'To Do': 1, 'Done': 1},
+                ],
+            },
+        ),
+        ([], {'statuses': [], 'data': [{'date': '2024-01-01'}, {'date': '2024-01-02'}]}),
+    ],
+)
+async def test_cfd_data_points_put_the_date_before_the_counts(
+    monkeypatch, metrics_router, jira_client_service, data, expected
+):
+    """Test that each CFD data point holds its date followed by that day's status counts."""
+    result = {'dates': ['2024-01-01', '2024-01-02'], 'data': data}
+    monkeypatch.setattr(metrics_router, 'calculate_cfd', lambda *args: result)
+
+    response = await metrics_router.get_cfd(
+        jql='project = TEST',
+        request=SimpleNamespace(headers={}),
+        config_name='config_a',
+        credentials=None,
+        settings=SimpleNamespace(workflow_states=['To Do', 'Done']),
+        jira_client_service=jira_client_service,
+    )
+
+    assert isinstance(response, ORJSONResponse)
+    body = orjson.loads(response.body)
+    assert body == expected
+    assert all(list(point)[0] == 'date' for point in body['data'])
+
+
+@pytest.mark.asyncio
+async def test_cycle_time_reports_its_states_when_it_cannot_be_measured(
+    metrics_router, jira_client, jira_client_service
+):
+    """Test that cycle time names its start and end states even without valid issues."""
+    response = await metrics_router.get_cycle_time(
+        jql='project = TEST',
+        request=SimpleNamespace(headers={}),
+        config_name='config_a',
+        credentials=None,
+        settings=SimpleNamespace(cycle_time_start_state='Doing', cycle_time_end_state='Shipped'),
+        jira_client_service=jira_client_service,
+    )
+
+    assert orjson.loads(response.body) == {
+        'error': 'No issues with valid cycle times found',
+        'start_state': 'Doing',
+        'end_state': 'Shipped',
+    }
+    assert jira_client.search_issues.call_args.kwargs['expand'] == 'changelog'
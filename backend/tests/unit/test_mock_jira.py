@@ -28,6 +28,30 @@ class TestMockJira:
         # Verify that sample data setup was called
         mock_setup_sample_data.assert_called_once()
 
+    def test_sample_data_is_shared_between_instances(self):
+        """Test that sample data is built once and reused by later clients."""
+        first = MockJira()
+        second = MockJira()
+
+        assert second.sample_issues is first.sample_issues
+        assert second.sample_changelogs is first.sample_changelogs
+        assert len(second.sample_issues) == 7
+
+    def test_sample_data_is_rebuilt_on_a_new_day(self):
+        """Test that stale sample data from a previous day is not reused."""
+        first = MockJira()
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+        MockJira._shared_sample_data = (
+            yesterday,
+            first.sample_changelogs,
+            first.sample_issues,
+        )
+
+        second = MockJira()
+
+        assert second.sample_issues is not first.sample_issues
+        assert MockJira._shared_sample_data[0] == datetime.date.today()
+
     @patch('app.mock_jira.MockJira._setup_sample_data')
     def test_create_mock_issue(self, mock_setup_sample_data):
         """Test creation of mock issues."""
@@ -132,6 +156,21 @@ class TestMockJira:
         issues = client.search_issues(jql='project = TEST', fields=['summary', 'status'])
         assert len(issues) > 0
 
+    def test_search_issues_json_result(self):
+        """Test that raw search results page through the issues with their statuses."""
+        client = MockJira()
+
+        result = client.search_issues(
+            jql='project = PROJ', startAt=5, maxResults=10, json_result=True
+        )
+
+        assert result['startAt'] == 5
+        assert result['total'] == len(client.sample_issues)
+        assert result['issues'] == [
+            {'key': 'PROJ-6', 'fields': {'status': {'name': 'Backlog'}}},
+            {'key': 'PROJ-7', 'fields': {'status': {'name': 'Backlog'}}},
+        ]
+
 
 class TestGetMockJiraClient:
     """Tests for the get_mock_jira_client function."""
@@ -3,7 +3,9 @@
 This module contains unit tests for the SQLAlchemy models.
 """
 
-from app.models import Base, JiraConfiguration
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models import Base, JiraConfiguration, MetricsAnalysis
 
 
 class TestModels:
@@ -66,6 +68,29 @@ class TestModels:
         assert not columns['cycle_time_start_state'].nullable
         assert not columns['cycle_time_end_state'].nullable
 
+    def test_metrics_analysis_date_range_index(self):
+        """Test that metrics analyses are indexed by configuration and date range."""
+        indexes = {idx.name: idx for idx in MetricsAnalysis.__table__.indexes}
+
+        assert 'ix_metrics_config_dates' in indexes
+        assert [col.name for col in indexes['ix_metrics_config_dates'].columns] == [
+            'configuration_id',
+            'start_date',
+            'end_date',
+        ]
+
+    def test_json_columns_use_jsonb_on_postgresql(self):
+        """Test that JSON columns are stored as JSONB on PostgreSQL only."""
+        postgres = postgresql.dialect()
+        sqlite_dialect = sqlite.dialect()
+
+        for column in [
+            JiraConfiguration.__table__.c.workflow_states,
+            MetricsAnalysis.__table__.c.metrics_data,
+        ]:
+            assert column.type.compile(dialect=postgres) == 'JSONB'
+            assert column.type.compile(dialect=sqlite_dialect) == 'JSON'
+
     def test_jira_configuration_instance(self):
         """Test creating a JiraConfiguration instance."""
         # Create a JiraConfiguration instance
@@ -0,0 +1,256 @@
+"""Unit tests for the rate limiting middleware.
+
+This module contains unit tests for the RateLimiter middleware.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.rate_limiter import RateLimiter
+
+
+@contextmanager
+def frozen_time(now):
+    """Freeze the clock seen by the rate limiter.
+
+    Args:
+        now: The time in seconds the rate limiter should observe.
+    """
+    with patch('app.middleware.rate_limiter.time') as mock_time:
+        mock_time.monotonic.return_value = now
+        mock_time.time.return_value = now
+        yield
+
+
+class FakeRedis:
+    """Minimal stand-in for the Redis commands used by the rate limiter."""
+
+    def __init__(self):
+        """Initialize the fake Redis with no keys."""
+        self.counters = {}
+        self.expiries = {}
+
+    async def incr(self, key):
+        """Increment the counter stored at key."""
+        self.counters[key] = self.counters.get(key, 0) + 1
+        return self.counters[key]
+
+    async def expire(self, key, seconds):
+        """Record the expiry set on key."""
+        self.expiries[key] = seconds
+
+
+@pytest.fixture
+def rate_limited_client(monkeypatch):
+    """Create a test client for an app protected by a small rate limit.
+
+    Returns:
+        function: A factory that builds a TestClient for the given limit and window.
+    """
+    monkeypatch.delenv('USE_MOCK_JIRA', raising=False)
+
+    def _create_client(limit=3, window=60, exempt_paths=None, max_clients=10000, redis=None):
+        app = FastAPI()
+        app.add_middleware(
+            RateLimiter,
+            limit=limit,
+            window=window,
+            exempt_paths=exempt_paths or ['/ping'],
+            max_clients=max_clients,
+            redis=redis,
+        )
+
+        @app.get('/ping')
+        async def ping():
+            return {'ping': 'pong'}
+
+        @app.get('/data')
+        async def data():
+            return {'data': 'ok'}
+
+        @app.get('/data/{item}')
+        async def data_item(item: str):
+            return {'data': item}
+
+        return TestClient(app)
+
+    return _create_client
+
+
+def test_requests_within_limit_are_allowed(rate_limited_client):
+    """Test that requests under the limit are passed through."""
+    client = rate_limited_client(limit=3)
+
+    with frozen_time(6000.0):
+        responses = [client.get('/data') for _ in range(3)]
+
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_requests_over_limit_are_rejected(rate_limited_client):
+    """Test that requests over the limit receive a 429 response."""
+    client = rate_limited_client(limit=3, window=60)
+
+    with frozen_time(6000.0):
+        for _ in range(3):
+            client.get('/data')
+        response = client.get('/data')
+
+    # One token is refilled every 20 seconds
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '20'
+
+
+def test_exempt_paths_are_not_limited(rate_limited_client):
+    """Test that exempt paths are never rate limited."""
+    client = rate_limited_client(limit=1)
+
+    with frozen_time(6000.0):
+        responses = [client.get('/ping') for _ in range(5)]
+
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_exempt_paths_match_exactly_unless_marked_as_prefix(rate_limited_client):
+    """Test that only paths ending in a slash or star exempt their sub-paths."""
+    exact_client = rate_limited_client(limit=1, exempt_paths=['/data'])
+    prefix_client = rate_limited_client(limit=1, exempt_paths=['/data/*'])
+
+    with frozen_time(6000.0):
+        exact = [exact_client.get('/data') for _ in range(2)]
+        sub_paths = [exact_client.get('/data/item') for _ in range(2)]
+        prefixed = [prefix_client.get('/data/item') for _ in range(3)]
+
+    assert all(response.status_code == 200 for response in exact)
+    assert [response.status_code for response in sub_paths] == [200, 429]
+    assert all(response.status_code == 200 for response in prefixed)
+
+
+def test_limit_is_tracked_per_client_ip(rate_limited_client):
+    """Test that each forwarded client IP gets its own allowance."""
+    client = rate_limited_client(limit=1)
+
+    with frozen_time(6000.0):
+        first = client.get('/data', headers={'X-Forwarded-For': '10.0.0.1'})
+        second = client.get('/data', headers={'X-Forwarded-For': '10.0.0.2, 10.0.0.254'})
+        third = client.get('/data', headers={'X-Forwarded-For': '10.0.0.1'})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert third.status_code == 429
+
+
+def test_tokens_refill_over_time(rate_limited_client):
+    """Test that a drained bucket regains tokens at the configured rate."""
+    client = rate_limited_client(limit=4, window=60)
+
+    # Drain the bucket
+    with frozen_time(6000.0):
+        for _ in range(4):
+            client.get('/data')
+        assert client.get('/data').status_code == 429
+
+    # Four tokens per minute means one token after 15 seconds
+    with frozen_time(6015.0):
+        allowed = client.get('/data')
+        rejected = client.get('/data')
+
+    assert allowed.status_code == 200
+    assert rejected.status_code == 429
+
+
+def test_bucket_refill_is_capped_at_limit(rate_limited_client):
+    """Test that an idle client cannot accumulate more than the limit."""
+    client = rate_limited_client(limit=2, window=60)
+
+    with frozen_time(6000.0):
+        client.get('/data')
+
+    with frozen_time(9000.0):
+        responses = [client.get('/data') for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 429]
+
+
+def test_idle_buckets_are_evicted(monkeypatch):
+    """Test that buckets idle for a whole window are dropped and active ones kept."""
+    monkeypatch.delenv('USE_MOCK_JIRA', raising=False)
+    limiter = RateLimiter(FastAPI(), limit=10, window=60)
+    limiter.buckets['10.0.0.1'] = [10.0, 6000.0]
+    limiter.buckets['10.0.0.2'] = [3.0, 6030.0]
+
+    limiter._evict_idle_buckets(6060.0)
+
+    assert '10.0.0.1' not in limiter.buckets
+    assert limiter.buckets['10.0.0.2'] == [3.0, 6030.0]
+
+
+def test_buckets_are_ordered_by_activity(rate_limited_client):
+    """Test that the most recently active client is kept at the end of the buckets."""
+    client = rate_limited_client(limit=10)
+
+    with frozen_time(6000.0):
+        client.get('/data', headers={'X-Forwarded-For': '10.0.0.1'})
+        client.get('/data', headers={'X-Forwarded-For': '10.0.0.2'})
+        client.get('/data', headers={'X-Forwarded-For': '10.0.0.1'})
+
+    limiter = client.app.middleware_stack.app
+    assert list(limiter.buckets) == ['10.0.0.2', '10.0.0.1']
+
+
+def test_least_recently_active_client_is_dropped_at_capacity(rate_limited_client):
+    """Test that the number of tracked clients is capped."""
+    client = rate_limited_client(limit=10, max_clients=2)
+
+    with frozen_time(6000.0):
+        for ip in ['10.0.0.1', '10.0.0.2', '10.0.0.1', '10.0.0.3']:
+            client.get('/data', headers={'X-Forwarded-For': ip})
+
+    limiter = client.app.middleware_stack.app
+    assert list(limiter.buckets) == ['10.0.0.1', '10.0.0.3']
+
+
+def test_shared_limit_applies_across_workers(rate_limited_client):
+    """Test that workers sharing a Redis client share one allowance per client."""
+    redis = FakeRedis()
+    first_worker = rate_limited_client(limit=2, window=60, redis=redis)
+    second_worker = rate_limited_client(limit=2, window=60, redis=redis)
+
+    with frozen_time(6015.0):
+        responses = [
+            first_worker.get('/data'),
+            second_worker.get('/data'),
+            first_worker.get('/data'),
+        ]
+
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert responses[2].headers['Retry-After'] == '45'
+    assert redis.expiries == {'rl:testclient:100': 60}
+
+
+def test_shared_limit_resets_in_next_window(rate_limited_client):
+    """Test that the shared counter starts over in a new window."""
+    client = rate_limited_client(limit=1, window=60, redis=FakeRedis())
+
+    with frozen_time(6000.0):
+        client.get('/data')
+        assert client.get('/data').status_code == 429
+
+    with frozen_time(6060.0):
+        assert client.get('/data').status_code == 200
+
+
+def test_local_limit_is_used_when_redis_fails(rate_limited_client):
+    """Test that requests are still limited in memory if Redis is unavailable."""
+    redis = FakeRedis()
+    redis.incr = AsyncMock(side_effect=ConnectionError('Redis is down'))
+    client = rate_limited_client(limit=1, window=60, redis=redis)
+
+    with frozen_time(6000.0):
+        responses = [client.get('/data') for _ in range(2)]
+
+    assert [response.status_code for response in responses] == [200, 429]